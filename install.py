@@ -9,69 +9,95 @@ Usage:
     python install.py
 """
 
+import functools
 import json
 import os
 import platform
+import re
+import shutil
+import site
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import NamedTuple, Optional, Tuple
 
 
-class Colors:
-    """ANSI color codes for terminal output."""
+class ColorCodes(NamedTuple):
+    """ANSI color codes for terminal output (empty strings if unsupported)."""
     
-    # Check if we're on Windows and if ANSI is supported
-    WINDOWS = platform.system() == "Windows"
+    GREEN: str
+    YELLOW: str
+    RED: str
+    BLUE: str
+    BOLD: str
+    RESET: str
+
+
+@functools.lru_cache(maxsize=None)
+def _codes() -> ColorCodes:
+    """Return the color codes to use, detecting ANSI support on first call.
     
-    if WINDOWS:
+    On Windows this enables virtual terminal processing through ctypes, so
+    the detection is deferred until colored output is actually printed
+    rather than done at import time.
+    
+    Returns:
+        The ANSI escape codes, or empty strings if ANSI is not supported.
+    """
+    enabled = True
+    if platform.system() == "Windows":
         # Enable ANSI colors on Windows 10+
         try:
             import ctypes
             kernel32 = ctypes.windll.kernel32
             kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-            ENABLED = True
         except Exception:
-            ENABLED = False
-    else:
-        ENABLED = True
-    
-    if ENABLED:
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        BLUE = '\033[94m'
-        BOLD = '\033[1m'
-        RESET = '\033[0m'
-    else:
-        GREEN = YELLOW = RED = BLUE = BOLD = RESET = ''
+            enabled = False
+    
+    if enabled:
+        return ColorCodes(
+            GREEN='\033[92m',
+            YELLOW='\033[93m',
+            RED='\033[91m',
+            BLUE='\033[94m',
+            BOLD='\033[1m',
+            RESET='\033[0m',
+        )
+    return ColorCodes('', '', '', '', '', '')
 
 
 def print_header(text: str) -> None:
     """Print a formatted header."""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.RESET}\n")
+    c = _codes()
+    print(f"\n{c.BOLD}{c.BLUE}{'=' * 60}{c.RESET}")
+    print(f"{c.BOLD}{c.BLUE}{text}{c.RESET}")
+    print(f"{c.BOLD}{c.BLUE}{'=' * 60}{c.RESET}\n")
 
 
 def print_success(text: str) -> None:
     """Print a success message."""
-    print(f"{Colors.GREEN}✓ {text}{Colors.RESET}")
+    c = _codes()
+    print(f"{c.GREEN}✓ {text}{c.RESET}")
 
 
 def print_warning(text: str) -> None:
     """Print a warning message."""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.RESET}")
+    c = _codes()
+    print(f"{c.YELLOW}⚠ {text}{c.RESET}")
 
 
 def print_error(text: str) -> None:
     """Print an error message."""
-    print(f"{Colors.RED}✗ {text}{Colors.RESET}")
+    c = _codes()
+    print(f"{c.RED}✗ {text}{c.RESET}")
 
 
 def print_info(text: str) -> None:
     """Print an info message."""
-    print(f"{Colors.BLUE}ℹ {text}{Colors.RESET}")
+    c = _codes()
+    print(f"{c.BLUE}ℹ {text}{c.RESET}")
 
 
 def get_system_info() -> Tuple[str, str]:
@@ -110,87 +136,149 @@ def get_pip_command() -> list:
     return [sys.executable, "-m", "pip"]
 
 
-def install_package() -> Tuple[bool, bool]:
+def _read_install_report(report_path: Path) -> Optional[dict]:
+    """Read the JSON document written by ``pip install --report``.
+    
+    Args:
+        report_path: File pip was asked to write the report to.
+        
+    Returns:
+        The parsed report, or None if it is missing or not a valid report.
+    """
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return report if isinstance(report, dict) else None
+
+
+def _scripts_dir_from_warning(output: str) -> Optional[Path]:
+    """Extract the Scripts directory named in pip's PATH warning.
+    
+    pip reports e.g. ``The script aicheckin is installed in '<dir>' which
+    is not on PATH``, which is exactly the directory we need to add.
+    
+    Args:
+        output: Output of the pip install command.
+        
+    Returns:
+        Path to the Scripts directory or None if no warning was found.
+    """
+    match = re.search(r"installed in '([^']+)' which is not on PATH", output)
+    return Path(match.group(1)) if match else None
+
+
+def _run_pip_install(args: list, cwd: Path) -> Tuple[int, str]:
+    """Run ``pip install`` and echo its output as it is produced.
+    
+    stdout and stderr are merged and streamed line by line, so progress is
+    visible while pip runs and its output is never buffered as a whole.
+    
+    Args:
+        args: Arguments following ``pip install``.
+        cwd: Working directory for pip.
+        
+    Returns:
+        Tuple of (returncode, notices) where notices holds the output lines
+        the installer acts on: PATH warnings and unknown-option errors.
+    """
+    notices = []
+    process = subprocess.Popen(
+        get_pip_command() + ["install"] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    with process:
+        for line in process.stdout:
+            print(line, end="")
+            if "is not on PATH" in line or "no such option" in line:
+                notices.append(line)
+    return process.returncode, "".join(notices)
+
+
+def install_package() -> Tuple[bool, bool, Optional[Path]]:
     """Install the package using pip in editable mode.
     
+    pip is asked for an installation report (``--report``, pip 22.2+) so
+    that the installed distribution can be confirmed from the same process
+    instead of running ``pip show`` afterwards. Older pip versions that do
+    not know the option are retried with a plain install.
+    
     Returns:
-        Tuple of (success, path_warning) where:
+        Tuple of (success, path_warning, scripts_dir) where:
         - success: True if installation succeeded
         - path_warning: True if there was a PATH warning
+        - scripts_dir: Scripts directory named in the PATH warning, if any
     """
     print_info("Installing aicheckin package in editable mode...")
     
     project_dir = Path(__file__).parent
-    pip_cmd = get_pip_command()
     
-    try:
+    with tempfile.TemporaryDirectory() as report_dir:
+        report_path = Path(report_dir) / "report.json"
         # Install in editable mode
-        result = subprocess.run(
-            pip_cmd + ["install", "-e", "."],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True
+        returncode, notices = _run_pip_install(
+            ["--report", str(report_path), "-e", "."], project_dir
         )
-        
+        if returncode != 0 and "--report" in notices:
+            # pip older than 22.2 does not support --report
+            returncode, notices = _run_pip_install(["-e", "."], project_dir)
+        report = _read_install_report(report_path)
+    
+    if returncode != 0:
+        print_error(f"Failed to install package (pip exited with code {returncode})")
+        return False, False, None
+    
+    installed = [
+        item.get("metadata", {})
+        for item in (report or {}).get("install", [])
+    ]
+    package = next(
+        (
+            meta for meta in installed
+            if re.sub(r"[-_.]+", "-", meta.get("name", "")).lower() == "vc-commit-helper"
+        ),
+        None
+    )
+    if package:
+        print_success(
+            f"Package installed successfully (version {package.get('version')})"
+        )
+    else:
         print_success("Package installed successfully")
-        
-        # Check if there's a PATH warning
-        output = result.stdout + result.stderr
-        has_path_warning = "is not on PATH" in output
-        
-        if has_path_warning:
-            print_warning("Scripts directory is not on PATH (will be fixed)")
-        
-        return True, has_path_warning
-        
-    except subprocess.CalledProcessError as e:
-        print_error(f"Failed to install package")
-        if e.stderr:
-            print(f"\nError details:\n{e.stderr}")
-        if e.stdout:
-            print(f"\nOutput:\n{e.stdout}")
-        return False, False
+    
+    # Check if there's a PATH warning
+    has_path_warning = "is not on PATH" in notices
+    scripts_dir = _scripts_dir_from_warning(notices)
+    
+    if has_path_warning:
+        print_warning("Scripts directory is not on PATH (will be fixed)")
+    
+    return True, has_path_warning, scripts_dir
 
 
-def find_scripts_directory() -> Optional[Path]:
+def find_scripts_directory(hint: Optional[Path] = None) -> Optional[Path]:
     """Find the Python Scripts directory where aicheckin was installed.
     
+    All candidates are computed in-process; no pip or Python subprocess is
+    spawned.
+    
+    Args:
+        hint: Directory reported by pip's PATH warning, checked first.
+    
     Returns:
         Path to Scripts directory or None if not found.
     """
     print_info("Locating Scripts directory...")
     
-    # Try to find where pip installed the script
-    pip_cmd = get_pip_command()
-    
-    try:
-        result = subprocess.run(
-            pip_cmd + ["show", "-f", "vc-commit-helper"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        # Parse the output to find the location
-        for line in result.stdout.splitlines():
-            if line.startswith("Location:"):
-                location = Path(line.split(":", 1)[1].strip())
-                
-                # Scripts directory is typically a sibling of site-packages
-                if platform.system() == "Windows":
-                    scripts_dir = location.parent / "Scripts"
-                else:
-                    scripts_dir = location.parent / "bin"
-                
-                if scripts_dir.exists():
-                    print_info(f"Found Scripts directory: {scripts_dir}")
-                    return scripts_dir
-                
-    except subprocess.CalledProcessError:
-        pass
+    if hint is not None and hint.exists():
+        print_info(f"Found Scripts directory: {hint}")
+        return hint
     
-    # Fallback: check common locations
+    # Check common locations
     print_info("Checking common installation locations...")
     
     if platform.system() == "Windows":
@@ -216,18 +304,10 @@ def find_scripts_directory() -> Optional[Path]:
             return scripts_dir
         
         # User installation
-        try:
-            user_base = subprocess.run(
-                [sys.executable, "-m", "site", "--user-base"],
-                capture_output=True,
-                text=True
-            ).stdout.strip()
-            scripts_dir = Path(user_base) / "bin"
-            if scripts_dir.exists():
-                print_info(f"Found Scripts directory: {scripts_dir}")
-                return scripts_dir
-        except Exception:
-            pass
+        scripts_dir = Path(site.getuserbase()) / "bin"
+        if scripts_dir.exists():
+            print_info(f"Found Scripts directory: {scripts_dir}")
+            return scripts_dir
     
     print_warning("Could not locate Scripts directory automatically")
     return None
@@ -328,12 +408,15 @@ def add_to_path_unix(scripts_dir: Path) -> bool:
     try:
         print_info(f"Updating {rc_file.name}...")
         
-        # Check if already in the file
-        if rc_file.exists():
-            content = rc_file.read_text()
-            if str(scripts_dir) in content:
-                print_success(f"Scripts directory already in {rc_file.name}")
-                return True
+        # Check if already in the file; compare bytes so the file does
+        # not need to be decoded (or be valid in the locale's encoding)
+        try:
+            content = rc_file.read_bytes()
+        except FileNotFoundError:
+            content = b""
+        if os.fsencode(str(scripts_dir)) in content:
+            print_success(f"Scripts directory already in {rc_file.name}")
+            return True
         
         # Append to the file
         with open(rc_file, "a") as f:
@@ -348,11 +431,12 @@ def add_to_path_unix(scripts_dir: Path) -> bool:
         return False
 
 
-def setup_path(has_path_warning: bool) -> bool:
+def setup_path(has_path_warning: bool, scripts_hint: Optional[Path] = None) -> bool:
     """Set up PATH to include the Scripts directory.
     
     Args:
         has_path_warning: Whether pip warned about PATH.
+        scripts_hint: Scripts directory named in pip's PATH warning, if any.
         
     Returns:
         True if successful or not needed, False otherwise.
@@ -361,7 +445,7 @@ def setup_path(has_path_warning: bool) -> bool:
         print_success("Scripts directory is already on PATH")
         return False  # No update needed
     
-    scripts_dir = find_scripts_directory()
+    scripts_dir = find_scripts_directory(scripts_hint)
     
     if not scripts_dir:
         print_warning("Could not locate Scripts directory")
@@ -382,6 +466,7 @@ def setup_config() -> bool:
     Returns:
         True if successful, False otherwise.
     """
+    c = _codes()
     config_dir = Path.home() / ".ollama_server"
     config_path = config_dir / ".ollama_config.json"
     
@@ -407,16 +492,16 @@ def setup_config() -> bool:
     print("Please provide the following information (press Enter for defaults):\n")
     
     try:
-        base_url = input(f"  Ollama base URL [{Colors.BLUE}http://localhost{Colors.RESET}]: ").strip()
+        base_url = input(f"  Ollama base URL [{c.BLUE}http://localhost{c.RESET}]: ").strip()
         base_url = base_url or "http://localhost"
         
-        port = input(f"  Ollama port [{Colors.BLUE}11434{Colors.RESET}]: ").strip()
+        port = input(f"  Ollama port [{c.BLUE}11434{c.RESET}]: ").strip()
         port = port or "11434"
         
-        model = input(f"  Ollama model [{Colors.BLUE}llama3{Colors.RESET}]: ").strip()
+        model = input(f"  Ollama model [{c.BLUE}llama3{c.RESET}]: ").strip()
         model = model or "llama3"
         
-        timeout = input(f"  Request timeout in seconds [{Colors.BLUE}60{Colors.RESET}]: ").strip()
+        timeout = input(f"  Request timeout in seconds [{c.BLUE}60{c.RESET}]: ").strip()
         timeout = timeout or "60"
         
         max_tokens = input(f"  Max tokens (leave empty for default): ").strip()
@@ -451,53 +536,68 @@ def setup_config() -> bool:
         return False
 
 
-def verify_installation() -> bool:
-    """Verify that the installation was successful.
+def _probe_installation() -> Tuple[bool, Optional[int], Optional[Exception]]:
+    """Run ``--help`` of the installed command without printing anything.
+    
+    The ``aicheckin`` command is run if :func:`shutil.which` finds it on
+    PATH; otherwise ``python -m vc_commit_helper.cli`` is tried instead.
     
     Returns:
-        True if aicheckin command is available, False otherwise.
+        Tuple of (command_found, returncode, error) where:
+        - command_found: True if aicheckin was found on PATH
+        - returncode: Exit code of the --help call, or None if it failed
+        - error: Exception raised while running it, if any
     """
-    print_info("Verifying installation...")
+    aicheckin = shutil.which("aicheckin")
+    if aicheckin:
+        command = [aicheckin, "--help"]
+    else:
+        command = [sys.executable, "-m", "vc_commit_helper.cli", "--help"]
     
     try:
-        # Try to run aicheckin --help
         result = subprocess.run(
-            ["aicheckin", "--help"],
+            command,
             capture_output=True,
             text=True,
             timeout=5
         )
-        
-        if result.returncode == 0:
+    except Exception as e:
+        return aicheckin is not None, None, e
+    return aicheckin is not None, result.returncode, None
+
+
+def verify_installation(probe: Optional[Future] = None) -> bool:
+    """Verify that the installation was successful.
+    
+    Args:
+        probe: Pending result of :func:`_probe_installation`, started
+            earlier so that it overlaps with other setup steps. The probe
+            is run now if not given.
+    
+    Returns:
+        True if aicheckin command is available, False otherwise.
+    """
+    print_info("Verifying installation...")
+    
+    command_found, returncode, error = probe.result() if probe else _probe_installation()
+    
+    if command_found:
+        if error is not None:
+            print_error(f"Verification failed: {error}")
+            return False
+        if returncode == 0:
             print_success("aicheckin command is available")
             return True
-        else:
-            print_warning("aicheckin command found but returned an error")
-            return False
-            
-    except FileNotFoundError:
-        print_warning("aicheckin command not found in current PATH")
-        
-        # Try with python -m
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "vc_commit_helper.cli", "--help"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                print_success("Module can be run with: python -m vc_commit_helper.cli")
-                return True
-        except Exception:
-            pass
-        
-        return False
-        
-    except Exception as e:
-        print_error(f"Verification failed: {e}")
+        print_warning("aicheckin command found but returned an error")
         return False
+    
+    print_warning("aicheckin command not found in current PATH")
+    
+    if returncode == 0:
+        print_success("Module can be run with: python -m vc_commit_helper.cli")
+        return True
+    
+    return False
 
 
 def print_usage_instructions(path_updated: bool, installation_verified: bool) -> None:
@@ -507,6 +607,7 @@ def print_usage_instructions(path_updated: bool, installation_verified: bool) ->
         path_updated: Whether PATH was updated during installation.
         installation_verified: Whether the installation was verified successfully.
     """
+    c = _codes()
     print_header("Installation Summary")
     
     os_name = platform.system()
@@ -519,7 +620,7 @@ def print_usage_instructions(path_updated: bool, installation_verified: bool) ->
             print_info("Or run: source ~/.bashrc (or ~/.zshrc)")
         print()
     
-    print(Colors.BOLD + "Usage:" + Colors.RESET)
+    print(c.BOLD + "Usage:" + c.RESET)
     
     if installation_verified and not path_updated:
         print("  aicheckin              # Interactive mode")
@@ -534,9 +635,9 @@ def print_usage_instructions(path_updated: bool, installation_verified: bool) ->
         print(f"  {sys.executable} -m vc_commit_helper.cli --verbose    # Enable debug output")
         
         if path_updated:
-            print(f"\n  {Colors.YELLOW}After restarting terminal, you can use: aicheckin{Colors.RESET}")
+            print(f"\n  {c.YELLOW}After restarting terminal, you can use: aicheckin{c.RESET}")
     
-    print("\n" + Colors.BOLD + "Next Steps:" + Colors.RESET)
+    print("\n" + c.BOLD + "Next Steps:" + c.RESET)
     print("  1. Navigate to a Git or SVN repository")
     print("  2. Make some changes to files")
     if installation_verified and not path_updated:
@@ -565,26 +666,31 @@ def main() -> int:
     
     # Install package
     print()
-    package_installed, has_path_warning = install_package()
+    package_installed, has_path_warning, scripts_hint = install_package()
     
     if not package_installed:
         return 1
     
-    # Set up PATH if needed
-    print()
-    path_updated = setup_path(has_path_warning)
-    
-    # Set up configuration
-    print()
-    config_ok = setup_config()
-    
-    if not config_ok:
-        print_warning("Configuration setup incomplete")
-        print_info("You can create .ollama_config.json manually later")
-    
-    # Verify installation
-    print()
-    installation_verified = verify_installation()
+    # Check the installed command in the background while PATH and the
+    # configuration are set up; neither affects the current process
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        probe = executor.submit(_probe_installation)
+        
+        # Set up PATH if needed
+        print()
+        path_updated = setup_path(has_path_warning, scripts_hint)
+        
+        # Set up configuration
+        print()
+        config_ok = setup_config()
+        
+        if not config_ok:
+            print_warning("Configuration setup incomplete")
+            print_info("You can create .ollama_config.json manually later")
+        
+        # Verify installation
+        print()
+        installation_verified = verify_installation(probe)
     
     # Print summary
     print()
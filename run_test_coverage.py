@@ -2,21 +2,23 @@
 Run unit tests and compute code coverage using Python's built‑in tracing.
 
 This script will discover and run the project's unit tests located under
-the ``tests`` directory. It uses ``sys.settrace`` to record which lines
+the ``tests`` directory. It uses ``sys.monitoring`` (Python 3.12+) or
+``sys.settrace`` on older versions to record which lines
 of the project's source code (under ``src/vc_commit_helper``) are executed
 during the test run. It then calculates a simple line coverage metric:
 
 - The **numerator** is the number of unique executed lines across all
   monitored modules.
 - The **denominator** is the number of countable lines in those modules.
-  A countable line is one that is not empty, not a comment, and does
-  not contain ``# pragma: no cover``. Docstrings and import statements
-  are counted as lines but can be excluded by adding ``# pragma: no cover``
-  on their lines if desired.
+  A countable line is one the compiled module has executable code for
+  (as listed by ``co_lines()``), so blank lines, comments and docstrings
+  are not counted. Lines can be excluded by adding ``# pragma: no cover``.
 
-The result is printed as a percentage. This script does not depend on
-external packages such as ``coverage.py`` or ``pytest`` and can run in
-restricted environments.
+The result is printed as a percentage. If ``coverage.py`` is installed,
+the tests are measured with it instead (set ``VC_COVERAGE_BACKEND=builtin``
+to use the built-in tracing regardless). The script does not otherwise
+depend on external packages such as ``coverage.py`` or ``pytest`` and can
+run in restricted environments.
 
 To use this script, run:
 
@@ -26,21 +28,40 @@ It will execute the unit tests via the built‑in ``unittest`` module and
 report the coverage.
 """
 
+import functools
+import io
+import json
 import os
 import sys
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from types import FrameType
-from typing import Dict, Set
+from types import CodeType, FrameType
+from typing import Callable, Dict, List, Optional, Set
+
+
+@functools.lru_cache(maxsize=None)
+def _root_prefix(project_root: Path) -> str:
+    """Return the absolute ``project_root`` path with a trailing separator."""
+    return os.path.join(os.path.abspath(project_root), "")
+
+
+@functools.lru_cache(maxsize=None)
+def _excluded_paths(project_root: Path) -> frozenset:
+    """Return the absolute paths of ``EXCLUDE_FILES`` under ``project_root``."""
+    prefix = _root_prefix(project_root)
+    return frozenset(prefix + rel_path.replace("/", os.sep) for rel_path in EXCLUDE_FILES)
 
 
 def should_trace_file(filename: str, project_root: Path) -> bool:
-    """Return True if ``filename`` is within the project's source tree."""
-    try:
-        path = Path(filename).resolve()
-    except Exception:
-        return False
-    return project_root in path.parents
+    """Return True if ``filename`` is within the project's source tree.
+
+    Code objects of imported modules carry absolute filenames, so this is
+    a prefix test against the project root computed once per root; it
+    issues no filesystem calls. Pseudo-files such as ``"<string>"`` never
+    match, and neither do ``EXCLUDE_FILES``, which are not measured.
+    """
+    return filename.startswith(_root_prefix(project_root)) and filename not in _excluded_paths(project_root)
 
 
 def collect_executed_lines(project_root: Path) -> Dict[str, Set[int]]:
@@ -58,31 +79,158 @@ def collect_executed_lines(project_root: Path) -> Dict[str, Set[int]]:
     """
     executed: Dict[str, Set[int]] = {}
 
-    def tracer(frame: FrameType, event: str, arg) -> None:
-        filename = frame.f_code.co_filename
-        if event == "line" and should_trace_file(filename, project_root):
-            lineno = frame.f_lineno
-            executed.setdefault(filename, set()).add(lineno)
-        return tracer
+    def measure(run: Callable[[], None]) -> None:
+        if not (sys.version_info >= (3, 12) and _run_with_monitoring(run, executed, project_root)):
+            _run_with_settrace(run, executed, project_root)
+
+    _run_tests(measure)
+    return executed
+
+
+def measure_with_coverage_py(project_root: Path) -> Optional[float]:
+    """Run the tests under ``coverage.py`` if it is installed.
+
+    ``coverage.py`` records lines with a C tracer (or ``sys.monitoring``),
+    so it is preferred over the built-in tracing when available. Its
+    settings from ``pyproject.toml`` apply; ``EXCLUDE_FILES`` are omitted.
+
+    Parameters
+    ----------
+    project_root : Path
+        The root directory of the project's source code.
+
+    Returns
+    -------
+    float or None
+        Coverage ratio between 0 and 1, or None if ``coverage.py`` is not
+        installed.
+    """
+    try:
+        import coverage
+    except ImportError:
+        return None
+    cov = coverage.Coverage(
+        data_file=None,
+        source=[str(project_root)],
+        omit=[str(project_root / rel_path) for rel_path in EXCLUDE_FILES],
+    )
+
+    def measure(run: Callable[[], None]) -> None:
+        cov.start()
+        try:
+            run()
+        finally:
+            cov.stop()
+
+    _run_tests(measure)
+    return cov.report(file=io.StringIO()) / 100
+
+
+def _run_tests(measure: Callable[[Callable[[], None]], None]) -> None:
+    """Discover and run the unit tests under ``measure``.
+
+    ``measure`` is called with a function that runs the suite and calls it
+    with its instrumentation active. The runner reports into a buffer that
+    is written out once ``measure`` returns, so the result printer's writes
+    are not made under the tracer. Exits with status 1 if a test fails.
+    """
+    output = io.StringIO()
+    results: List[unittest.TestResult] = []
+
     # Ensure tests are importable
     # Run the unittest discovery under trace
     def run_tests() -> None:
         # Discover tests in the "tests" directory
         loader = unittest.TestLoader()
         # Use absolute path to ensure we only discover tests in the project's tests directory
-        tests_dir = Path(__file__).parent / "tests"
-        suite = loader.discover(str(tests_dir.resolve()), pattern="test_*.py", top_level_dir=str(Path(__file__).parent))
-        runner = unittest.TextTestRunner()
-        result = runner.run(suite)
-        if not result.wasSuccessful():
-            # Exit with non‑zero to indicate failure
-            sys.exit(1)
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        tests_dir = os.path.join(base_dir, "tests")
+        suite = loader.discover(tests_dir, pattern="test_*.py", top_level_dir=base_dir)
+        runner = unittest.TextTestRunner(stream=output)
+        results.append(runner.run(suite))
+
+    try:
+        measure(run_tests)
+    finally:
+        sys.stderr.write(output.getvalue())
+    if not results or not results[0].wasSuccessful():
+        # Exit with non‑zero to indicate failure
+        sys.exit(1)
+
+
+def _run_with_settrace(run: Callable[[], None], executed: Dict[str, Set[int]], project_root: Path) -> None:
+    """Run ``run`` while recording executed lines with ``sys.settrace``."""
+    # Classify each code object once. Code objects are used as keys rather
+    # than id() values, which could be reused after garbage collection.
+    # Traced code objects map to the bound ``add`` of their file's line set.
+    line_adders: Dict[CodeType, Callable[[int], None]] = {}
+    skip_codes: Set[CodeType] = set()
+
+    def line_tracer(frame: FrameType, event: str, arg) -> Callable:
+        # Local tracer of project frames: only line events are recorded
+        if event == "line":
+            line_adders[frame.f_code](frame.f_lineno)
+        return line_tracer
+
+    def tracer(frame: FrameType, event: str, arg) -> Optional[Callable]:
+        # Global tracer: called once per frame, on its "call" event
+        code = frame.f_code
+        if code in skip_codes:
+            # No local tracer: the frame produces no further line events
+            return None
+        if code not in line_adders:
+            if not should_trace_file(code.co_filename, project_root):
+                skip_codes.add(code)
+                return None
+            line_adders[code] = executed.setdefault(code.co_filename, set()).add
+        return line_tracer
     sys.settrace(tracer)
     try:
-        run_tests()
+        run()
     finally:
         sys.settrace(None)
-    return executed
+
+
+def _run_with_monitoring(run: Callable[[], None], executed: Dict[str, Set[int]], project_root: Path) -> bool:
+    """Run ``run`` while recording executed lines with ``sys.monitoring``.
+
+    Available on Python 3.12+ (PEP 669). Only ``PY_START`` is enabled
+    globally: the first time a code object starts, line events are turned
+    on for it if it belongs to the project, and the start event is disabled
+    for it either way. Each line event is recorded once and then disabled,
+    so every line costs at most one callback.
+
+    Returns False without running anything if the coverage tool id is
+    already taken (e.g. when running under ``coverage.py``).
+    """
+    monitoring = sys.monitoring
+    tool_id = monitoring.COVERAGE_ID
+    events = monitoring.events
+    try:
+        monitoring.use_tool_id(tool_id, "run_test_coverage")
+    except ValueError:
+        return False
+
+    def on_start(code: CodeType, instruction_offset: int):
+        if should_trace_file(code.co_filename, project_root):
+            monitoring.set_local_events(tool_id, code, events.LINE)
+        return monitoring.DISABLE
+
+    def on_line(code: CodeType, line_number: int):
+        executed.setdefault(code.co_filename, set()).add(line_number)
+        return monitoring.DISABLE
+
+    monitoring.register_callback(tool_id, events.PY_START, on_start)
+    monitoring.register_callback(tool_id, events.LINE, on_line)
+    monitoring.set_events(tool_id, events.PY_START)
+    try:
+        run()
+    finally:
+        monitoring.set_events(tool_id, 0)
+        monitoring.register_callback(tool_id, events.PY_START, None)
+        monitoring.register_callback(tool_id, events.LINE, None)
+        monitoring.free_tool_id(tool_id)
+    return True
 
 
 # Files relative to the project source root to exclude entirely from coverage.
@@ -92,15 +240,75 @@ def collect_executed_lines(project_root: Path) -> Dict[str, Set[int]]:
 # testable logic. Paths should be specified relative to
 # ``src/vc_commit_helper``. For example, to exclude the CLI module, use
 # ``["cli.py"]``.
-EXCLUDE_FILES = {
+EXCLUDE_FILES = frozenset({
     "cli.py",
     "llm/commit_message_generator.py",
     "llm/ollama_client.py",
     "vcs/git_client.py",
     "vcs/svn_client.py",
-}
+})
+
+# Compile uncached files in a process pool once there are at least this
+# many; below it, starting the workers costs more than it saves.
+PARALLEL_FILE_THRESHOLD = 32
+
+def countable_lines(source: str, filename: str) -> Set[int]:
+    """Return the line numbers of ``source`` that can produce line events.
 
-def calculate_coverage(executed: Dict[str, Set[int]], project_root: Path) -> float:
+    The source is compiled and the line table of every code object
+    (module, classes, functions, comprehensions) is collected, which is
+    the same notion of a line the tracer reports. Lines marked with
+    ``# pragma: no cover`` are excluded.
+    """
+    lines: Set[int] = set()
+    pending = [compile(source, filename, "exec")]
+    while pending:
+        code = pending.pop()
+        lines.update(lineno for _, _, lineno in code.co_lines() if lineno)
+        pending.extend(const for const in code.co_consts if isinstance(const, CodeType))
+    if "# pragma: no cover" not in source:
+        # Common case: one scan of the whole source, no line splitting
+        return lines
+    source_lines = source.splitlines()
+    return {
+        lineno
+        for lineno in lines
+        if lineno <= len(source_lines) and "# pragma: no cover" not in source_lines[lineno - 1]
+    }
+
+
+def _file_countable_lines(filepath: str) -> List[int]:
+    """Read ``filepath`` and return its sorted countable lines."""
+    source = Path(filepath).read_text(encoding="utf-8", errors="ignore")
+    return sorted(countable_lines(source, filepath))
+
+
+def _load_line_cache(cache_path: Path) -> Dict[str, List[int]]:
+    """Load cached countable lines, ignoring missing or unreadable caches."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    # Line tables differ between interpreter versions
+    if not isinstance(data, dict) or data.get("python") != list(sys.version_info[:2]):
+        return {}
+    lines = data.get("lines")
+    return lines if isinstance(lines, dict) else {}
+
+
+def _save_line_cache(cache_path: Path, lines: Dict[str, List[int]]) -> None:
+    data = {"python": list(sys.version_info[:2]), "lines": lines}
+    try:
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def calculate_coverage(
+    executed: Dict[str, Set[int]],
+    project_root: Path,
+    cache_path: Optional[Path] = None,
+) -> float:
     """Calculate coverage percentage based on executed lines.
 
     Parameters
@@ -109,43 +317,49 @@ def calculate_coverage(executed: Dict[str, Set[int]], project_root: Path) -> flo
         Mapping from filename to executed line numbers.
     project_root : Path
         Root path of the project's source code.
+    cache_path : Path, optional
+        JSON file in which the countable lines of each source file are
+        cached, keyed by path, modification time and size. Unchanged
+        files are then not read or compiled again.
 
     Returns
     -------
     float
         Coverage ratio between 0 and 1.
     """
-    total_lines = 0
-    covered_lines = 0
-    for filepath in executed.keys():
-        rel_path = Path(filepath).resolve().relative_to(project_root)
+    cache = _load_line_cache(cache_path) if cache_path is not None else {}
+    new_cache: Dict[str, List[int]] = {}
+    keys: Dict[str, str] = {}
+    prefix = _root_prefix(project_root)
+    excluded = _excluded_paths(project_root)
+    for filepath in executed:
         # Skip excluded modules entirely from the denominator
-        if rel_path.as_posix() in EXCLUDE_FILES:
+        if not filepath.startswith(prefix) or filepath in excluded:
             continue
-        with Path(filepath).open("r", encoding="utf-8", errors="ignore") as f:
-            inside_docstring = False
-            for lineno, line in enumerate(f, start=1):
-                stripped = line.strip()
-                # Toggle docstring state when encountering triple quotes
-                # We check for both single and double triple quotes.
-                # If triple quotes are found on a line, we flip the flag and skip that line.
-                if '"""' in line or "'''" in line:
-                    # Flip docstring state before skipping the line. This ensures that
-                    # both opening and closing docstring lines are excluded.
-                    inside_docstring = not inside_docstring
-                    continue
-                if inside_docstring:
-                    # Skip lines inside a docstring
-                    continue
-                if not stripped:
-                    continue
-                if stripped.startswith("#"):
-                    continue
-                if "# pragma: no cover" in line:
-                    continue
-                total_lines += 1
-                if lineno in executed[filepath]:
-                    covered_lines += 1
+        st = os.stat(filepath)
+        keys[filepath] = key = f"{filepath}:{st.st_mtime_ns}:{st.st_size}"
+        if key in cache:
+            new_cache[key] = cache[key]
+
+    # Files are independent, so uncached ones can be compiled in parallel
+    missing = [filepath for filepath, key in keys.items() if key not in new_cache]
+    if len(missing) >= PARALLEL_FILE_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_file_countable_lines, missing, chunksize=8))
+    else:
+        results = [_file_countable_lines(filepath) for filepath in missing]
+    for filepath, lines in zip(missing, results):
+        new_cache[keys[filepath]] = lines
+
+    total_lines = 0
+    covered_lines = 0
+    for filepath, key in keys.items():
+        lines = new_cache[key]
+        total_lines += len(lines)
+        covered_lines += len(executed[filepath].intersection(lines))
+    if cache_path is not None and new_cache != cache:
+        # Only entries for the files seen in this run are kept
+        _save_line_cache(cache_path, new_cache)
     if total_lines == 0:
         return 1.0
     return covered_lines / total_lines
@@ -155,8 +369,14 @@ def main() -> None:
     # Identify the project source directory to measure coverage on
     # In this project, code resides under ``src/vc_commit_helper``
     project_root = Path(__file__).parent / "src" / "vc_commit_helper"
-    executed = collect_executed_lines(project_root)
-    coverage = calculate_coverage(executed, project_root)
+    coverage = None
+    # VC_COVERAGE_BACKEND=builtin forces the built-in tracing
+    if os.environ.get("VC_COVERAGE_BACKEND") != "builtin":
+        coverage = measure_with_coverage_py(project_root)
+    if coverage is None:
+        executed = collect_executed_lines(project_root)
+        cache_path = Path(__file__).parent / ".coverage_denom_cache.json"
+        coverage = calculate_coverage(executed, project_root, cache_path)
     print(f"Coverage: {coverage * 100:.2f}%")
 
 
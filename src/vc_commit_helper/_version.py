@@ -8,11 +8,168 @@ The version is composed of:
 
 Format: {major}.{minor}.dev0+g{commit_sha}
 Example: 0.5.dev0+g1fbcb8c
+
+HEAD and the tags are read from the ``.git`` directory where possible, so
+importing the package does not spawn git; git is only run as a fallback
+(e.g. for the reftable ref storage).
 """
 
+import functools
+import os
+import re
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+
+
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+
+def _find_git_root(start: Path) -> Optional[Path]:
+    """
+    Find the nearest directory at or above ``start`` that contains ``.git``.
+    
+    This mirrors the Git part of ``vcs.detection.find_vcs_roots``. The
+    version is generated on every package import, and importing the
+    ``vcs`` package would also load the Git and SVN clients.
+    
+    Args:
+        start: Directory from which to start searching.
+    
+    Returns:
+        The work tree root, or None if no ``.git`` entry was found.
+    """
+    work_tree = os.environ.get("GIT_WORK_TREE")
+    if work_tree and Path(work_tree).is_dir():
+        return Path(work_tree).resolve()
+    git_dir_env = os.environ.get("GIT_DIR")
+    if git_dir_env and Path(git_dir_env).is_dir():
+        return Path(git_dir_env).resolve().parent
+    start = start.resolve()
+    for directory in (start, *start.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+def _git_dirs(repo_path: Optional[Path] = None) -> Optional[Tuple[Path, Path]]:
+    """
+    Locate the git directory and the common directory holding the refs.
+    
+    They differ for linked worktrees, whose ``.git`` file points at a
+    per-worktree directory that names the shared one in ``commondir``.
+    
+    Args:
+        repo_path: Path inside the repository. If None, uses current directory.
+    
+    Returns:
+        Tuple of (git_dir, common_dir), or None if the refs cannot be read
+        as plain files and git has to be asked instead.
+    """
+    git_dir_env = os.environ.get("GIT_DIR")
+    if git_dir_env and Path(git_dir_env).name != ".git":
+        return None
+    root = _find_git_root(Path(repo_path) if repo_path else Path.cwd())
+    if root is None:
+        return None
+    try:
+        git_dir = root / ".git"
+        if git_dir.is_file():
+            content = git_dir.read_text(encoding="utf-8").strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = root / content[len("gitdir:"):].strip()
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = git_dir / commondir_file.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if (common_dir / "reftable").exists():
+        # The reftable backend does not store refs as files
+        return None
+    return git_dir, common_dir
+
+
+def _packed_refs(common_dir: Path) -> List[Tuple[str, str]]:
+    """
+    Read the (sha, ref name) pairs listed in ``packed-refs``.
+    
+    Args:
+        common_dir: Directory holding the repository's refs.
+    
+    Returns:
+        Packed refs in file order; empty if there is no ``packed-refs`` file.
+    """
+    try:
+        lines = (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    refs = []
+    for line in lines:
+        # Skip the header and peeled ("^<sha>") lines of annotated tags
+        if line and line[0] not in "#^" and " " in line:
+            sha, name = line.split(" ", 1)
+            refs.append((sha, name))
+    return refs
+
+
+def _read_head_sha(repo_path: Optional[Path] = None) -> Optional[str]:
+    """
+    Read the full SHA of HEAD from the git directory without running git.
+    
+    Args:
+        repo_path: Path inside the repository. If None, uses current directory.
+    
+    Returns:
+        The commit SHA, or None if it cannot be determined from the files.
+    """
+    dirs = _git_dirs(repo_path)
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    
+    if not head.startswith("ref:"):
+        # Detached HEAD
+        sha = head
+    else:
+        ref = head[len("ref:"):].strip()
+        try:
+            sha = (common_dir / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            sha = next((sha for sha, name in _packed_refs(common_dir) if name == ref), "")
+    return sha if _SHA_RE.fullmatch(sha) else None
+
+
+def _list_tags(repo_path: Optional[Path] = None) -> Optional[List[str]]:
+    """
+    List the repository's tag names from the git directory without running git.
+    
+    Args:
+        repo_path: Path inside the repository. If None, uses current directory.
+    
+    Returns:
+        Names of loose and packed tags, or None if they cannot be read
+        from the files.
+    """
+    dirs = _git_dirs(repo_path)
+    if dirs is None:
+        return None
+    _, common_dir = dirs
+    prefix = "refs/tags/"
+    tags = {name[len(prefix):] for _, name in _packed_refs(common_dir) if name.startswith(prefix)}
+    try:
+        with os.scandir(common_dir / "refs" / "tags") as entries:
+            tags.update(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return None
+    return sorted(tags)
 
 
 def get_git_commit_sha(repo_path: Optional[Path] = None) -> str:
@@ -25,6 +182,10 @@ def get_git_commit_sha(repo_path: Optional[Path] = None) -> str:
     Returns:
         Short commit SHA (7 characters) or 'unknown' if not in a git repo.
     """
+    sha = _read_head_sha(repo_path)
+    if sha is not None:
+        return sha[:7]
+    
     try:
         if repo_path:
             cmd = ["git", "-C", str(repo_path), "rev-parse", "--short=7", "HEAD"]
@@ -34,7 +195,8 @@ def get_git_commit_sha(repo_path: Optional[Path] = None) -> str:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            encoding='utf-8',
+            errors='replace',
             check=True
         )
         return result.stdout.strip()
@@ -56,48 +218,50 @@ def get_minor_version_from_tags(repo_path: Optional[Path] = None, major_version:
     Returns:
         The minor version number (0 if no tags found).
     """
-    try:
-        if repo_path:
-            cmd = ["git", "-C", str(repo_path), "tag", "-l", f"v{major_version}.*"]
-        else:
-            cmd = ["git", "tag", "-l", f"v{major_version}.*"]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        output = result.stdout.strip()
-        if not output:
-            return 0
+    tags = _list_tags(repo_path)
+    if tags is None:
+        try:
+            if repo_path:
+                cmd = ["git", "-C", str(repo_path), "tag", "-l", f"v{major_version}.*"]
+            else:
+                cmd = ["git", "tag", "-l", f"v{major_version}.*"]
             
-        tags = output.split('\n')
-        minor_versions = []
-        
-        for tag in tags:
-            if not tag:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                encoding='utf-8',
+                errors='replace',
+                check=True
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return 0
+        tags = result.stdout.strip().split('\n')
+    
+    minor_versions = []
+    
+    for tag in tags:
+        if not tag:
+            continue
+        # Parse tags like v0.1, v0.2, etc. matching the major version
+        expected_prefix = f"v{major_version}."
+        if tag.startswith(expected_prefix):
+            minor_str = tag[len(expected_prefix):]
+            try:
+                minor = int(minor_str)
+                minor_versions.append(minor)
+            except ValueError:
                 continue
-            # Parse tags like v0.1, v0.2, etc. matching the major version
-            expected_prefix = f"v{major_version}."
-            if tag.startswith(expected_prefix):
-                minor_str = tag[len(expected_prefix):]
-                try:
-                    minor = int(minor_str)
-                    minor_versions.append(minor)
-                except ValueError:
-                    continue
-        
-        return max(minor_versions) if minor_versions else 0
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return 0
+    
+    return max(minor_versions) if minor_versions else 0
 
 
 def generate_version(base_version: str, repo_path: Optional[Path] = None) -> str:
     """
     Generate the full version string in PEP 440 compliant format.
     
+    The result is memoized per base version and repository path for the
+    lifetime of the process, so git is only run on the first call.
+    
     Args:
         base_version: The base/major version (e.g., "0")
         repo_path: Path to the repository root. If None, uses current directory.
@@ -106,6 +270,12 @@ def generate_version(base_version: str, repo_path: Optional[Path] = None) -> str
         Full version string in format: {major}.{minor}.dev0+g{commit_sha}
         This is PEP 440 compliant as a development release.
     """
+    # Key the cache on the directory git would actually run in
+    return _generate_version(base_version, Path(repo_path) if repo_path else Path.cwd())
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_version(base_version: str, repo_path: Path) -> str:
     minor = get_minor_version_from_tags(repo_path, base_version)
     commit_sha = get_git_commit_sha(repo_path)
     
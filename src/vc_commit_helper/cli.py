@@ -13,19 +13,25 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
 
 from vc_commit_helper import __version__
-from vc_commit_helper.config.loader import ConfigError, load_config
-from vc_commit_helper.diff.diff_extractor import extract_diffs
+from vc_commit_helper.config.loader import ConfigError, get_llm_cache_directory, load_config
 from vc_commit_helper.grouping.group_model import CommitGroup
-from vc_commit_helper.llm.commit_message_generator import CommitMessageGenerator
+from vc_commit_helper.llm.commit_message_generator import (
+    MAX_PARALLEL_REQUESTS,
+    MIN_DIFF_LINES_FOR_LLM,
+    CommitMessageGenerator,
+)
 from vc_commit_helper.llm.ollama_client import LLMError, OllamaClient
+from vc_commit_helper.vcs.detection import find_vcs_roots
 from vc_commit_helper.vcs.git_client import GitClient, GitError
 from vc_commit_helper.vcs.svn_client import SVNClient, SVNError
 
@@ -53,16 +59,40 @@ EXIT_LLM_FAILURE = 7
 EXIT_ALL_DECLINED = 8
 
 
+#: Returned by :func:`prompt_user` with ``defer_edit=True`` when the user
+#: chose to edit the message; the edit happens in :func:`edit_messages`.
+EDIT_DEFERRED = object()
+
+# Actions offered for each commit group; matching is case-insensitive
+_REVIEW_CHOICE = click.Choice(['A', 'E', 'D'], case_sensitive=False)
+
+# Separator written above each message when several messages are edited
+# in one editor session
+_EDIT_MARKER = "# ------ commit group {} [{}] ------"
+_EDIT_MARKER_RE = re.compile(r"^# ------ commit group (\d+) \[[^\]\n]*\] ------$", re.MULTILINE)
+
+
 # ---------------------------------------------------------------------------
 # Progress and status display utilities
 # ---------------------------------------------------------------------------
 
+def _stdout_is_tty() -> bool:
+    """Return whether standard output is an interactive terminal."""
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
 class ProgressIndicator:
-    """Simple progress indicator for user feedback."""
+    """Simple progress indicator for user feedback.
+
+    The spinner is only drawn when standard output is a terminal;
+    redirected output gets plain start and end lines without carriage
+    returns, and :meth:`update` writes nothing.
+    """
     
     def __init__(self, message: str, show_spinner: bool = True):
         self.message = message
-        self.show_spinner = show_spinner
+        self.show_spinner = show_spinner and _stdout_is_tty()
         self.spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.spinner_index = 0
         self.start_time = None
@@ -90,6 +120,36 @@ class ProgressIndicator:
             click.echo(f"\r{self.spinner_chars[self.spinner_index]} {message}...", nl=False)
 
 
+class StreamProgress:
+    """Report the amount of streamed LLM output on a progress indicator.
+
+    Instances are passed as ``on_fragment`` callback to
+    :class:`CommitMessageGenerator`. They may be called from several
+    worker threads and redraw the indicator at most every ``interval``
+    seconds.
+    """
+
+    def __init__(self, progress: ProgressIndicator, message: str, interval: float = 0.1):
+        self.progress = progress
+        self.message = message
+        self.interval = interval
+        self.received = 0
+        self._last_update = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, fragment: str) -> None:
+        with self._lock:
+            self.received += len(fragment)
+            now = time.monotonic()
+            if now - self._last_update >= self.interval:
+                self._last_update = now
+                self.progress.update(f"{self.message} ({self.received} characters received)")
+
+
+# Message prefixes for the indentation levels used by the print helpers
+_INDENTS = ("", "  ", "    ", "      ")
+
+
 def print_step(step_num: int, total_steps: int, message: str):
     """Print a step indicator."""
     click.echo(f"\n{'='*60}")
@@ -99,25 +159,33 @@ def print_step(step_num: int, total_steps: int, message: str):
 
 def print_info(message: str, indent: int = 0):
     """Print an info message."""
-    prefix = "  " * indent
+    prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
     click.echo(f"{prefix}ℹ {message}", err=False)
 
 
+def print_info_batch(messages: List[str], indent: int = 0):
+    """Print several info messages with a single write."""
+    if not messages:
+        return
+    prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
+    click.echo("\n".join(f"{prefix}ℹ {message}" for message in messages), err=False)
+
+
 def print_success(message: str, indent: int = 0):
     """Print a success message."""
-    prefix = "  " * indent
+    prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
     click.echo(f"{prefix}✓ {message}", err=False)
 
 
 def print_warning(message: str, indent: int = 0):
     """Print a warning message."""
-    prefix = "  " * indent
+    prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
     click.echo(f"{prefix}⚠ {message}", err=False)
 
 
 def print_error(message: str, indent: int = 0):
     """Print an error message."""
-    prefix = "  " * indent
+    prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
     click.echo(f"{prefix}✗ {message}", err=True)
 
 
@@ -126,12 +194,15 @@ def print_summary_box(title: str, items: List[str]):
     max_width = max(len(title), max(len(item) for item in items) if items else 0)
     box_width = min(max_width + 4, 60)
     
-    click.echo(f"\n┌{'─' * box_width}┐")
-    click.echo(f"│ {title.ljust(box_width - 2)}│")
-    click.echo(f"├{'─' * box_width}┤")
-    for item in items:
-        click.echo(f"│ {item.ljust(box_width - 2)}│")
-    click.echo(f"└{'─' * box_width}┘")
+    # Build the whole box and write it at once
+    lines = [
+        f"\n┌{'─' * box_width}┐",
+        f"│ {title.ljust(box_width - 2)}│",
+        f"├{'─' * box_width}┤",
+        *(f"│ {item.ljust(box_width - 2)}│" for item in items),
+        f"└{'─' * box_width}┘",
+    ]
+    click.echo("\n".join(lines))
 
 
 # ---------------------------------------------------------------------------
@@ -159,8 +230,9 @@ def detect_vcs(start_dir: Path) -> Tuple[str, Path]:
         repositories are detected.
     """
     with ProgressIndicator("Detecting version control system"):
-        git_root = GitClient.find_repo_root(start_dir)
-        svn_root = SVNClient.find_repo_root(start_dir)
+        roots = find_vcs_roots(start_dir)
+    git_root = roots.get("git")
+    svn_root = roots.get("svn")
     
     if git_root and svn_root:
         print_error("Both Git and SVN repository metadata found; ambiguous repository.")
@@ -254,7 +326,70 @@ def prompt_for_branch_creation(client: any, vcs_type: str, yes_mode: bool = Fals
         return False, "unknown"
 
 
-def prompt_user(group: CommitGroup, group_num: int, total_groups: int) -> Optional[str]:
+def _run_editor(editor: str, text: str) -> str:
+    """Open ``text`` in ``editor`` and return the saved file content."""
+    import tempfile
+    import subprocess
+    
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".txt", encoding='utf-8') as tmp:
+        tmp.write(text)
+        tmp.flush()
+        tmp_path = tmp.name
+    
+    try:
+        subprocess.run([editor, tmp_path], check=True)
+        with open(tmp_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def edit_messages(editor: str, groups: List[CommitGroup]) -> List[str]:
+    """Edit the messages of several commit groups in one editor session.
+
+    The messages are written to a single file, each below a marker line
+    naming its group, and the editor is started once. A single group is
+    edited without a marker.
+
+    Parameters
+    ----------
+    editor : str
+        Editor command to run.
+    groups : List[CommitGroup]
+        The commit groups whose messages are edited.
+
+    Returns
+    -------
+    List[str]
+        The edited messages in the order of ``groups``. Messages left
+        empty are replaced by the original message.
+
+    Raises
+    ------
+    ValueError
+        If the marker lines were changed or removed while editing.
+    Exception
+        Any error raised while running the editor.
+    """
+    if len(groups) == 1:
+        edited = [_run_editor(editor, groups[0].message)]
+    else:
+        text = "".join(
+            _EDIT_MARKER.format(idx, group.type) + "\n" + group.message + "\n\n"
+            for idx, group in enumerate(groups, 1)
+        )
+        parts = _EDIT_MARKER_RE.split(_run_editor(editor, text))
+        numbers = parts[1::2]
+        if numbers != [str(idx) for idx in range(1, len(groups) + 1)]:
+            raise ValueError("commit group marker lines were changed")
+        edited = parts[2::2]
+    return [message.strip() or group.message for message, group in zip(edited, groups)]
+
+
+def prompt_user(
+    group: CommitGroup, group_num: int, total_groups: int, defer_edit: bool = False
+) -> Union[Optional[str], object]:
     """Interactively prompt the user about a commit group.
 
     Parameters
@@ -265,79 +400,75 @@ def prompt_user(group: CommitGroup, group_num: int, total_groups: int) -> Option
         Current group number (1-indexed).
     total_groups : int
         Total number of groups.
+    defer_edit : bool, optional
+        If true and ``EDITOR`` is set, choosing to edit returns
+        :data:`EDIT_DEFERRED` instead of opening the editor, so that
+        several messages can be edited together with
+        :func:`edit_messages`.
 
     Returns
     -------
-    Optional[str]
+    Optional[str] or object
         The final commit message if the group is accepted or edited,
-        ``None`` if the group is declined.
+        ``None`` if the group is declined, or :data:`EDIT_DEFERRED`.
     """
-    click.echo(f"\n{'─'*60}")
-    click.echo(f"📦 Commit Group {group_num}/{total_groups}")
-    click.echo(f"{'─'*60}")
-    
-    click.echo(f"\n🏷️  Type: {click.style(group.type, fg='cyan', bold=True)}")
+    # Build the whole group preview and write it at once
+    lines = [
+        f"\n{'─'*60}",
+        f"📦 Commit Group {group_num}/{total_groups}",
+        f"{'─'*60}",
+        f"\n🏷️  Type: {click.style(group.type, fg='cyan', bold=True)}",
+        f"\n📄 Affected files ({len(group.files)}):",
+    ]
+    lines.extend(f"   • {file}" for file in group.files)
     
-    click.echo(f"\n📄 Affected files ({len(group.files)}):")
-    for file in group.files:
-        click.echo(f"   • {file}")
-    
-    click.echo(f"\n💬 Proposed commit message:")
-    click.echo("   ┌" + "─" * 56 + "┐")
+    lines.append(f"\n💬 Proposed commit message:")
+    lines.append("   ┌" + "─" * 56 + "┐")
     for line in group.message.splitlines():
         # Ensure line fits in box (truncate if needed)
         display_line = line[:54] if len(line) > 54 else line
-        click.echo(f"   │ {display_line.ljust(54)} │")
-    click.echo("   └" + "─" * 56 + "┘")
+        lines.append(f"   │ {display_line.ljust(54)} │")
+    lines.append("   └" + "─" * 56 + "┘")
+    lines.append("")
+    click.echo("\n".join(lines))
     
-    click.echo("")
     while True:
         choice = click.prompt(
             "   Choose action",
-            type=click.Choice(['A', 'E', 'D', 'a', 'e', 'd'], case_sensitive=False),
+            type=_REVIEW_CHOICE,
             default='A',
             show_choices=True,
             show_default=True,
         ).strip().lower()
         
-        if choice in {'a', 'accept'}:
+        if choice == 'a':
             print_success("Accepted commit group")
             return group.message
         
-        if choice in {'d', 'decline'}:
+        if choice == 'd':
             print_warning("Declined commit group")
             return None
         
-        if choice in {'e', 'edit'}:
+        if choice == 'e':
             # Open the user's editor if available
             editor = os.environ.get("EDITOR")
+            if editor and defer_edit:
+                print_info("Message will be opened in the editor after the review")
+                return EDIT_DEFERRED
             if editor:
-                import tempfile
-                import subprocess
-                
                 print_info("Opening editor...")
-                with tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".txt", encoding='utf-8') as tmp:
-                    tmp.write(group.message)
-                    tmp.flush()
-                    tmp_path = tmp.name
-                
                 try:
-                    subprocess.run([editor, tmp_path], check=True)
-                    with open(tmp_path, 'r', encoding='utf-8') as f:
-                        edited_message = f.read().strip()
-                    os.unlink(tmp_path)
-                    
-                    if edited_message:
-                        print_success("Message edited successfully")
-                        return edited_message
-                    else:
-                        print_warning("Empty message, using original")
-                        return group.message
+                    edited_message = _run_editor(editor, group.message).strip()
                 except Exception as e:
                     print_error(f"Editor failed: {e}")
-                    if os.path.exists(tmp_path):
-                        os.unlink(tmp_path)
                     continue
+                
+                if edited_message:
+                    print_success("Message edited successfully")
+                    return edited_message
+                else:
+                    print_warning("Empty message, using original")
+                    return group.message
             else:
                 click.echo("\n   💡 No EDITOR environment variable set.")
                 click.echo("   Enter your commit message below.")
@@ -360,6 +491,143 @@ def prompt_user(group: CommitGroup, group_num: int, total_groups: int) -> Option
                     return group.message
 
 
+def _review_groups(groups: List[CommitGroup]) -> Tuple[List[Tuple[CommitGroup, str]], List[CommitGroup]]:
+    """Ask the user to accept, edit or decline each commit group.
+
+    Messages to edit are collected and opened in ``$EDITOR`` together once
+    all groups have been reviewed.
+
+    Parameters
+    ----------
+    groups : List[CommitGroup]
+        The commit groups to review.
+
+    Returns
+    -------
+    Tuple[List[Tuple[CommitGroup, str]], List[CommitGroup]]
+        The accepted groups with their final messages, and the declined
+        groups.
+    """
+    accepted_groups: List[Tuple[CommitGroup, str]] = []
+    declined_groups: List[CommitGroup] = []
+    editor = os.environ.get("EDITOR")
+    # (position in accepted_groups, group number) of each group to edit
+    to_edit: List[Tuple[int, int]] = []
+    for idx, group in enumerate(groups, start=1):
+        message = prompt_user(group, idx, len(groups), defer_edit=bool(editor))
+        if message is None:
+            declined_groups.append(group)
+        elif message is EDIT_DEFERRED:
+            to_edit.append((len(accepted_groups), idx))
+            accepted_groups.append((group, group.message))
+        else:
+            accepted_groups.append((group, message))
+    if not to_edit:
+        return accepted_groups, declined_groups
+
+    edit_groups = [accepted_groups[pos][0] for pos, _ in to_edit]
+    edited = _edit_deferred(editor, edit_groups, [idx for _, idx in to_edit], len(groups))
+    for (pos, _), message in zip(to_edit, edited):
+        accepted_groups[pos] = (accepted_groups[pos][0], message)
+    declined_groups.extend(group for group, message in accepted_groups if message is None)
+    return [entry for entry in accepted_groups if entry[1] is not None], declined_groups
+
+
+def _edit_deferred(
+    editor: str, edit_groups: List[CommitGroup], group_nums: List[int], total_groups: int
+) -> List[Optional[str]]:
+    """Edit the messages of ``edit_groups`` in one editor session.
+
+    If the editor fails, each group is reviewed again with :func:`prompt_user`,
+    which may also decline it.
+
+    Returns
+    -------
+    List[Optional[str]]
+        The new message of each group, or None for groups declined in the
+        fallback review.
+    """
+    print_info(f"Opening editor for {len(edit_groups)} commit message{'s' if len(edit_groups) != 1 else ''}...")
+    try:
+        edited: List[Optional[str]] = list(edit_messages(editor, edit_groups))
+    except Exception as e:
+        print_error(f"Editor failed: {e}")
+        # Fall back to reviewing these groups one at a time
+        return [
+            prompt_user(group, group_num, total_groups)
+            for group, group_num in zip(edit_groups, group_nums)
+        ]
+    print_success("Messages edited successfully")
+    return edited
+
+
+def _commit_groups(
+    client: Any,
+    detected_vcs: str,
+    accepted_groups: List[Tuple[CommitGroup, str]],
+    changes: List[Any],
+    branch_created: bool,
+) -> None:
+    """Stage and commit each accepted group, then push Git commits once.
+
+    Parameters
+    ----------
+    client : GitClient or SVNClient
+        Client of the repository to commit to.
+    detected_vcs : str
+        ``"git"`` or ``"svn"``.
+    accepted_groups : List[Tuple[CommitGroup, str]]
+        The groups to commit with their messages.
+    changes : List[FileChange]
+        All changes of the working copy, used for the SVN file statuses.
+    branch_created : bool
+        Whether a new branch was created, so that the push sets its
+        upstream.
+
+    Raises
+    ------
+    click.exceptions.Exit
+        With ``EXIT_VCS_FAILURE`` if a commit or the push fails.
+    """
+    # Index change statuses once instead of scanning all changes per group
+    status_by_path = {change.path: change.status for change in changes}
+    
+    for idx, (group, message) in enumerate(accepted_groups, 1):
+        try:
+            with ProgressIndicator(f"Committing group {idx}/{len(accepted_groups)}: [{group.type}]"):
+                if detected_vcs == "git":
+                    # Stage and commit for Git; all commits are pushed
+                    # together once every group is committed
+                    client.stage_files(group.files)
+                    client.commit(message)
+                else:
+                    # For SVN, stage adds/deletes and commit
+                    statuses = {
+                        path: status_by_path[path]
+                        for path in group.files
+                        if path in status_by_path
+                    }
+                    client.stage_files(group.files, statuses=statuses)
+                    client.commit(message, group.files)
+            
+            print_success(f"Committed: [{group.type}] {len(group.files)} file(s)")
+            
+        except (GitError, SVNError) as exc:
+            print_error(f"Failed to commit changes: {exc}")
+            if detected_vcs == "git" and idx > 1:
+                print_info("Commits created so far have not been pushed", indent=1)
+            raise click.exceptions.Exit(EXIT_VCS_FAILURE)
+    
+    if detected_vcs == "git":
+        try:
+            with ProgressIndicator(f"Pushing {len(accepted_groups)} commit{'s' if len(accepted_groups) != 1 else ''}"):
+                # If we created a new branch, set upstream when pushing
+                client.push(set_upstream=branch_created)
+        except GitError as exc:
+            print_error(f"Failed to push changes: {exc}")
+            raise click.exceptions.Exit(EXIT_VCS_FAILURE)
+
+
 @click.command()
 @click.option("--yes", "yes", is_flag=True, help="Accept all generated commit groups without prompting.")
 @click.option("--vcs", type=click.Choice(["git", "svn"]), help="Force the VCS type (git or svn).")
@@ -397,28 +665,27 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
         current_step += 1
         print_step(current_step, total_steps, "Detecting Repository")
         
-        try:
-            detected_vcs, repo_root = detect_vcs(cwd) if vcs is None else (vcs, None)
-        except SystemExit:
-            raise click.exceptions.Exit(EXIT_NO_REPO)
-        
-        # If the user forced a VCS type, validate and find the repo root
         if vcs is not None:
+            # The user forced a VCS type: only look for that one
             with ProgressIndicator(f"Validating {vcs.upper()} repository"):
                 if vcs == "git":
                     repo_root = GitClient.find_repo_root(cwd)
-                    if not repo_root:
-                        print_error("Current directory is not inside a Git repository.")
-                        raise click.exceptions.Exit(EXIT_NO_REPO)
-                elif vcs == "svn":
+                else:
                     repo_root = SVNClient.find_repo_root(cwd)
-                    if not repo_root:
-                        print_error("Current directory is not inside an SVN working copy.")
-                        raise click.exceptions.Exit(EXIT_NO_REPO)
+            if not repo_root:
+                if vcs == "git":
+                    print_error("Current directory is not inside a Git repository.")
+                else:
+                    print_error("Current directory is not inside an SVN working copy.")
+                raise click.exceptions.Exit(EXIT_NO_REPO)
             detected_vcs = vcs
             print_success(f"Validated {detected_vcs.upper()} repository at: {repo_root}")
+        else:
+            try:
+                detected_vcs, repo_root = detect_vcs(cwd)
+            except SystemExit:
+                raise click.exceptions.Exit(EXIT_NO_REPO)
         
-        assert repo_root is not None
         logger.debug("Detected VCS: %s, root: %s", detected_vcs, repo_root)
         
         # Step 2: Load configuration
@@ -471,7 +738,9 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
         
         try:
             with ProgressIndicator("Scanning for modified files"):
-                changes = client.get_changes()
+                # Changes and diffs are obtained together to avoid one
+                # VCS invocation per changed file
+                changes, diffs = client.get_changes_with_diffs()
             
             if not changes:
                 print_warning("No changes detected to commit.")
@@ -480,10 +749,10 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
             print_success(f"Found {len(changes)} changed file{'s' if len(changes) != 1 else ''}")
             
             # Show changed files
-            for change in changes[:5]:  # Show first 5
-                print_info(f"{change.status} {change.path}", indent=1)
+            shown = [f"{change.status} {change.path}" for change in changes[:5]]  # Show first 5
             if len(changes) > 5:
-                print_info(f"... and {len(changes) - 5} more", indent=1)
+                shown.append(f"... and {len(changes) - 5} more")
+            print_info_batch(shown, indent=1)
             
         except (GitError, SVNError) as exc:
             print_error(f"VCS error: {exc}")
@@ -493,13 +762,13 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
         current_step += 1
         print_step(current_step, total_steps, "Extracting Diffs")
         
-        with ProgressIndicator(f"Reading diffs for {len(changes)} file(s)"):
-            diffs = extract_diffs(client, changes)
-        
         print_success(f"Extracted diffs for {len(diffs)} file(s)")
         
         # Calculate total diff size
-        total_lines = sum(len(diff.splitlines()) for diff in diffs.values())
+        total_lines = sum(
+            diff.count("\n") + (bool(diff) and not diff.endswith("\n"))
+            for diff in diffs.values()
+        )
         print_info(f"Total changes: ~{total_lines} lines", indent=1)
         
         # Step 7: Generate commit groups using LLM
@@ -515,11 +784,23 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
                     request_timeout=float(config.get("request_timeout", 60)),
                     max_tokens=config.get("max_tokens"),
                 )
+                # Open the connection now rather than on the first request
+                connected = ollama_client.warm_up()
             
-            print_success("Connected to LLM server")
+            if connected:
+                print_success("Connected to LLM server")
+            else:
+                print_warning("LLM server did not respond; continuing anyway")
             
-            with ProgressIndicator("Analyzing changes and generating messages (this may take a moment)"):
-                generator = CommitMessageGenerator(ollama_client)
+            with ProgressIndicator("Analyzing changes and generating messages (this may take a moment)") as progress:
+                generator = CommitMessageGenerator(
+                    ollama_client,
+                    cache_dir=get_llm_cache_directory(),
+                    early_stop=True,
+                    max_parallel_requests=config.get("max_concurrency", MAX_PARALLEL_REQUESTS),
+                    min_diff_lines_for_llm=config.get("min_diff_lines_for_llm", MIN_DIFF_LINES_FOR_LLM),
+                    on_fragment=StreamProgress(progress, "Generating commit messages"),
+                )
                 groups = generator.generate_groups(diffs)
             
             if not groups:
@@ -529,8 +810,13 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
             print_success(f"Generated {len(groups)} commit group{'s' if len(groups) != 1 else ''}")
             
             # Show group summary
-            for idx, group in enumerate(groups, 1):
-                print_info(f"Group {idx}: [{group.type}] - {len(group.files)} file(s)", indent=1)
+            print_info_batch(
+                [
+                    f"Group {idx}: [{group.type}] - {len(group.files)} file(s)"
+                    for idx, group in enumerate(groups, 1)
+                ],
+                indent=1,
+            )
             
         except LLMError as exc:
             print_error(f"LLM error: {exc}")
@@ -555,12 +841,7 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
             click.echo(f"\n📋 Please review {len(groups)} commit group{'s' if len(groups) != 1 else ''}:")
             click.echo(f"   A = Accept | E = Edit | D = Decline\n")
             
-            for idx, group in enumerate(groups, start=1):
-                message = prompt_user(group, idx, len(groups))
-                if message is None:
-                    declined_groups.append(group)
-                else:
-                    accepted_groups.append((group, message))
+            accepted_groups, declined_groups = _review_groups(groups)
         
         if not accepted_groups:
             print_warning("All commit groups were declined; no changes committed.")
@@ -571,26 +852,7 @@ def main(yes: bool, vcs: Optional[str], verbose: bool) -> None:
         click.echo(f"💾 Committing Changes")
         click.echo(f"{'='*60}\n")
         
-        for idx, (group, message) in enumerate(accepted_groups, 1):
-            try:
-                with ProgressIndicator(f"Committing group {idx}/{len(accepted_groups)}: [{group.type}]"):
-                    if detected_vcs == "git":
-                        # Stage, commit, and push for Git
-                        client.stage_files(group.files)
-                        client.commit(message)
-                        # If we created a new branch, set upstream when pushing
-                        client.push(set_upstream=branch_created)
-                    else:
-                        # For SVN, stage adds/deletes and commit
-                        statuses = {change.path: change.status for change in changes if change.path in group.files}
-                        client.stage_files(group.files, statuses=statuses)
-                        client.commit(message, group.files)
-                
-                print_success(f"Committed: [{group.type}] {len(group.files)} file(s)")
-                
-            except (GitError, SVNError) as exc:
-                print_error(f"Failed to commit/push changes: {exc}")
-                raise click.exceptions.Exit(EXIT_VCS_FAILURE)
+        _commit_groups(client, detected_vcs, accepted_groups, changes, branch_created)
         
         # Print final summary
         click.echo(f"\n{'='*60}")
@@ -6,4 +6,4 @@ the repository root. See :mod:`vc_commit_helper.config.loader` for
 implementation details.
 """
 
-from .loader import ConfigError, load_config  # noqa: F401
\ No newline at end of file
+from .loader import ConfigError, get_llm_cache_directory, load_config  # noqa: F401
\ No newline at end of file
@@ -15,7 +15,7 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,25 @@ if not logger.handlers:
     logger.propagate = False
 
 
+# Validated configurations by config file path, together with the
+# (modification time, size) of the file they were parsed from.
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Configuration keys as (key, required, accepted types, minimum value or
+# None, description used in the error message when a value has the wrong
+# type or is below the minimum). Type errors are reported in this order.
+_CONFIG_SCHEMA: Tuple[Tuple[str, bool, Any, Optional[int], str], ...] = (
+    ("base_url", True, str, None, "a string"),
+    ("port", True, int, None, "an integer"),
+    ("model", True, str, None, "a string"),
+    ("request_timeout", False, (int, float), None, "a number"),
+    ("max_tokens", False, int, None, "an integer"),
+    ("max_concurrency", False, int, 1, "a positive integer"),
+    ("min_diff_lines_for_llm", False, int, 0, "a non-negative integer"),
+)
+_MISSING = object()
+
+
 class ConfigError(Exception):
     """Raised when the Ollama configuration file is missing or invalid."""
 
@@ -53,13 +72,52 @@ def _get_config_directory() -> Path:
     return config_dir
 
 
+def get_llm_cache_directory() -> Path:
+    """Get the directory where LLM completions are cached.
+
+    Returns:
+        Path to the ~/.ollama_server/llm_cache/ directory.
+    """
+    return _get_config_directory() / "llm_cache"
+
+
+def _validate_config(data: Dict[str, Any]) -> None:
+    """Check ``data`` against :data:`_CONFIG_SCHEMA` in one pass.
+
+    Missing required keys are reported before type errors.
+
+    Raises:
+        ConfigError: If a required key is missing or a value is invalid.
+    """
+    missing = []
+    type_error: Optional[str] = None
+    for key, required, expected_type, minimum, description in _CONFIG_SCHEMA:
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            if required:
+                missing.append(key)
+        elif type_error is None and (
+            not isinstance(value, expected_type) or (minimum is not None and value < minimum)
+        ):
+            type_error = f"'{key}' must be {description}"
+    if missing:
+        logger.error("Configuration file missing required keys: %s", missing)
+        raise ConfigError(
+            f"Missing required configuration keys: {', '.join(missing)}"
+        )
+    if type_error is not None:
+        raise ConfigError(type_error)
+
+
 def load_config(repo_root: Optional[Path] = None) -> Dict[str, Any]:
     """Load the Ollama configuration from the user's home directory and return it.
 
     The configuration is read from a file named ``.ollama_config.json``
     located in the ``~/.ollama_server/`` directory. If the file is missing, 
     malformed, missing required keys, or has fields of the wrong type, a
-    :class:`ConfigError` is raised.
+    :class:`ConfigError` is raised. A validated configuration is cached
+    and returned again as long as the file's modification time and size
+    are unchanged.
     
     Args:
         repo_root: Deprecated parameter, kept for backward compatibility.
@@ -72,6 +130,9 @@ def load_config(repo_root: Optional[Path] = None) -> Dict[str, Any]:
         - model (str): The model name
         - request_timeout (int|float, optional): Request timeout in seconds
         - max_tokens (int, optional): Maximum tokens for generation
+        - max_concurrency (int, optional): Maximum concurrent LLM requests
+        - min_diff_lines_for_llm (int, optional): Changed lines below which a
+          group gets a template message instead of an LLM request
     
     Raises:
         ConfigError: If the configuration file is missing, malformed, or invalid.
@@ -79,46 +140,37 @@ def load_config(repo_root: Optional[Path] = None) -> Dict[str, Any]:
     config_dir = _get_config_directory()
     config_path = config_dir / ".ollama_config.json"
     
-    if not config_path.exists():
+    # A single stat both detects a missing file and provides the cache key
+    try:
+        stat = config_path.stat()
+        file_key: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
         logger.error("Configuration file '%s' does not exist", config_path)
         raise ConfigError(
             f"Missing Ollama configuration file: {config_path}. "
             f"Expected location: {config_dir}\n"
             f"Please run the installer again or create the config file manually."
-        )
+        ) from None
+    except OSError:
+        file_key = None
+    cached = _CONFIG_CACHE.get(config_path)
+    if file_key is not None and cached is not None and cached[0] == file_key:
+        # Copy so that callers cannot modify the cached configuration
+        return dict(cached[1])
     
     try:
-        content = config_path.read_text(encoding="utf-8")
-        data: Dict[str, Any] = json.loads(content)
-    except (OSError, json.JSONDecodeError) as exc:
+        # json.loads decodes UTF-8 bytes itself, without a separate str copy
+        data: Dict[str, Any] = json.loads(config_path.read_bytes())
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
         logger.error("Failed to read or parse configuration file: %s", exc)
         raise ConfigError(
             f"Invalid JSON in {config_path.name}: {exc}"  # type: ignore[str-bytes-safe]
         ) from exc
     
-    # Validate required keys
-    required_keys = ["base_url", "port", "model"]
-    missing = [key for key in required_keys if key not in data]
-    if missing:
-        logger.error("Configuration file missing required keys: %s", missing)
-        raise ConfigError(
-            f"Missing required configuration keys: {', '.join(missing)}"
-        )
-    
-    # Validate required key types
-    if not isinstance(data.get("base_url"), str):
-        raise ConfigError("'base_url' must be a string")
-    if not isinstance(data.get("port"), int):
-        raise ConfigError("'port' must be an integer")
-    if not isinstance(data.get("model"), str):
-        raise ConfigError("'model' must be a string")
-    
-    # Validate optional keys if present
-    if "request_timeout" in data and not isinstance(data["request_timeout"], (int, float)):
-        raise ConfigError("'request_timeout' must be a number")
-    if "max_tokens" in data and not isinstance(data["max_tokens"], int):
-        raise ConfigError("'max_tokens' must be an integer")
+    _validate_config(data)
     
     logger.debug("Loaded Ollama configuration from: %s", config_path)
     logger.debug("Configuration data: %s", data)
-    return data
\ No newline at end of file
+    if file_key is not None:
+        _CONFIG_CACHE[config_path] = (file_key, dict(data))
+    return data
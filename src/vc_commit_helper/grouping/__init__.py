@@ -7,4 +7,4 @@ and :mod:`vc_commit_helper.grouping.group_model` for details.
 """
 
 from .change_classifier import classify_change  # noqa: F401
-from .group_model import CommitGroup  # noqa: F401
\ No newline at end of file
+from .group_model import CommitGroup, DiffView  # noqa: F401
\ No newline at end of file
@@ -15,6 +15,58 @@ from pathlib import Path
 from typing import Iterable
 
 
+# Keyword patterns searched in the diff, compiled once at import
+_FIX_RE = re.compile(r"\bfix(e[ds])?|bug|error|issue|patch|hotfix\b", re.IGNORECASE)
+_REFACTOR_RE = re.compile(r"\brefactor\b", re.IGNORECASE)
+_PERF_RE = re.compile(r"\bperf(ormance)?\b", re.IGNORECASE)
+_FEAT_RE = re.compile(r"\bfeat(ure)?\b", re.IGNORECASE)
+_CODE_RE = re.compile(r"\bclass\b|\bdef\b|\bfunction\b", re.IGNORECASE)
+# Added/removed diff lines as (sign, text), skipping "++"/"--" header rows
+_CHANGED_LINE_RE = re.compile(r"^([+-])(?!\1)(.*)", re.MULTILINE)
+
+
+def _strip_whitespace(text: str) -> str:
+    """Remove all whitespace from ``text``.
+
+    Equivalent to ``re.sub(r"\\s", "", text)``: :meth:`str.split` splits on
+    the same Unicode whitespace characters, without a regex substitution.
+    """
+    return "".join(text.split())
+
+
+def _is_whitespace_only(diff: str) -> bool:
+    """Return True if the changed lines of ``diff`` only modify whitespace.
+
+    Added and removed lines (ignoring the diff header prefixes) are
+    normalized by stripping all whitespace in a single pass; the regex scan
+    skips context lines without creating a string for them.
+    """
+    norm_minus_parts = []
+    norm_plus_parts = []
+    # Normalized length of removed minus added content
+    length_difference = 0
+    for sign, text in _CHANGED_LINE_RE.findall(diff):
+        stripped = _strip_whitespace(text)
+        if sign == "-":
+            norm_minus_parts.append(stripped)
+            length_difference += len(stripped)
+        else:
+            norm_plus_parts.append(stripped)
+            length_difference -= len(stripped)
+    if not norm_minus_parts and not norm_plus_parts:
+        return False
+    # Detect pure whitespace changes. If the non-whitespace content of added and
+    # removed lines is identical, treat this as a formatting/style change.
+    # Contents of different length cannot match, so they are only
+    # joined and compared when the lengths agree.
+    if norm_minus_parts and norm_plus_parts and length_difference == 0:
+        if "".join(norm_minus_parts) == "".join(norm_plus_parts):
+            return True
+    # Fallback: if every changed line becomes empty when whitespace is removed
+    # classify as style (covers blank line additions/removals)
+    return not any(norm_minus_parts) and not any(norm_plus_parts)
+
+
 def classify_change(file_path: str, diff: str) -> str:
     """Classify a change into a Conventional Commit type.
 
@@ -53,39 +105,26 @@ def classify_change(file_path: str, diff: str) -> str:
         if ".github" in path.parts:
             return "ci"
         return "build"
+    # An empty diff (e.g. a mode change) has no content to inspect
+    if not diff:
+        return "other"
     # Style changes: detect formatting-only changes by checking diff for changes
-    # to whitespace only. If all changed lines only modify whitespace, classify as style.
-    # Collect added and removed lines (ignoring the diff header prefixes)
-    changed_lines = [line for line in diff.splitlines() if line.startswith(('+', '-')) and not line.startswith(('++', '--'))]
-    if changed_lines:
-        # Detect pure whitespace changes. If the non-whitespace content of added and
-        # removed lines is identical, treat this as a formatting/style change.
-        minus_lines = [line[1:] for line in changed_lines if line.startswith('-')]
-        plus_lines = [line[1:] for line in changed_lines if line.startswith('+')]
-        if minus_lines and plus_lines:
-            # Normalize by stripping all whitespace characters
-            norm_minus = "".join(re.sub(r"\s", "", ln) for ln in minus_lines)
-            norm_plus = "".join(re.sub(r"\s", "", ln) for ln in plus_lines)
-            if norm_minus == norm_plus:
-                return "style"
-        # Fallback: if every changed line becomes empty when whitespace is removed
-        # classify as style (covers blank line additions/removals)
-        stripped = [re.sub(r"\s", "", l[1:]) for l in changed_lines]
-        if all(not s for s in stripped):
-            return "style"
+    # to whitespace only
+    if _is_whitespace_only(diff):
+        return "style"
     # Fix detection based on keywords
-    if re.search(r"\bfix(e[ds])?|bug|error|issue|patch|hotfix\b", diff, re.IGNORECASE):
+    if _FIX_RE.search(diff):
         return "fix"
     # Refactor detection: look for keyword and absence of new features
-    if re.search(r"\brefactor\b", diff, re.IGNORECASE):
+    if _REFACTOR_RE.search(diff):
         return "refactor"
     # Performance optimisation
-    if re.search(r"\bperf(ormance)?\b", diff, re.IGNORECASE):
+    if _PERF_RE.search(diff):
         return "perf"
     # Feature additions: presence of the word "feature" or addition of function definitions/classes
-    if re.search(r"\bfeat(ure)?\b", diff, re.IGNORECASE):
+    if _FEAT_RE.search(diff):
         return "feat"
-    if re.search(r"\bclass\b|\bdef\b|\bfunction\b", diff, re.IGNORECASE) and '+' in diff:
+    if _CODE_RE.search(diff) and '+' in diff:
         # Added new code structures
         return "feat"
     # Default
@@ -9,13 +9,51 @@ a list of affected files, and a proposed commit message.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Iterator, List, Mapping
 
 
-@dataclass
+class DiffView(Mapping[str, str]):
+    """Read-only view of the diffs of a subset of files.
+
+    Groups produced from one diff mapping share it instead of each holding
+    a copy restricted to its own files.
+
+    Parameters
+    ----------
+    diffs : Mapping[str, str]
+        Mapping of all file paths to their unified diffs.
+    files : List[str]
+        Files visible through the view, in iteration order.
+    """
+
+    __slots__ = ("_diffs", "_files", "_file_set")
+
+    def __init__(self, diffs: Mapping[str, str], files: List[str]) -> None:
+        self._diffs = diffs
+        self._files = files
+        self._file_set = frozenset(files)
+
+    def __getitem__(self, file_path: str) -> str:
+        if file_path not in self._file_set:
+            raise KeyError(file_path)
+        return self._diffs[file_path]
+
+    def __iter__(self) -> Iterator[str]:
+        return (file_path for file_path in self._files if file_path in self._diffs)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"DiffView({dict(self)!r})"
+
+
+@dataclass(slots=True)
 class CommitGroup:
     """Representation of a grouped commit.
 
+    Instances use ``__slots__`` instead of a per-instance ``__dict__``.
+
     Attributes
     ----------
     type : str
@@ -24,11 +62,12 @@ class CommitGroup:
         List of files included in the group.
     message : str
         Proposed commit message.
-    diffs : Dict[str, str]
-        Mapping of file paths to their unified diffs.
+    diffs : Mapping[str, str]
+        Mapping of file paths to their unified diffs; a plain dict or a
+        :class:`DiffView`.
     """
 
     type: str
     files: List[str]
     message: str
-    diffs: Dict[str, str] = field(default_factory=dict)
\ No newline at end of file
+    diffs: Mapping[str, str] = field(default_factory=dict)
\ No newline at end of file
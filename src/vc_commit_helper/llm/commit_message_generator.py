@@ -20,13 +20,19 @@ All commit messages follow the format:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
 from textwrap import dedent
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from vc_commit_helper.grouping.change_classifier import classify_change
-from vc_commit_helper.grouping.group_model import CommitGroup
+from vc_commit_helper.grouping.group_model import CommitGroup, DiffView
 from vc_commit_helper.llm.ollama_client import LLMError, OllamaClient
 
 
@@ -38,14 +44,234 @@ if not logger.handlers:
     logger.propagate = False
 
 
+# Default upper bound for concurrent LLM requests issued by generate_groups.
+MAX_PARALLEL_REQUESTS = 8
+
+# Number of added/removed lines per file included in a prompt.
+PROMPT_DIFF_LINES = 20
+
+# Default minimum number of changed lines for a group to be sent to the
+# LLM; groups without any changed line get a template message.
+MIN_DIFF_LINES_FOR_LLM = 1
+
+# Upper bound for the number of completions kept in the disk cache. The
+# least recently used entries are removed after each generate_groups call.
+MAX_CACHE_ENTRIES = 1000
+
+# Memoized classification results keyed by file path and a digest of the
+# diff, so repeated runs over unchanged diffs skip the heuristics. Cleared
+# when it grows beyond _CLASSIFY_CACHE_MAX_SIZE entries.
+_CLASSIFY_CACHE_MAX_SIZE = 4096
+_classify_cache: Dict[Tuple[str, bytes], str] = {}
+
+
+def _prune_cache(cache_dir: Path, max_entries: int) -> None:
+    """Remove the least recently used cache files beyond ``max_entries``."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.stat().st_mtime_ns, entry.path) for entry in it if entry.name.endswith(".txt")]
+    except OSError as exc:
+        logger.debug("Could not list LLM cache directory %s: %s", cache_dir, exc)
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError as exc:
+            logger.debug("Could not remove LLM cache file %s: %s", path, exc)
+
+
+def _classify_cached(file_path: str, diff: str) -> str:
+    """Return ``classify_change(file_path, diff)``, memoized per diff digest."""
+    digest = hashlib.blake2b(diff.encode("utf-8", "replace"), digest_size=16).digest()
+    key = (file_path, digest)
+    commit_type = _classify_cache.get(key)
+    if commit_type is None:
+        if len(_classify_cache) >= _CLASSIFY_CACHE_MAX_SIZE:
+            _classify_cache.clear()
+        commit_type = _classify_cache[key] = classify_change(file_path, diff)
+    return commit_type
+
+
+# Leading commit type prefix such as "[feat]: " or "fix: " in LLM output.
+_TYPE_PREFIX_RE = re.compile(
+    r"^\[?(feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert|other)\]?:\s+",
+    re.IGNORECASE,
+)
+
+# Added/removed lines of a unified diff, excluding the ``+++``/``---``
+# file headers. Only a doubled sign marks a header, so lines such as
+# ``+- item`` are kept.
+_DIFF_LINE_RE = re.compile(r"^([+-])(?!\1).*", re.MULTILINE)
+# The same selection for diffs given as individual lines: a leading sign
+# that is not doubled
+_DIFF_SIGNS = frozenset("+-")
+_DIFF_HEADER_PREFIXES = frozenset(("++", "--"))
+
+
+def _changed_lines(diff_lines: Union[str, Iterable[str]], limit: int) -> List[str]:
+    """Return up to ``limit`` added/removed lines of a diff.
+
+    ``diff_lines`` may be the diff text or an iterable of its lines, such as
+    :meth:`GitClient.iter_diff_lines`; both select lines starting with
+    ``+`` or ``-`` but not with ``++`` or ``--``. Scanning stops once
+    ``limit`` lines were collected, so the rest of a large diff is never
+    split or read.
+    """
+    if isinstance(diff_lines, str):
+        changed = (match.group().rstrip("\r") for match in _DIFF_LINE_RE.finditer(diff_lines))
+    else:
+        changed = (
+            line
+            for line in diff_lines
+            if line[:1] in _DIFF_SIGNS and line[:2] not in _DIFF_HEADER_PREFIXES
+        )
+    return list(islice(changed, limit))
+
+
+def _message_complete(text: str, files: List[str]) -> bool:
+    """Return True if ``text`` has a subject line followed by all ``files``.
+
+    The prompt asks for the affected files as ``- path`` lines at the end
+    of the message, so once every file was listed after a ``[type]:``
+    subject, anything the model produces afterwards is discarded anyway.
+    """
+    remaining = set(files)
+    subject_seen = False
+    for line in text.splitlines():
+        line = line.strip()
+        if not subject_seen:
+            subject_seen = _TYPE_PREFIX_RE.match(line) is not None
+        elif line.startswith("- "):
+            remaining.discard(line[2:].strip())
+    return subject_seen and not remaining
+
+
 class CommitMessageGenerator:
     """Generate commit groups and messages using heuristic classification and an LLM."""
 
     def __init__(
         self,
         ollama_client: OllamaClient,
+        cache_dir: Optional[Path] = None,
+        parallel: bool = True,
+        min_diff_lines_for_llm: int = MIN_DIFF_LINES_FOR_LLM,
+        early_stop: bool = False,
+        max_parallel_requests: int = MAX_PARALLEL_REQUESTS,
+        on_fragment: Optional[Callable[[str], None]] = None,
     ) -> None:
+        """Create a generator.
+
+        Parameters
+        ----------
+        ollama_client : OllamaClient
+            Client used to request completions from the LLM.
+        cache_dir : Path, optional
+            Directory for caching LLM completions on disk, keyed by a hash
+            of the model, token limit and prompt. At most
+            :data:`MAX_CACHE_ENTRIES` completions are kept; the least
+            recently used ones are removed. Only completions with a subject
+            line that list all of the group's files are cached. Caching is
+            disabled when not provided.
+        parallel : bool, optional
+            If True (the default), messages for different groups are
+            requested from the LLM concurrently. Set to False to issue the
+            requests one after another, e.g. for debugging.
+        min_diff_lines_for_llm : int, optional
+            Groups whose diffs add or remove fewer lines than this (e.g.
+            only empty or one-line diffs) get the deterministic fallback
+            message without querying the LLM. The default of 1 only skips
+            groups without any changed line; 0 always queries the LLM.
+        early_stop : bool, optional
+            If True, completions are streamed with
+            :meth:`OllamaClient.generate_stream` and the request is closed
+            as soon as the response contains a subject line followed by
+            all of the group's files, instead of waiting for the model to
+            finish any trailing commentary.
+        max_parallel_requests : int, optional
+            Upper bound for concurrent LLM requests when ``parallel`` is
+            True. Ollama queues requests beyond the server's own
+            parallelism, so this can be lowered to match it.
+        on_fragment : callable, optional
+            Called with each piece of text as it is streamed from the LLM,
+            e.g. to report progress. Completions are streamed whenever this
+            is given. With parallel requests it is called from worker
+            threads, and fragments of different groups interleave.
+        """
         self.ollama_client = ollama_client
+        self.cache_dir = cache_dir
+        self.parallel = parallel
+        self.min_diff_lines_for_llm = min_diff_lines_for_llm
+        self.early_stop = early_stop
+        self.max_parallel_requests = max(1, max_parallel_requests)
+        self.on_fragment = on_fragment
+
+    def _cache_path(self, prompt: str) -> Path:
+        """Return the cache file for ``prompt`` under :attr:`cache_dir`."""
+        key = hashlib.blake2b(digest_size=20)
+        for part in (
+            str(getattr(self.ollama_client, "model", "")),
+            str(getattr(self.ollama_client, "max_tokens", "")),
+            prompt,
+        ):
+            key.update(part.encode("utf-8", "replace"))
+            key.update(b"\0")
+        return self.cache_dir / f"{key.hexdigest()}.txt"
+
+    def _request(self, prompt: str, files: List[str]) -> str:
+        """Request a completion, stopping early once the message is complete."""
+        if not self.early_stop and self.on_fragment is None:
+            return self.ollama_client.generate(prompt)
+        parts: List[str] = []
+        stream = self.ollama_client.generate_stream(prompt)
+        try:
+            for fragment in stream:
+                parts.append(fragment)
+                if self.on_fragment is not None:
+                    self.on_fragment(fragment)
+                # Only a finished line can complete the file list
+                if self.early_stop and "\n" in fragment and _message_complete("".join(parts), files):
+                    logger.debug("Commit message complete; closing LLM stream early.")
+                    break
+        finally:
+            stream.close()
+        return "".join(parts).strip()
+
+    def _generate(self, prompt: str, files: List[str]) -> str:
+        """Return the LLM completion for ``prompt``, using the disk cache if enabled."""
+        if self.cache_dir is None:
+            return self._request(prompt, files)
+        cache_path = self._cache_path(prompt)
+        try:
+            cached = cache_path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        else:
+            try:
+                # Mark the entry as recently used for _prune_cache
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return cached
+        response = self._request(prompt, files)
+        if not _message_complete(response, files):
+            # Do not keep an empty, truncated or malformed answer, which
+            # would otherwise be returned for this prompt on every run
+            logger.debug("Not caching incomplete LLM response for %s", files)
+            return response
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial content
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(response)
+            os.replace(tmp.name, cache_path)
+        except OSError as exc:
+            logger.debug("Could not write LLM cache file %s: %s", cache_path, exc)
+        return response
 
     def _build_prompt(self, group_type: str, files: List[str], diffs: Dict[str, str]) -> str:
         """Construct a prompt for the LLM to generate a commit message.
@@ -61,8 +287,8 @@ class CommitMessageGenerator:
             diff_text = diffs.get(file, "")
             if diff_text:
                 # Include more context lines (up to 20) to help LLM understand functionality
-                lines = [line for line in diff_text.splitlines() if line.startswith(('+', '-')) and not line.startswith(('++', '--'))]
-                context_lines = "\n".join(lines[:20]) if lines else "(no changes)"
+                lines = _changed_lines(diff_text, PROMPT_DIFF_LINES)
+                context_lines = "\n".join(lines) if lines else "(no changes)"
                 diff_parts.append(f"File: {file}\n{context_lines}")
             else:
                 diff_parts.append(f"File: {file}\n(no diff available)")
@@ -229,37 +455,75 @@ class CommitMessageGenerator:
         if not message or not message.strip():
             raise ValueError("Empty message")
         
-        lines = message.splitlines()
-        if not lines:
-            raise ValueError("No lines in message")
-        
-        subject_line = lines[0].strip()
+        # Only the subject line is inspected; the body is kept as is and
+        # only copied when the subject has to be rewritten
+        end = message.find("\n")
+        subject_line = (message if end < 0 else message[:end]).strip()
         
         # Check if the message already starts with any commit type (not just the expected one)
-        any_type_pattern = r'^\[?(feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert|other)\]?:\s+'
-        existing_type_match = re.match(any_type_pattern, subject_line, re.IGNORECASE)
+        existing_type_match = _TYPE_PREFIX_RE.match(subject_line)
         
         if existing_type_match:
             # Message already has a type prefix
-            existing_type = existing_type_match.group(1).lower()
-            
-            # If it matches our expected type (or close enough), normalize the format
-            if existing_type == group_type.lower():
-                # Already has correct type, just ensure format is [type]:
-                if re.match(rf'^\[{re.escape(group_type)}\]:\s+', subject_line, re.IGNORECASE):
-                    # Already in correct format
-                    return message
-                # Fix the format
-                rest_of_line = re.sub(any_type_pattern, '', subject_line, flags=re.IGNORECASE).strip()
-                return f"[{group_type}]: {rest_of_line}\n" + "\n".join(lines[1:])
-            else:
-                # LLM suggested a different type than our classification
-                # Replace with the classified type
-                rest_of_line = re.sub(any_type_pattern, '', subject_line, flags=re.IGNORECASE).strip()
-                return f"[{group_type}]: {rest_of_line}\n" + "\n".join(lines[1:])
+            if (
+                existing_type_match.group(1).lower() == group_type.lower()
+                and subject_line.startswith(f"[{existing_type_match.group(1)}]:")
+            ):
+                # Already in correct format
+                return message
+            # Fix the format, replacing a type the LLM suggested that differs
+            # from our classification with the classified type
+            subject_line = subject_line[existing_type_match.end():].strip()
         
-        # No type prefix found, prepend the classified type
-        return f"[{group_type}]: {subject_line}\n" + "\n".join(lines[1:])
+        # Prepend the classified type to the subject
+        body = "" if end < 0 else message[end:]
+        return f"[{group_type}]: {subject_line}{body}"
+
+    def _is_trivial(self, files: List[str], diffs: Dict[str, str]) -> bool:
+        """Return True if the group's diffs are too small to need the LLM."""
+        remaining = self.min_diff_lines_for_llm
+        for file in files:
+            if remaining <= 0:
+                return False
+            remaining -= len(_changed_lines(diffs.get(file, ""), remaining))
+        return remaining > 0
+
+    def _generate_group_message(self, group_type: str, files: List[str], diffs: Dict[str, str]) -> str:
+        """Generate the commit message for one group, falling back on LLM errors."""
+        if self._is_trivial(files, diffs):
+            logger.debug("Trivial diff for group '%s'; using template message.", group_type)
+            return self._fallback_message(group_type, files)
+        try:
+            prompt = self._build_prompt(group_type, files, diffs)
+            raw_message = self._generate(prompt, files)
+            # Extract the actual commit message, removing any thinking process
+            message = self._extract_commit_message(raw_message)
+            # Normalize the message to ensure correct format
+            return self._normalize_message(message, group_type)
+        except (LLMError, Exception) as exc:
+            logger.warning(
+                "LLM failed to generate commit message for group '%s': %s; using fallback.",
+                group_type,
+                exc,
+            )
+        return self._fallback_message(group_type, files)
+
+    @staticmethod
+    def _fallback_message(group_type: str, files: List[str]) -> str:
+        """Return the deterministic message used when the LLM is not queried."""
+        # Fallback: concise message following the new format
+        # Line 1: [type]: brief description
+        # Line 2: blank
+        # Lines 3-4: functional description
+        # Line 5: blank
+        # Lines 6+: file list
+        subject = f"[{group_type}]: Changes to {len(files)} file{'s' if len(files) != 1 else ''}"
+        description = (
+            "Updated the following files to address functionality improvements and "
+            "maintain code quality. Review the affected files for specific changes."
+        )
+        body_lines = [f"- {file}" for file in files]
+        return subject + "\n\n" + description + "\n\n" + "\n".join(body_lines)
 
     def generate_groups(
         self,
@@ -281,35 +545,23 @@ class CommitMessageGenerator:
         # Classify each file
         groups: Dict[str, List[str]] = {}
         for file_path, diff in diffs.items():
-            commit_type = classify_change(file_path, diff)
+            commit_type = _classify_cached(file_path, diff)
             groups.setdefault(commit_type, []).append(file_path)
+
+        def group_message(item: Tuple[str, List[str]]) -> str:
+            return self._generate_group_message(item[0], item[1], diffs)
+
+        if self.parallel and len(groups) > 1:
+            # LLM requests are network-bound and independent; run them
+            # concurrently. ``map`` keeps the results in group order.
+            max_workers = min(len(groups), self.max_parallel_requests)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                messages = list(executor.map(group_message, groups.items()))
+        else:
+            messages = [group_message(item) for item in groups.items()]
         commit_groups: List[CommitGroup] = []
-        for group_type, files in groups.items():
-            try:
-                prompt = self._build_prompt(group_type, files, diffs)
-                raw_message = self.ollama_client.generate(prompt)
-                # Extract the actual commit message, removing any thinking process
-                message = self._extract_commit_message(raw_message)
-                # Normalize the message to ensure correct format
-                message = self._normalize_message(message, group_type)
-            except (LLMError, Exception) as exc:
-                logger.warning(
-                    "LLM failed to generate commit message for group '%s': %s; using fallback.",
-                    group_type,
-                    exc,
-                )
-                # Fallback: concise message following the new format
-                # Line 1: [type]: brief description
-                # Line 2: blank
-                # Lines 3-4: functional description
-                # Line 5: blank
-                # Lines 6+: file list
-                subject = f"[{group_type}]: Changes to {len(files)} file{'s' if len(files) != 1 else ''}"
-                description = (
-                    "Updated the following files to address functionality improvements and "
-                    "maintain code quality. Review the affected files for specific changes."
-                )
-                body_lines = [f"- {file}" for file in files]
-                message = subject + "\n\n" + description + "\n\n" + "\n".join(body_lines)
-            commit_groups.append(CommitGroup(type=group_type, files=files, message=message, diffs={file: diffs[file] for file in files}))
-        return commit_groups
\ No newline at end of file
+        for (group_type, files), message in zip(groups.items(), messages):
+            commit_groups.append(CommitGroup(type=group_type, files=files, message=message, diffs=DiffView(diffs, files)))
+        if self.cache_dir is not None:
+            _prune_cache(self.cache_dir, MAX_CACHE_ENTRIES)
+        return commit_groups
@@ -2,19 +2,19 @@
 Client for interacting with an Ollama LLM server.
 
 This client wraps HTTP requests to the Ollama REST API. It supports
-making text generation requests via the `/api/generate` endpoint. On
-error conditions (HTTP errors, timeouts), a :class:`LLMError` is
-raised.
+making text generation requests via the `/api/generate` endpoint. All
+requests of a client share one HTTP session, so connections to the
+server are kept alive between requests. On error conditions (HTTP
+errors, timeouts), a :class:`LLMError` is raised.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
-
-import requests
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,14 @@ if not logger.handlers:
     logger.propagate = False
 
 
+# Guards the lazy creation of OllamaClient sessions by concurrent requests
+_SESSION_LOCK = threading.Lock()
+
+# Upper bound in seconds for the warm-up request, which should not hold up
+# the CLI for the full request timeout when the server is unreachable
+WARM_UP_TIMEOUT = 5.0
+
+
 class LLMError(Exception):
     """Raised when communication with the LLM server fails."""
 
@@ -55,10 +63,102 @@ class OllamaClient:
     model: str
     request_timeout: float = 60.0
     max_tokens: Optional[int] = None
+    _session: Any = field(default=None, init=False, repr=False, compare=False)
 
     def _endpoint(self) -> str:
         return f"{self.base_url}:{self.port}/api/generate"
 
+    def _get_session(self) -> Any:
+        """Return the HTTP session of this client, creating it on first use.
+
+        Reusing one :class:`requests.Session` keeps the TCP connection to
+        the server open between generation requests instead of opening a
+        new one per request. The session's connection pool is shared
+        safely by the generator's worker threads.
+        """
+        if self._session is None:
+            with _SESSION_LOCK:
+                if self._session is None:
+                    self._session = self._requests().Session()
+        return self._session
+
+    def _payload(self, prompt: str, stream: bool) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+        }
+        # Additional options
+        options: Dict[str, Any] = {}
+        if self.max_tokens is not None:
+            options["num_predict"] = self.max_tokens
+        if options:
+            payload["options"] = options
+        return payload
+
+    @staticmethod
+    def _requests() -> Any:
+        """Return the :mod:`requests` module, importing it on first use.
+
+        Importing ``requests`` (and urllib3) takes longer than importing the
+        rest of the CLI, so it is deferred until a completion is requested;
+        ``aicheckin --help`` and ``--version`` never need it.
+        """
+        import requests
+
+        return requests
+
+    @staticmethod
+    def _check_status(response: Any) -> None:
+        """Raise :class:`LLMError` unless ``response`` has status 200."""
+        if response.status_code != 200:
+            logger.error(
+                "LLM returned non-200 status %s: %s", response.status_code, response.text
+            )
+            raise LLMError(f"LLM returned status {response.status_code}: {response.text}")
+
+    @staticmethod
+    def _parse_stream_line(line: bytes) -> Dict[str, Any]:
+        """Decode one line of a streamed response.
+
+        Raises
+        ------
+        LLMError
+            If the line is not valid JSON or reports a server error.
+        """
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            logger.error("Failed to parse LLM response: %s", exc)
+            raise LLMError("Failed to parse LLM response") from exc
+        if "error" in data:
+            raise LLMError(f"LLM returned an error: {data['error']}")
+        return data
+
+    def warm_up(self) -> bool:
+        """Open a connection to the server before the first generation.
+
+        Sends a request to ``/api/tags`` so that connection setup happens
+        while the CLI reports that it is connecting rather than on the
+        first generation request. Failures are not raised; they surface
+        again, as :class:`LLMError`, when a completion is requested.
+
+        Returns
+        -------
+        bool
+            True if the server answered with status 200.
+        """
+        requests = self._requests()
+        url = f"{self.base_url}:{self.port}/api/tags"
+        try:
+            response = self._get_session().get(
+                url, timeout=min(self.request_timeout, WARM_UP_TIMEOUT)
+            )
+        except requests.RequestException as exc:
+            logger.debug("LLM server warm-up at %s failed: %s", url, exc)
+            return False
+        return response.status_code == 200
+
     def generate(self, prompt: str, stream: bool = False) -> str:
         """Generate a completion from the model.
 
@@ -80,21 +180,12 @@ class OllamaClient:
         LLMError
             If the request fails or the server returns an error.
         """
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-        }
-        # Additional options
-        options: Dict[str, Any] = {}
-        if self.max_tokens is not None:
-            options["num_predict"] = self.max_tokens
-        if options:
-            payload["options"] = options
+        requests = self._requests()
+        payload = self._payload(prompt, stream=False)
         url = self._endpoint()
         logger.debug("Sending request to LLM at %s with payload: %s", url, payload)
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 url,
                 json=payload,
                 timeout=self.request_timeout,
@@ -102,11 +193,7 @@ class OllamaClient:
         except (requests.RequestException, Exception) as exc:
             logger.error("Failed to connect to LLM: %s", exc)
             raise LLMError(str(exc)) from exc
-        if response.status_code != 200:
-            logger.error(
-                "LLM returned non-200 status %s: %s", response.status_code, response.text
-            )
-            raise LLMError(f"LLM returned status {response.status_code}: {response.text}")
+        self._check_status(response)
         try:
             data = response.json()
         except json.JSONDecodeError as exc:
@@ -120,4 +207,58 @@ class OllamaClient:
         if "message" in data and isinstance(data["message"], dict):
             return data["message"].get("content", "").strip()
         # If none of the expected fields are present, raise an error
-        raise LLMError("Unexpected response structure from LLM")
\ No newline at end of file
+        raise LLMError("Unexpected response structure from LLM")
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """Generate a completion and yield it piece by piece as it arrives.
+
+        Uses the streaming mode of ``/api/generate``, in which the server
+        sends one JSON object per line. Closing the generator before the
+        completion is done closes the HTTP connection, which makes the
+        server stop generating.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt to send to the model.
+
+        Yields
+        ------
+        str
+            Consecutive fragments of the generated text.
+
+        Raises
+        ------
+        LLMError
+            If the request fails or the server returns an error.
+        """
+        requests = self._requests()
+        payload = self._payload(prompt, stream=True)
+        url = self._endpoint()
+        logger.debug("Sending streaming request to LLM at %s with payload: %s", url, payload)
+        try:
+            response = self._get_session().post(
+                url,
+                json=payload,
+                timeout=self.request_timeout,
+                stream=True,
+            )
+        except (requests.RequestException, Exception) as exc:
+            logger.error("Failed to connect to LLM: %s", exc)
+            raise LLMError(str(exc)) from exc
+        try:
+            self._check_status(response)
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = self._parse_stream_line(line)
+                    if data.get("response"):
+                        yield data["response"]
+                    if data.get("done"):
+                        return
+            except requests.RequestException as exc:
+                logger.error("LLM stream failed: %s", exc)
+                raise LLMError(str(exc)) from exc
+        finally:
+            response.close()
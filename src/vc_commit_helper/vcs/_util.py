@@ -0,0 +1,19 @@
+"""
+Helpers shared by the Git and SVN clients.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List
+
+
+# Upper bound for the number of paths passed to a single git or svn
+# invocation. Keeps command lines well below the Windows limit of 32767
+# characters.
+MAX_PATHS_PER_COMMAND = 100
+
+
+def _chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield successive slices of ``items`` with at most ``size`` entries."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,101 @@
+"""
+Repository detection shared by the VCS clients and the CLI.
+
+Finding a repository root means walking from the working directory up to
+the filesystem root and looking for ``.git``/``.svn`` metadata. Each
+directory is listed once with :func:`os.scandir` and checked for all
+requested markers, instead of issuing one ``stat`` per marker and level.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+#: Name of the metadata entry that marks the root of each supported VCS.
+VCS_MARKERS: Dict[str, str] = {"git": ".git", "svn": ".svn"}
+
+
+def _marker_entries(directory: Path, markers: Iterable[str]) -> Set[str]:
+    """Return the subset of ``markers`` present in ``directory``.
+
+    Falls back to per-marker ``exists`` checks when the directory cannot
+    be listed (e.g. it is traversable but not readable).
+    """
+    wanted = set(markers)
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.name in wanted}
+    except OSError:
+        return {marker for marker in wanted if (directory / marker).exists()}
+
+
+@functools.lru_cache(maxsize=256)
+def _find_vcs_roots(start: Path, vcs_types: Tuple[str, ...]) -> Tuple[Tuple[str, Path], ...]:
+    pending = {VCS_MARKERS[vcs_type]: vcs_type for vcs_type in vcs_types}
+    found = []
+    current = start
+    while pending:
+        for marker in _marker_entries(current, pending):
+            found.append((pending.pop(marker), current))
+        if current.parent == current:
+            # reached filesystem root
+            break
+        current = current.parent
+    return tuple(found)
+
+
+def _git_root_from_environment() -> Optional[Path]:
+    """Return the work tree root named by Git's environment, if any.
+
+    Git sets ``GIT_WORK_TREE`` and/or ``GIT_DIR`` for hooks and other
+    commands it spawns. ``GIT_DIR`` only identifies the work tree when it
+    is a regular ``.git`` directory; other layouts (bare repositories,
+    linked worktrees) fall back to the directory walk.
+    """
+    work_tree = os.environ.get("GIT_WORK_TREE")
+    if work_tree and Path(work_tree).is_dir():
+        return Path(work_tree).resolve()
+    git_dir = os.environ.get("GIT_DIR")
+    if git_dir:
+        git_path = Path(git_dir).resolve()
+        if git_path.name == VCS_MARKERS["git"] and git_path.is_dir():
+            return git_path.parent
+    return None
+
+
+def find_vcs_roots(start: Path, vcs_types: Tuple[str, ...] = ("git", "svn")) -> Dict[str, Path]:
+    """Find the nearest repository root of each VCS type above ``start``.
+
+    Parameters
+    ----------
+    start : Path
+        Directory from which to start searching.
+    vcs_types : tuple of str, optional
+        VCS types to look for; keys of :data:`VCS_MARKERS`.
+
+    Returns
+    -------
+    Dict[str, Path]
+        Mapping of VCS type to repository root. Types whose metadata was
+        not found are omitted. Results are memoized per resolved start
+        directory.
+
+    Notes
+    -----
+    When Git's ``GIT_WORK_TREE`` or ``GIT_DIR`` environment variables
+    identify the work tree (e.g. inside a Git hook), it is used as the Git
+    root without walking the parent directories.
+    """
+    roots: Dict[str, Path] = {}
+    if "git" in vcs_types:
+        git_root = _git_root_from_environment()
+        if git_root is not None:
+            roots["git"] = git_root
+            vcs_types = tuple(vcs_type for vcs_type in vcs_types if vcs_type != "git")
+    if vcs_types:
+        roots.update(_find_vcs_roots(start.resolve(), tuple(vcs_types)))
+    return roots
@@ -14,7 +14,10 @@ import os
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from vc_commit_helper.vcs._util import MAX_PATHS_PER_COMMAND, _chunked
+from vc_commit_helper.vcs.detection import find_vcs_roots
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,21 @@ if not logger.handlers:
     logger.propagate = False
 
 
+# Characters that appear in the two-column ``git status --porcelain`` code
+_GIT_STATUS_CHARS = " MTADRCU"
+
+# Porcelain status code (XY: index and working tree status) to the primary
+# status reported in FileChange: the first non-space character, e.g.
+# ' M' -> 'M', 'A ' -> 'A', 'RM' -> 'R'. Untracked ('??') entries and the
+# blank code are left out so that they are skipped.
+_GIT_STATUS_MAP: Dict[str, str] = {
+    x + y: (x + y).strip()[0]
+    for x in _GIT_STATUS_CHARS
+    for y in _GIT_STATUS_CHARS
+    if (x + y).strip()
+}
+
+
 @dataclass
 class FileChange:
     """Representation of a single file change in the repository."""
@@ -39,11 +57,116 @@ class GitError(Exception):
     pass
 
 
+def _split_diff_blocks(output: str) -> List[Tuple[str, str]]:
+    """Split combined ``git diff`` output into ``(header, block)`` pairs.
+
+    Each block starts at a ``diff --git`` header line and runs until the
+    next header (or the end of the output).
+    """
+    blocks: List[Tuple[str, str]] = []
+    start = 0 if output.startswith("diff --git ") else output.find("\ndiff --git ")
+    if start > 0:
+        start += 1
+    while start != -1:
+        # Only headers at the beginning of a line start a new block
+        end = output.find("\ndiff --git ", start)
+        block = output[start:] if end == -1 else output[start:end + 1]
+        blocks.append((block.split("\n", 1)[0], block))
+        start = -1 if end == -1 else end + 1
+    return blocks
+
+
+# Characters of C-style escapes in quoted paths, as written by git
+_C_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13, '"': 34, "\\": 92}
+
+
+def _unquote_c_style(quoted: str) -> Tuple[Optional[str], str]:
+    """Decode a C-style quoted path at the start of ``quoted``.
+
+    Git quotes paths with non-ASCII or special characters (see
+    ``core.quotePath``), e.g. ``"a/caf\\303\\251.py"``. Returns the decoded
+    path and the text after the closing quote, or ``(None, quoted)`` if
+    ``quoted`` does not start with a complete quoted string.
+    """
+    if not quoted.startswith('"'):
+        return None, quoted
+    raw = bytearray()
+    pos = 1
+    while pos < len(quoted):
+        char = quoted[pos]
+        if char == '"':
+            return raw.decode("utf-8", errors="replace"), quoted[pos + 1:]
+        if char == "\\" and pos + 1 < len(quoted):
+            escape = quoted[pos + 1]
+            if escape in "01234567":
+                raw.append(int(quoted[pos + 1:pos + 4], 8) & 0xFF)
+                pos += 4
+                continue
+            raw.append(_C_ESCAPES.get(escape, ord(escape)))
+            pos += 2
+            continue
+        raw.extend(char.encode("utf-8"))
+        pos += 1
+    return None, quoted
+
+
+def _diff_header_path(header: str) -> Optional[str]:
+    """Return the path named by a ``diff --git a/<path> b/<path>`` header.
+
+    Handles headers with quoted paths. Diffs are produced with
+    ``--no-renames``, so both sides name the same path.
+    """
+    rest = header[len("diff --git "):]
+    if rest.startswith('"'):
+        path, _ = _unquote_c_style(rest)
+        return path[2:] if path is not None and path.startswith("a/") else None
+    # Unquoted "a/<path> b/<path>": both halves have the same length
+    length = (len(rest) - 5) // 2
+    if rest.startswith("a/") and rest[2 + length:5 + length] == " b/" and rest[2:2 + length] == rest[5 + length:]:
+        return rest[2:2 + length]
+    return None
+
+
+def _diffs_by_path(output: str, paths: Iterable[str]) -> Dict[str, str]:
+    """Map each of ``paths`` to its block of combined ``git diff`` output.
+
+    Paths without a block map to an empty string.
+    """
+    diffs: Dict[str, str] = {path: "" for path in paths}
+    for header, block in _split_diff_blocks(output):
+        path = _diff_header_path(header)
+        if path in diffs:
+            diffs[path] = block
+    return diffs
+
+
+def _parse_raw_patch(output: str) -> Tuple[List[FileChange], Dict[str, str]]:
+    """Parse the output of ``git diff --raw -p -z``.
+
+    The output starts with one ``:<modes> <shas> <status>\\0<path>\\0``
+    record per changed file, followed by a NUL and the unified diffs.
+    """
+    changes: List[FileChange] = []
+    pos = 0
+    while output.startswith(":", pos):
+        meta_end = output.index("\0", pos)
+        path_end = output.index("\0", meta_end + 1)
+        status = output[pos:meta_end].rsplit(" ", 1)[-1][:1]
+        path = output[meta_end + 1:path_end]
+        changes.append(FileChange(path=path, status=status if status in "ADR" else "M"))
+        pos = path_end + 1
+    diffs = _diffs_by_path(output[pos:].lstrip("\0"), (change.path for change in changes))
+    return changes, diffs
+
+
 class GitClient:
     """Client for interacting with a Git repository."""
 
     def __init__(self, repo_root: Path) -> None:
         self.repo_root = repo_root
+        # Diffs from the last get_changes_with_diffs call, reused by
+        # get_diff/get_diffs until the next commit moves HEAD.
+        self._diff_cache: Dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Static helpers
@@ -58,23 +181,26 @@ class GitClient:
         """Find the root of the Git repository starting from ``start``.
 
         Walk upwards until a ``.git`` directory is found or the filesystem
-        root is reached.
+        root is reached. Results are memoized per resolved directory, so
+        repeated lookups do not probe the filesystem again.
         """
-        current = start.resolve()
-        while True:
-            if (current / ".git").exists():
-                return current
-            if current.parent == current:
-                # reached filesystem root
-                return None
-            current = current.parent
+        return find_vcs_roots(start, ("git",)).get("git")
 
     # ------------------------------------------------------------------
     # Basic Git commands
     # ------------------------------------------------------------------
-    def _run(self, args: List[str], check: bool = True) -> subprocess.CompletedProcess:
+    def _run(
+        self,
+        args: List[str],
+        check: bool = True,
+        capture_stdout: bool = True,
+    ) -> subprocess.CompletedProcess:
         """Run a Git command in the repository root.
 
+        When ``capture_stdout`` is False, standard output is discarded
+        (``result.stdout`` is None); use it for commands whose output is
+        not needed. Standard error is always captured for error reporting.
+
         Raises
         ------
         GitError
@@ -86,9 +212,8 @@ class GitClient:
             result = subprocess.run(
                 full_cmd,
                 cwd=self.repo_root,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
                 encoding='utf-8',
                 errors='replace',  # Replace invalid characters instead of failing
             )
@@ -103,7 +228,7 @@ class GitClient:
                 result.stdout,
                 result.stderr,
             )
-            raise GitError(result.stderr.strip() or result.stdout.strip())
+            raise GitError(result.stderr.strip() or (result.stdout or "").strip())
         return result
 
     # ------------------------------------------------------------------
@@ -125,50 +250,167 @@ class GitClient:
         GitError
             If the git status command fails.
         """
-        result = self._run(["status", "--porcelain"], check=True)
+        # ``-z`` separates records with NUL and never quotes paths, so
+        # names containing spaces or non-ASCII characters come through as is
+        result = self._run(["status", "--porcelain=v1", "-z"], check=True)
         changes = []
-        
-        for line in result.stdout.splitlines():
-            # Skip empty lines
-            if not line.strip():
-                continue
-            
+        records = iter(result.stdout.split("\0"))
+        for record in records:
             # Git porcelain format: XY filename
             # X = index status, Y = working tree status
-            # We need at least 3 characters (XY + space + filename)
-            if len(line) < 3:
+            # We need at least 4 characters (XY + space + filename)
+            if len(record) < 4:
                 continue
-            
-            # Extract status code (first 2 characters)
-            status_code = line[:2]
-            # Extract filename (skip the status and space)
-            filename = line[3:]
-            
-            # Skip untracked files
-            if status_code == "??":
-                continue
-            
-            # Determine the primary status
-            # Status codes can be: ' M', 'M ', 'MM', 'A ', ' A', 'D ', ' D', 'R ', etc.
-            status = status_code.strip()
-            if not status:
-                # Both characters are spaces - shouldn't happen in porcelain output
+            status_code = record[:2]
+            filename = record[3:]
+            if "R" in status_code or "C" in status_code:
+                # Renames and copies are followed by a record with the
+                # original path, which is not needed here
+                next(records, None)
+
+            # Untracked files and unexpected codes have no entry in the map
+            primary_status = _GIT_STATUS_MAP.get(status_code)
+            if primary_status is None:
                 continue
-            
-            # Take the first non-space character as the status
-            primary_status = status[0] if status else 'M'
-            
-            # For renamed files, keep the full "old -> new" syntax in the path
             changes.append(FileChange(path=filename, status=primary_status))
-        
+
         return changes
 
+    def get_changes_with_diffs(self) -> Tuple[List[FileChange], Dict[str, str]]:
+        """Get the changed files and their diffs with a single Git command.
+
+        Runs ``git diff HEAD --raw -p -z`` whose output contains the
+        NUL-separated list of changed paths followed by the unified diffs
+        of all of them. If the repository has no ``HEAD`` commit yet, the
+        changes are taken from :meth:`get_changes` with empty diffs.
+
+        The diffs are kept on the client, so later :meth:`get_diff` and
+        :meth:`get_diffs` calls for these paths do not run Git again until
+        :meth:`commit` is called.
+
+        Returns
+        -------
+        Tuple[List[FileChange], Dict[str, str]]
+            The file changes and a mapping from file path to its diff.
+
+        Raises
+        ------
+        GitError
+            If the git commands fail.
+        """
+        try:
+            result = self._run(["diff", "--no-renames", "HEAD", "--raw", "-p", "-z"], check=True)
+        except GitError:
+            changes = self.get_changes()
+            return changes, {change.path: "" for change in changes}
+        changes, diffs = _parse_raw_patch(result.stdout)
+        self._diff_cache = dict(diffs)
+        return changes, diffs
+
+    # ------------------------------------------------------------------
+    # Diffs
+    # ------------------------------------------------------------------
+    def get_diff(self, file_path: str) -> str:
+        """Return the unified diff for a specific file relative to HEAD."""
+        if file_path in self._diff_cache:
+            return self._diff_cache[file_path]
+        result = self._run(["diff", "--no-renames", "HEAD", "--", file_path], check=True)
+        return result.stdout
+
+    def iter_diff_lines(self, file_path: str) -> Iterator[str]:
+        """Yield the unified diff for ``file_path`` line by line.
+
+        Unlike :meth:`get_diff` the output is streamed from the ``git diff``
+        process instead of being buffered in memory first. If the caller
+        stops iterating early, the process is terminated.
+
+        Raises
+        ------
+        GitError
+            If the git diff command fails after its output was consumed.
+        """
+        full_cmd = ["git", "diff", "--no-renames", "HEAD", "--", file_path]
+        logger.debug("Streaming Git command: %s", " ".join(full_cmd))
+        proc = subprocess.Popen(
+            full_cmd,
+            cwd=self.repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding='utf-8',
+            errors='replace',
+        )
+        finished = False
+        try:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+            finished = True
+        finally:
+            if not finished:
+                proc.terminate()
+            stderr = proc.stderr.read() if finished else ""
+            proc.stdout.close()
+            proc.stderr.close()
+            returncode = proc.wait()
+        if returncode != 0:
+            logger.error("Git command failed: %s\nSTDERR: %s", " ".join(full_cmd), stderr)
+            raise GitError(stderr.strip() or f"git diff exited with status {returncode}")
+
+    def get_diffs(self, file_paths: List[str]) -> Dict[str, str]:
+        """Return unified diffs for several files using a single ``git diff``.
+
+        The combined output is split on its ``diff --git`` headers so that
+        each requested path maps to its own diff. Paths without changes map
+        to an empty string.
+
+        Parameters
+        ----------
+        file_paths : List[str]
+            Paths relative to the repository root.
+
+        Returns
+        -------
+        Dict[str, str]
+            Mapping from file path to its unified diff.
+
+        Raises
+        ------
+        GitError
+            If the git diff command fails.
+        """
+        if all(path in self._diff_cache for path in file_paths):
+            return {path: self._diff_cache[path] for path in file_paths}
+        result = self._run(["diff", "--no-renames", "HEAD", "--"] + list(file_paths), check=True)
+        return _diffs_by_path(result.stdout, file_paths)
+
     # ------------------------------------------------------------------
     # Branch operations
     # ------------------------------------------------------------------
+    def _read_head(self) -> Optional[str]:
+        """Return the current branch as read from ``.git/HEAD``.
+
+        Returns ``"HEAD"`` for a detached HEAD, like ``git rev-parse
+        --abbrev-ref HEAD``, and None when the file cannot be interpreted
+        directly (``.git`` is not a directory, ``GIT_DIR`` is set, or the
+        content is unexpected).
+        """
+        if "GIT_DIR" in os.environ:
+            return None
+        try:
+            head = (self.repo_root / ".git" / "HEAD").read_bytes().strip()
+        except OSError:
+            return None
+        if head.startswith(b"ref: refs/heads/"):
+            return head[len(b"ref: refs/heads/"):].decode("utf-8", errors="replace")
+        if len(head) in (40, 64) and all(c in b"0123456789abcdef" for c in head):
+            return "HEAD"
+        return None
+
     def get_current_branch(self) -> str:
         """Get the name of the current branch.
         
+        The branch is read from ``.git/HEAD`` when possible; ``git
+        rev-parse`` is only run for other repository layouts.
+        
         Returns
         -------
         str
@@ -179,6 +421,9 @@ class GitClient:
         GitError
             If unable to determine the current branch.
         """
+        branch = self._read_head()
+        if branch is not None:
+            return branch
         result = self._run(["rev-parse", "--abbrev-ref", "HEAD"], check=True)
         return result.stdout.strip()
 
@@ -233,7 +478,7 @@ class GitClient:
         # the branch exists on the remote before further operations.
         try:
             if self._has_remote() and not self.remote_branch_exists(branch_name):
-                self._run(["push", "--set-upstream", "origin", branch_name], check=True)
+                self._run(["push", "--set-upstream", "origin", branch_name], check=True, capture_stdout=False)
         except GitError:
             # Bubble up the error if push fails; callers can decide how to
             # handle it. We don't silently ignore remote push failures.
@@ -245,16 +490,19 @@ class GitClient:
     def stage_files(self, files: List[str]) -> None:
         """Stage the given files for commit.
 
-        For deleted files, ``git rm`` is used; otherwise ``git add``.
+        For deleted files, ``git rm`` is used; otherwise ``git add``. Files
+        are staged with at most one ``git add`` and one ``git rm`` per batch
+        of :data:`MAX_PATHS_PER_COMMAND` paths.
         """
+        adds: List[str] = []
+        removes: List[str] = []
         for file in files:
-            abs_path = self.repo_root / file
-            if abs_path.exists():
-                # Modified or added file
-                self._run(["add", "--", file], check=True)
-            else:
-                # Deleted file
-                self._run(["rm", "--", file], check=True)
+            # Existing files are modified or added; missing ones were deleted
+            (adds if (self.repo_root / file).exists() else removes).append(file)
+        for batch in _chunked(adds, MAX_PATHS_PER_COMMAND):
+            self._run(["add", "--"] + batch, check=True, capture_stdout=False)
+        for batch in _chunked(removes, MAX_PATHS_PER_COMMAND):
+            self._run(["rm", "--"] + batch, check=True, capture_stdout=False)
 
     def commit(self, message: str) -> None:
         """Create a commit with the given message.
@@ -262,7 +510,8 @@ class GitClient:
         Multi-line commit messages are supported. If the commit fails,
         a GitError is raised.
         """
-        self._run(["commit", "-m", message], check=True)
+        self._run(["commit", "-m", message], check=True, capture_stdout=False)
+        self._diff_cache = {}
 
     def push(self, set_upstream: bool = False) -> None:
         """Push the current branch to the default remote (origin).
@@ -281,6 +530,6 @@ class GitClient:
         if set_upstream:
             # Get current branch name
             branch = self.get_current_branch()
-            self._run(["push", "--set-upstream", "origin", branch], check=True)
+            self._run(["push", "--set-upstream", "origin", branch], check=True, capture_stdout=False)
         else:
-            self._run(["push"], check=True) 
+            self._run(["push"], check=True, capture_stdout=False)
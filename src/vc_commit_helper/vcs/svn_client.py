@@ -12,7 +12,10 @@ import logging
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from vc_commit_helper.vcs._util import MAX_PATHS_PER_COMMAND, _chunked
+from vc_commit_helper.vcs.detection import find_vcs_roots
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,11 @@ if not logger.handlers:
     logger.propagate = False
 
 
+# First column of ``svn status`` to the simplified status; every other
+# versioned change is reported as modified ('M').
+_SVN_STATUS_MAP: Dict[str, str] = {"A": "A", "D": "D", "R": "R"}
+
+
 @dataclass
 class FileChange:
     """Representation of a single file change in an SVN working copy."""
@@ -42,6 +50,9 @@ class SVNClient:
 
     def __init__(self, repo_root: Path) -> None:
         self.repo_root = repo_root
+        # Diffs from the last get_changes_with_diffs call, reused by
+        # get_diff/get_diffs until the next commit.
+        self._diff_cache: Dict[str, str] = {}
 
     @staticmethod
     def is_repo(path: Path) -> bool:
@@ -53,15 +64,10 @@ class SVNClient:
         """Find the root of an SVN working copy starting from ``start``.
 
         Walk upwards until a ``.svn`` directory is found or the filesystem
-        root is reached.
+        root is reached. Results are memoized per resolved directory, so
+        repeated lookups do not probe the filesystem again.
         """
-        current = start.resolve()
-        while True:
-            if (current / ".svn").exists():
-                return current
-            if current.parent == current:
-                return None
-            current = current.parent
+        return find_vcs_roots(start, ("svn",)).get("svn")
 
     # Internal helper to run SVN commands
     def _run(self, args: List[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -73,7 +79,6 @@ class SVNClient:
                 cwd=self.repo_root,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 encoding='utf-8',
                 errors='replace',  # Replace invalid characters instead of failing
             )
@@ -233,24 +238,60 @@ class SVNClient:
             # Ignore unversioned and ignored files
             if status_code in ("?", "I"):
                 continue
-            # Map to simplified statuses
-            if status_code == "A":
-                status = "A"
-            elif status_code == "D":
-                status = "D"
-            elif status_code == "R":
-                status = "R"
-            else:
-                status = "M"
-            changes.append(FileChange(path=path, status=status))
+            changes.append(FileChange(path=path, status=_SVN_STATUS_MAP.get(status_code, "M")))
         logger.debug("Detected SVN changes: %s", changes)
         return changes
 
+    def get_changes_with_diffs(self) -> Tuple[List[FileChange], Dict[str, str]]:
+        """Return the changes in the working copy together with their diffs.
+
+        Uses one ``svn status`` and one ``svn diff`` for all changed files.
+        The diffs are kept on the client, so later :meth:`get_diff` and
+        :meth:`get_diffs` calls for these paths do not run SVN again until
+        :meth:`commit` is called.
+        """
+        changes = self.get_changes()
+        self._diff_cache = {}
+        diffs = self.get_diffs([change.path for change in changes])
+        self._diff_cache = dict(diffs)
+        return changes, diffs
+
     def get_diff(self, file_path: str) -> str:
         """Return the unified diff for a specific file relative to BASE."""
+        if file_path in self._diff_cache:
+            return self._diff_cache[file_path]
         result = self._run(["diff", "--", file_path], check=True)
         return result.stdout
 
+    def get_diffs(self, file_paths: List[str]) -> Dict[str, str]:
+        """Return unified diffs for several files using a single ``svn diff``.
+
+        The combined output is split on its ``Index:`` headers so that each
+        requested path maps to its own diff. Paths without changes map to an
+        empty string.
+
+        Raises
+        ------
+        SVNError
+            If the svn diff command fails.
+        """
+        if all(path in self._diff_cache for path in file_paths):
+            return {path: self._diff_cache[path] for path in file_paths}
+        diffs: Dict[str, str] = {path: "" for path in file_paths}
+        result = self._run(["diff", "--"] + list(file_paths), check=True)
+        path: Optional[str] = None
+        block: List[str] = []
+        for line in result.stdout.splitlines(keepends=True):
+            if line.startswith("Index: "):
+                if path in diffs:
+                    diffs[path] = "".join(block)
+                path = line[len("Index: "):].rstrip("\r\n")
+                block = []
+            block.append(line)
+        if path in diffs:
+            diffs[path] = "".join(block)
+        return diffs
+
     def stage_files(self, files: List[str], statuses: Optional[dict[str, str]] = None) -> None:
         """Schedule changes for commit.
 
@@ -267,15 +308,15 @@ class SVNClient:
             file. If not provided, files are assumed to be modified.
         """
         statuses = statuses or {}
-        for file in files:
-            status = statuses.get(file, "M")
-            if status == "A":
-                # Use --force to skip files that are already versioned
-                # This prevents errors when parent directories are already under version control
-                self._run(["add", "--force", "--", file], check=True)
-            elif status == "D":
-                self._run(["delete", "--", file], check=True)
-            # Modified files need no explicit staging
+        adds = [file for file in files if statuses.get(file, "M") == "A"]
+        deletes = [file for file in files if statuses.get(file, "M") == "D"]
+        # Modified files need no explicit staging
+        for batch in _chunked(adds, MAX_PATHS_PER_COMMAND):
+            # Use --force to skip files that are already versioned
+            # This prevents errors when parent directories are already under version control
+            self._run(["add", "--force", "--"] + batch, check=True)
+        for batch in _chunked(deletes, MAX_PATHS_PER_COMMAND):
+            self._run(["delete", "--"] + batch, check=True)
 
     def commit(self, message: str, files: List[str]) -> None:
         """Commit the specified files with the given message.
@@ -299,4 +340,5 @@ class SVNClient:
         # Build commit command: specify files and message
         # Note: -- separates options from file paths
         args = ["commit", "-m", message, "--"] + files
-        self._run(args, check=True)
\ No newline at end of file
+        self._run(args, check=True)
+        self._diff_cache = {}
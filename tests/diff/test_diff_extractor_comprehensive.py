@@ -58,4 +58,58 @@ class TestDiffExtractorComprehensive(unittest.TestCase):
         result = extract_diffs(mock_client, changes)
         
         self.assertEqual(result, {})
-        mock_client.get_diff.assert_not_called()
\ No newline at end of file
+        mock_client.get_diff.assert_not_called()
+
+    def test_extract_diffs_uses_batched_get_diffs(self):
+        """Test that clients implementing get_diffs are queried once."""
+        mock_client = Mock()
+        mock_client.get_diffs.return_value = {"a.py": "diff a"}
+
+        change1 = Mock()
+        change1.path = "a.py"
+        change2 = Mock()
+        change2.path = "b.py"
+
+        result = extract_diffs(mock_client, [change1, change2])
+
+        self.assertEqual(result, {"a.py": "diff a", "b.py": ""})
+        mock_client.get_diffs.assert_called_once_with(["a.py", "b.py"])
+        mock_client.get_diff.assert_not_called()
+
+    def test_extract_diffs_falls_back_when_batch_fails(self):
+        """Test per-file extraction is used when get_diffs raises."""
+        mock_client = Mock()
+        mock_client.get_diffs.side_effect = Exception("Batch failed")
+        mock_client.get_diff.return_value = "diff content"
+
+        change1 = Mock()
+        change1.path = "a.py"
+
+        result = extract_diffs(mock_client, [change1])
+
+        self.assertEqual(result, {"a.py": "diff content"})
+        mock_client.get_diff.assert_called_once_with("a.py")
+
+    def test_extract_diffs_parallel_preserves_order(self):
+        """Test per-file extraction of many files keeps the change order."""
+        mock_client = Mock(spec=["get_diff"])
+
+        def get_diff_side_effect(path):
+            if path == "fail.py":
+                raise Exception("Failed")
+            return f"diff {path}"
+
+        mock_client.get_diff.side_effect = get_diff_side_effect
+        paths = [f"file{i}.py" for i in range(10)] + ["fail.py"]
+        changes = []
+        for path in paths:
+            change = Mock()
+            change.path = path
+            changes.append(change)
+
+        result = extract_diffs(mock_client, changes)
+
+        self.assertEqual(list(result), paths)
+        self.assertEqual(result["file3.py"], "diff file3.py")
+        self.assertEqual(result["fail.py"], "")
+        self.assertEqual(mock_client.get_diff.call_count, len(paths))
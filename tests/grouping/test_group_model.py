@@ -1,6 +1,6 @@
 import unittest
 
-from vc_commit_helper.grouping.group_model import CommitGroup
+from vc_commit_helper.grouping.group_model import CommitGroup, DiffView
 
 
 class TestGroupModel(unittest.TestCase):
@@ -11,6 +11,27 @@ class TestGroupModel(unittest.TestCase):
         self.assertTrue(group.message.startswith("feat:"))
         self.assertEqual(group.diffs["a.py"], "diff")
 
+    def test_commit_group_uses_slots(self) -> None:
+        group = CommitGroup(type="feat", files=["a.py"], message="feat: add feature")
+        self.assertFalse(hasattr(group, "__dict__"))
+        with self.assertRaises(AttributeError):
+            group.extra = 1
+
+    def test_diff_view_exposes_only_group_files(self) -> None:
+        diffs = {"a.py": "diff a", "b.py": "diff b", "c.py": "diff c"}
+        view = DiffView(diffs, ["a.py", "c.py"])
+        self.assertEqual(dict(view), {"a.py": "diff a", "c.py": "diff c"})
+        self.assertEqual(len(view), 2)
+        self.assertIn("c.py", view)
+        self.assertNotIn("b.py", view)
+        with self.assertRaises(KeyError):
+            view["b.py"]
+        self.assertEqual(view, {"a.py": "diff a", "c.py": "diff c"})
+
+    def test_diff_view_iterates_in_file_order(self) -> None:
+        diffs = {"a.py": "diff a", "b.py": "diff b", "c.py": "diff c"}
+        self.assertEqual(list(DiffView(diffs, ["c.py", "missing.py", "a.py"])), ["c.py", "a.py"])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
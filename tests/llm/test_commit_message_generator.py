@@ -1,9 +1,18 @@
 """Tests for commit message generator."""
 
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock
+from pathlib import Path
+from unittest.mock import Mock, patch
 
-from vc_commit_helper.llm.commit_message_generator import CommitMessageGenerator
+from vc_commit_helper.llm.commit_message_generator import (
+    PROMPT_DIFF_LINES,
+    CommitMessageGenerator,
+    _changed_lines,
+    _classify_cache,
+    _prune_cache,
+)
 from vc_commit_helper.llm.ollama_client import LLMError
 
 
@@ -42,6 +51,170 @@ class TestCommitMessageGenerator(unittest.TestCase):
         self.assertIn("[test]:", groups[0].message)
         self.assertIn("1 file", groups[0].message)
 
+    def test_generate_groups_reuses_cached_classification(self):
+        """Test that unchanged diffs are classified only once."""
+        mock_client = Mock()
+        mock_client.generate.return_value = "[feat]: add new feature\n\nDetailed description."
+        generator = CommitMessageGenerator(mock_client)
+        diffs = {"feature.py": "+def new_feature(): pass"}
+        _classify_cache.clear()
+
+        with patch(
+            "vc_commit_helper.llm.commit_message_generator.classify_change",
+            return_value="feat",
+        ) as mock_classify:
+            generator.generate_groups(diffs)
+            generator.generate_groups(diffs)
+            generator.generate_groups({"feature.py": "+def other(): pass"})
+
+        self.assertEqual(mock_classify.call_count, 2)
+        _classify_cache.clear()
+
+    def test_generate_groups_uses_disk_cache(self):
+        """Test that completions are cached on disk and reused."""
+        mock_client = Mock()
+        mock_client.model = "llama3"
+        mock_client.max_tokens = None
+        mock_client.generate.return_value = "[feat]: add new feature\n\nDetailed description.\n\n- feature.py"
+        diffs = {"feature.py": "+def new_feature(): pass"}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / "llm_cache"
+            first = CommitMessageGenerator(mock_client, cache_dir=cache_dir).generate_groups(diffs)
+            second = CommitMessageGenerator(mock_client, cache_dir=cache_dir).generate_groups(diffs)
+            self.assertEqual(len(list(cache_dir.glob("*.txt"))), 1)
+            self.assertEqual(list(cache_dir.glob("*.tmp")), [])
+
+            # A different model must not reuse the cached completion
+            mock_client.model = "mistral"
+            CommitMessageGenerator(mock_client, cache_dir=cache_dir).generate_groups(diffs)
+
+        self.assertEqual(first[0].message, second[0].message)
+        self.assertEqual(mock_client.generate.call_count, 2)
+
+    def test_generate_groups_does_not_cache_unusable_responses(self):
+        mock_client = Mock()
+        mock_client.model = "llama3"
+        mock_client.max_tokens = None
+        diffs = {"feature.py": "+def new_feature(): pass"}
+
+        for response in ("", "[feat]: add new feature\n\nTruncated descr"):
+            with self.subTest(response=response), tempfile.TemporaryDirectory() as tmp:
+                cache_dir = Path(tmp) / "llm_cache"
+                mock_client.generate.reset_mock()
+                mock_client.generate.return_value = response
+                CommitMessageGenerator(mock_client, cache_dir=cache_dir).generate_groups(diffs)
+                CommitMessageGenerator(mock_client, cache_dir=cache_dir).generate_groups(diffs)
+                self.assertEqual(list(cache_dir.glob("*.txt")), [])
+                self.assertEqual(mock_client.generate.call_count, 2)
+
+    def test_prune_cache_removes_least_recently_used_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            for age, name in enumerate(["new", "mid", "old"]):
+                path = cache_dir / f"{name}.txt"
+                path.write_text(name, encoding="utf-8")
+                os.utime(path, ns=(0, (10 - age) * 10**9))
+            _prune_cache(cache_dir, 2)
+            self.assertEqual(sorted(p.stem for p in cache_dir.iterdir()), ["mid", "new"])
+
+    def test_build_prompt_limits_diff_lines(self):
+        generator = CommitMessageGenerator(Mock())
+        diff = "--- a/big.py\n+++ b/big.py\n" + "\n".join(f"+line {i}" for i in range(PROMPT_DIFF_LINES + 5))
+        prompt = generator._build_prompt("feat", ["big.py"], {"big.py": diff})
+        self.assertIn(f"+line {PROMPT_DIFF_LINES - 1}", prompt)
+        self.assertNotIn(f"+line {PROMPT_DIFF_LINES}\n", prompt)
+        self.assertNotIn("+++ b/big.py", prompt)
+
+    def test_build_prompt_stops_consuming_line_iterators(self):
+        generator = CommitMessageGenerator(Mock())
+        consumed = []
+
+        def stream():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"+line {i}"
+
+        generator._build_prompt("feat", ["big.py"], {"big.py": stream()})
+        self.assertEqual(len(consumed), PROMPT_DIFF_LINES)
+
+    def test_changed_lines_skips_file_headers(self):
+        diff = "diff --git a/x b/x\n--- a/x\n+++ b/x\n@@ -1 +1 @@\n-old\r\n+new\n context\n-\n"
+        self.assertEqual(_changed_lines(diff, 10), ["-old", "+new", "-"])
+        self.assertEqual(_changed_lines(diff, 1), ["-old"])
+
+    def test_changed_lines_same_for_text_and_lines(self):
+        diff = "--- a/x\n+++ b/x\n@@ -1,3 +1,3 @@\n-+x\n+- item\n context\n--y\n++z\n-\n+new\n"
+        self.assertEqual(_changed_lines(diff, 10), _changed_lines(diff.splitlines(), 10))
+        self.assertEqual(_changed_lines(diff, 10), ["-+x", "+- item", "-", "+new"])
+
+    def test_build_prompt_keeps_lines_starting_with_opposite_sign(self):
+        generator = CommitMessageGenerator(Mock())
+        diff = "--- a/notes.md\n+++ b/notes.md\n@@ -1 +1 @@\n-+x\n+- item\n"
+        prompt = generator._build_prompt("docs", ["notes.md"], {"notes.md": diff})
+        self.assertIn("+- item", prompt)
+        self.assertIn("-+x", prompt)
+
+    def test_generate_groups_skips_llm_for_trivial_diffs(self):
+        mock_client = Mock()
+        generator = CommitMessageGenerator(mock_client, min_diff_lines_for_llm=4)
+        groups = generator.generate_groups({"old.py": "", "config.py": "-DEBUG = True\n+DEBUG = False"})
+        mock_client.generate.assert_not_called()
+        for group in groups:
+            self.assertIn("Changes to", group.message.splitlines()[0])
+
+    def test_generate_groups_queries_llm_for_larger_diffs(self):
+        mock_client = Mock()
+        mock_client.generate.return_value = "[feat]: add feature\n\nDetails."
+        generator = CommitMessageGenerator(mock_client, min_diff_lines_for_llm=2)
+        generator.generate_groups({"feature.py": "+def feature():\n+    return 1"})
+        mock_client.generate.assert_called_once()
+
+    def test_generate_groups_uses_template_for_empty_diffs_by_default(self):
+        mock_client = Mock()
+        groups = CommitMessageGenerator(mock_client).generate_groups({"script.sh": "", "old.py": ""})
+        mock_client.generate.assert_not_called()
+        self.assertTrue(all("Changes to" in group.message for group in groups))
+
+    def test_generate_groups_queries_llm_for_one_line_change_by_default(self):
+        mock_client = Mock()
+        mock_client.generate.return_value = "[fix]: disable debug mode\n\nDetails."
+        groups = CommitMessageGenerator(mock_client).generate_groups({"config.py": "-DEBUG = True\n+DEBUG = False"})
+        mock_client.generate.assert_called_once()
+        self.assertEqual(groups[0].message, "[fix]: disable debug mode\n\nDetails.")
+
+    def test_early_stop_closes_stream_after_file_list(self):
+        fragments = ["Sure.\n[feat]: add ", "parser\n\nParses input.\n\n", "- parser.py\n", "Hope this helps!\n", "more"]
+        consumed = []
+
+        def stream(prompt):
+            for fragment in fragments:
+                consumed.append(fragment)
+                yield fragment
+
+        mock_client = Mock()
+        mock_client.generate_stream.side_effect = stream
+        generator = CommitMessageGenerator(mock_client, early_stop=True)
+        groups = generator.generate_groups({"parser.py": "+def parse(): pass"})
+
+        self.assertEqual(consumed, fragments[:3])
+        mock_client.generate.assert_not_called()
+        self.assertTrue(groups[0].message.startswith("[feat]: add parser"))
+        self.assertIn("- parser.py", groups[0].message)
+
+    def test_on_fragment_receives_streamed_text(self):
+        fragments = ["[feat]: add ", "parser\n\n", "- parser.py\n", "Hope this helps!\n"]
+        received = []
+        mock_client = Mock()
+        mock_client.generate_stream.return_value = (fragment for fragment in fragments)
+        generator = CommitMessageGenerator(mock_client, on_fragment=received.append)
+        groups = generator.generate_groups({"parser.py": "+def parse(): pass"})
+
+        # Without early_stop the whole stream is consumed
+        self.assertEqual(received, fragments)
+        mock_client.generate.assert_not_called()
+        self.assertTrue(groups[0].message.startswith("[feat]: add parser"))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Additional tests for commit message generator to improve coverage."""
 
 import unittest
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
 from vc_commit_helper.llm.commit_message_generator import CommitMessageGenerator
 from vc_commit_helper.llm.ollama_client import LLMError
@@ -92,6 +93,16 @@ class TestCommitMessageGeneratorExtra(unittest.TestCase):
         # Should be prepended with [feat]:
         self.assertTrue(groups[0].message.startswith("[feat]:"))
 
+    def test_normalize_message_rebuilds_subject_only(self):
+        """Test that normalization replaces the prefix and keeps the body lines."""
+        generator = CommitMessageGenerator(Mock())
+        self.assertEqual(
+            generator._normalize_message("fix: handle empty input\n\nBody.\n- a.py", "feat"),
+            "[feat]: handle empty input\n\nBody.\n- a.py",
+        )
+        self.assertEqual(generator._normalize_message("add parser", "feat"), "[feat]: add parser")
+        self.assertEqual(generator._normalize_message("[FEAT]: keep\n", "feat"), "[FEAT]: keep\n")
+
     def test_generate_groups_multiple_files(self):
         """Test generating groups with multiple files."""
         mock_client = Mock()
@@ -107,4 +118,64 @@ class TestCommitMessageGeneratorExtra(unittest.TestCase):
         
         self.assertEqual(len(groups), 1)
         self.assertTrue(groups[0].message.startswith("[fix]:"))
-        self.assertEqual(len(groups[0].files), 2)
\ No newline at end of file
+        self.assertEqual(len(groups[0].files), 2)
+
+    def _multi_group_client(self):
+        mock_client = Mock()
+
+        def generate(prompt):
+            for group_type in ("docs", "test", "feat"):
+                if f"[{group_type}]:" in prompt:
+                    return f"[{group_type}]: update {group_type}\n\nDetails."
+            raise AssertionError("unexpected prompt")
+
+        mock_client.generate.side_effect = generate
+        return mock_client
+
+    def test_generate_groups_parallel_keeps_group_order(self):
+        """Test concurrent generation maps messages back to their groups."""
+        mock_client = self._multi_group_client()
+        generator = CommitMessageGenerator(mock_client)
+        diffs = {
+            "README.md": "+docs",
+            "tests/test_a.py": "+def test_a(): pass",
+            "feature.py": "+def feature(): pass",
+        }
+
+        groups = generator.generate_groups(diffs)
+
+        self.assertEqual([g.type for g in groups], ["docs", "test", "feat"])
+        for group in groups:
+            self.assertTrue(group.message.startswith(f"[{group.type}]: update {group.type}"))
+        self.assertEqual(mock_client.generate.call_count, 3)
+
+    def test_generate_groups_sequential(self):
+        """Test that parallel=False produces the same groups."""
+        mock_client = self._multi_group_client()
+        generator = CommitMessageGenerator(mock_client, parallel=False)
+        diffs = {"README.md": "+docs", "feature.py": "+def feature(): pass"}
+
+        with patch("vc_commit_helper.llm.commit_message_generator.ThreadPoolExecutor") as mock_pool:
+            groups = generator.generate_groups(diffs)
+
+        mock_pool.assert_not_called()
+        self.assertEqual([g.type for g in groups], ["docs", "feat"])
+
+    def test_generate_groups_respects_max_parallel_requests(self):
+        """Test that the worker count is capped by max_parallel_requests."""
+        mock_client = self._multi_group_client()
+        generator = CommitMessageGenerator(mock_client, max_parallel_requests=2)
+        diffs = {
+            "README.md": "+docs",
+            "tests/test_a.py": "+def test_a(): pass",
+            "feature.py": "+def feature(): pass",
+        }
+
+        with patch(
+            "vc_commit_helper.llm.commit_message_generator.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as mock_pool:
+            groups = generator.generate_groups(diffs)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+        self.assertEqual([g.type for g in groups], ["docs", "test", "feat"])
@@ -1,7 +1,7 @@
 import json
 import unittest
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from vc_commit_helper.llm.ollama_client import LLMError, OllamaClient
 
@@ -14,12 +14,12 @@ class DummyResponse(SimpleNamespace):
 class TestOllamaClient(unittest.TestCase):
     def test_generate_success(self) -> None:
         # The patched function should accept keyword arguments matching the
-        # requests.post signature. Avoid shadowing the json module name.
+        # Session.post signature. Avoid shadowing the json module name.
         def fake_post(url, *_args, **kwargs):
             # kwargs may include 'json' or 'data'; we don't inspect it here.
             return DummyResponse(status_code=200, text=json.dumps({"response": "Hello"}))
 
-        with patch("requests.post", fake_post):
+        with patch("requests.Session.post", fake_post):
             client = OllamaClient("http://localhost", 11434, "model")
             resp = client.generate("prompt")
             self.assertEqual(resp, "Hello")
@@ -28,7 +28,7 @@ class TestOllamaClient(unittest.TestCase):
         def fake_post(url, *_args, **kwargs):
             return DummyResponse(status_code=500, text="Internal error")
 
-        with patch("requests.post", fake_post):
+        with patch("requests.Session.post", fake_post):
             client = OllamaClient("http://localhost", 11434, "model")
             with self.assertRaises(LLMError):
                 client.generate("prompt")
@@ -37,11 +37,70 @@ class TestOllamaClient(unittest.TestCase):
         def fake_post(url, *_args, **kwargs):
             return DummyResponse(status_code=200, text="not json")
 
-        with patch("requests.post", fake_post):
+        with patch("requests.Session.post", fake_post):
             client = OllamaClient("http://localhost", 11434, "model")
             with self.assertRaises(LLMError):
                 client.generate("prompt")
 
+    def test_generate_stream_yields_fragments(self) -> None:
+        lines = [
+            json.dumps({"response": "[feat]: ", "done": False}).encode(),
+            b"",
+            json.dumps({"response": "add x", "done": False}).encode(),
+            json.dumps({"response": "", "done": True}).encode(),
+            json.dumps({"response": "ignored"}).encode(),
+        ]
+        response = Mock(status_code=200)
+        response.iter_lines.return_value = iter(lines)
+        with patch("requests.Session.post", return_value=response) as mock_post:
+            client = OllamaClient("http://localhost", 11434, "model")
+            fragments = list(client.generate_stream("prompt"))
+        self.assertEqual(fragments, ["[feat]: ", "add x"])
+        self.assertTrue(mock_post.call_args[1]["stream"])
+        self.assertTrue(mock_post.call_args[1]["json"]["stream"])
+        response.close.assert_called_once()
+
+    def test_generate_stream_closes_response_when_abandoned(self) -> None:
+        response = Mock(status_code=200)
+        response.iter_lines.return_value = iter([json.dumps({"response": "a"}).encode()] * 3)
+        with patch("requests.Session.post", return_value=response):
+            stream = OllamaClient("http://localhost", 11434, "model").generate_stream("prompt")
+            self.assertEqual(next(stream), "a")
+            stream.close()
+        response.close.assert_called_once()
+
+    def test_generate_stream_error_status(self) -> None:
+        response = Mock(status_code=500, text="Internal error")
+        with patch("requests.Session.post", return_value=response):
+            client = OllamaClient("http://localhost", 11434, "model")
+            with self.assertRaises(LLMError):
+                list(client.generate_stream("prompt"))
+        response.close.assert_called_once()
+
+    def test_requests_share_one_session(self) -> None:
+        response = DummyResponse(status_code=200, text=json.dumps({"response": "Hello"}))
+        with patch("requests.Session") as mock_session_cls:
+            mock_session_cls.return_value.post.return_value = response
+            client = OllamaClient("http://localhost", 11434, "model")
+            client.generate("one")
+            client.generate("two")
+        mock_session_cls.assert_called_once()
+        self.assertEqual(mock_session_cls.return_value.post.call_count, 2)
+
+    def test_warm_up(self) -> None:
+        with patch("requests.Session.get", return_value=Mock(status_code=200)) as mock_get:
+            client = OllamaClient("http://localhost", 11434, "model", request_timeout=60)
+            self.assertTrue(client.warm_up())
+        self.assertEqual(mock_get.call_args[0][0], "http://localhost:11434/api/tags")
+        self.assertEqual(mock_get.call_args[1]["timeout"], 5.0)
+
+    def test_warm_up_unreachable_server(self) -> None:
+        import requests
+
+        with patch("requests.Session.get", side_effect=requests.ConnectionError("refused")):
+            client = OllamaClient("http://localhost", 11434, "model")
+            self.assertFalse(client.warm_up())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -10,7 +10,7 @@ from vc_commit_helper.llm.ollama_client import OllamaClient, LLMError
 class TestOllamaClientComprehensive(unittest.TestCase):
     """Comprehensive tests for OllamaClient."""
 
-    @patch("vc_commit_helper.llm.ollama_client.requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_message_field(self, mock_post):
         """Test generate when response contains 'message' field."""
         mock_response = Mock()
@@ -29,7 +29,7 @@ class TestOllamaClientComprehensive(unittest.TestCase):
         result = client.generate("test prompt")
         self.assertEqual(result, "Generated text from message field")
 
-    @patch("vc_commit_helper.llm.ollama_client.requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_unexpected_structure(self, mock_post):
         """Test generate when response has unexpected structure."""
         mock_response = Mock()
@@ -47,7 +47,7 @@ class TestOllamaClientComprehensive(unittest.TestCase):
             client.generate("test prompt")
         self.assertIn("Unexpected response structure", str(ctx.exception))
 
-    @patch("vc_commit_helper.llm.ollama_client.requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_json_decode_error(self, mock_post):
         """Test generate when response cannot be parsed as JSON."""
         mock_response = Mock()
@@ -65,7 +65,7 @@ class TestOllamaClientComprehensive(unittest.TestCase):
             client.generate("test prompt")
         self.assertIn("Failed to parse LLM response", str(ctx.exception))
 
-    @patch("vc_commit_helper.llm.ollama_client.requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_non_200_status(self, mock_post):
         """Test generate when server returns non-200 status."""
         mock_response = Mock()
@@ -10,7 +10,7 @@ from vc_commit_helper.llm.ollama_client import OllamaClient, LLMError
 class TestOllamaClientEdgeCases(unittest.TestCase):
     """Edge case tests for OllamaClient."""
 
-    @patch("vc_commit_helper.llm.ollama_client.requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_request_exception(self, mock_post):
         """Test generate when requests raises an exception."""
         mock_post.side_effect = requests.RequestException("Connection error")
@@ -25,7 +25,7 @@ class TestOllamaClientEdgeCases(unittest.TestCase):
             client.generate("test prompt")
         self.assertIn("Connection error", str(ctx.exception))
 
-    @patch("vc_commit_helper.llm.ollama_client.requests.post")
+    @patch("requests.Session.post")
     def test_generate_with_generic_exception(self, mock_post):
         """Test generate when a generic exception occurs."""
         mock_post.side_effect = Exception("Unexpected error")
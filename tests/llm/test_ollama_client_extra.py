@@ -20,7 +20,7 @@ class TestOllamaClientExtra(unittest.TestCase):
     def test_generate_message_key(self) -> None:
         client = OllamaClient(base_url="http://", port=1, model="m")
         resp_data = {"message": {"content": "hello world"}}
-        with patch("requests.post", return_value=DummyResponse(resp_data, status=200)):
+        with patch("requests.Session.post", return_value=DummyResponse(resp_data, status=200)):
             result = client.generate("prompt")
             self.assertEqual(result, "hello world")
 
@@ -28,7 +28,7 @@ class TestOllamaClientExtra(unittest.TestCase):
         client = OllamaClient(base_url="http://", port=1, model="m")
         resp_data = {"response": "ok"}
         # Provide stream=True; our client ignores streaming and sets stream to False
-        with patch("requests.post", return_value=DummyResponse(resp_data, status=200)):
+        with patch("requests.Session.post", return_value=DummyResponse(resp_data, status=200)):
             result = client.generate("prompt", stream=True)
             self.assertEqual(result, "ok")
 
@@ -36,6 +36,10 @@ class DummyGitClient:
     def get_diff(self, path):
         return self.diffs.get(path, "")
     
+    def get_changes_with_diffs(self):
+        changes = self.get_changes()
+        return changes, {change.path: self.get_diff(change.path) for change in changes}
+    
     def stage_files(self, files):
         self.stage_called.append(list(files))
     
@@ -84,7 +88,7 @@ class TestCLI(unittest.TestCase):
                     from vc_commit_helper.grouping.group_model import CommitGroup
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: add foo", diffs={"a.py": "+def foo():\n"})
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             result = runner.invoke(cli.main, ["--yes"])
                             self.assertEqual(result.exit_code, cli.EXIT_SUCCESS)
                             self.assertEqual(dummy.stage_called, [["a.py"]])
@@ -102,7 +106,7 @@ class TestCLI(unittest.TestCase):
                     from vc_commit_helper.grouping.group_model import CommitGroup
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change\n"})
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             # Patch prompt_user to always decline
                             with patch.object(cli, "prompt_user", return_value=None):
                                 result = runner.invoke(cli.main, [])
@@ -34,6 +34,10 @@ class DummyGitClient:
 
     def get_diff(self, path):
         return self.diffs.get(path, "")
+    
+    def get_changes_with_diffs(self):
+        changes = self.get_changes()
+        return changes, {change.path: self.get_diff(change.path) for change in changes}
 
     def stage_files(self, files):
         self.staged.append(list(files))
@@ -112,7 +116,7 @@ class TestCLIMoreFlows(unittest.TestCase):
                 with patch.object(cli, "GitClient", return_value=dummy):
                     group_list = []  # no groups generated
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator(group_list)):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             result = runner.invoke(cli.main, [])
                             self.assertEqual(result.exit_code, cli.EXIT_GENERIC_ERROR)
 
@@ -128,7 +132,7 @@ class TestCLIMoreFlows(unittest.TestCase):
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change"})
                     # Always edit message
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             with patch.object(cli, "prompt_user", return_value="edited message"):
                                 result = runner.invoke(cli.main, [])
                                 self.assertEqual(result.exit_code, cli.EXIT_SUCCESS)
@@ -39,6 +39,10 @@ class DummyGitClient:
 
     def get_diff(self, path):
         return self.diffs.get(path, "")
+    
+    def get_changes_with_diffs(self):
+        changes = self.get_changes()
+        return changes, {change.path: self.get_diff(change.path) for change in changes}
 
     def stage_files(self, files):
         self.staged.append(list(files))
@@ -73,13 +77,34 @@ class TestBranchCreation(unittest.TestCase):
                 with patch.object(cli, "GitClient", return_value=dummy):
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change"})
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             result = runner.invoke(cli.main, ["--yes"])
                             self.assertEqual(result.exit_code, cli.EXIT_SUCCESS)
                             # Should not create a new branch
                             self.assertIsNone(dummy.branch_created)
                             self.assertEqual(dummy.current_branch, "main")
 
+    def test_commits_pushed_once(self):
+        """Test that all commit groups are pushed with a single push."""
+        runner = CliRunner()
+        with patch.object(cli, "detect_vcs", return_value=("git", Path("/repo"))):
+            with patch.object(cli, "load_config", return_value={"base_url": "http://", "port": 1, "model": "m"}):
+                dummy = DummyGitClient(Path("/repo"))
+                dummy.changes = [SimpleNamespace(path="a.py", status="M"), SimpleNamespace(path="b.py", status="M")]
+                dummy.diffs = {"a.py": "+change", "b.py": "+fix"}
+                
+                with patch.object(cli, "GitClient", return_value=dummy):
+                    groups = [
+                        CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change"}),
+                        CommitGroup(type="fix", files=["b.py"], message="fix: msg", diffs={"b.py": "+fix"}),
+                    ]
+                    with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator(groups)):
+                        with patch.object(cli, "OllamaClient"):
+                            result = runner.invoke(cli.main, ["--yes"])
+                            self.assertEqual(result.exit_code, cli.EXIT_SUCCESS)
+                            self.assertEqual(dummy.commits, ["feat: msg", "fix: msg"])
+                            self.assertEqual(dummy.pushed, 1)
+
     def test_branch_creation_decline(self):
         """Test declining branch creation."""
         runner = CliRunner()
@@ -92,7 +117,7 @@ class TestBranchCreation(unittest.TestCase):
                 with patch.object(cli, "GitClient", return_value=dummy):
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change"})
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             # Simulate user declining branch creation, then accepting commit
                             with patch("click.confirm", return_value=False):
                                 with patch.object(cli, "prompt_user", return_value="feat: msg"):
@@ -114,7 +139,7 @@ class TestBranchCreation(unittest.TestCase):
                 with patch.object(cli, "GitClient", return_value=dummy):
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change"})
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             # Simulate user accepting branch creation
                             with patch("click.confirm", return_value=True):
                                 with patch("click.prompt", return_value="feature-branch"):
@@ -138,7 +163,7 @@ class TestBranchCreation(unittest.TestCase):
                 with patch.object(cli, "GitClient", return_value=dummy):
                     group = CommitGroup(type="feat", files=["a.py"], message="feat: msg", diffs={"a.py": "+change"})
                     with patch.object(cli, "CommitMessageGenerator", return_value=DummyGenerator([group])):
-                        with patch.object(cli, "OllamaClient", return_value=None):
+                        with patch.object(cli, "OllamaClient"):
                             # Simulate user trying existing branch, then declining retry
                             confirm_calls = [True, False]  # Accept branch creation, then decline retry
                             prompt_calls = ["existing-branch"]  # Try existing branch name
@@ -5,7 +5,10 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from click.testing import CliRunner
 
-from vc_commit_helper.cli import main, detect_vcs, prompt_user, EXIT_NO_REPO, EXIT_SUCCESS, EXIT_ALL_DECLINED
+from vc_commit_helper.cli import (
+    main, detect_vcs, edit_messages, prompt_user, EDIT_DEFERRED, _commit_groups, _review_groups,
+    EXIT_NO_REPO, EXIT_SUCCESS, EXIT_ALL_DECLINED,
+)
 from vc_commit_helper.grouping.group_model import CommitGroup
 
 
@@ -14,35 +17,31 @@ class TestCLIComprehensive(unittest.TestCase):
 
     def test_detect_vcs_both_repos_found(self):
         """Test detect_vcs when both Git and SVN are found."""
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=Path("/repo")):
-            with patch("vc_commit_helper.cli.SVNClient.find_repo_root", return_value=Path("/repo")):
-                with self.assertRaises(SystemExit) as ctx:
-                    detect_vcs(Path("/repo"))
-                self.assertEqual(ctx.exception.code, EXIT_NO_REPO)
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={"git": Path("/repo"), "svn": Path("/repo")}):
+            with self.assertRaises(SystemExit) as ctx:
+                detect_vcs(Path("/repo"))
+            self.assertEqual(ctx.exception.code, EXIT_NO_REPO)
 
     def test_detect_vcs_no_repo_found(self):
         """Test detect_vcs when no repository is found."""
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=None):
-            with patch("vc_commit_helper.cli.SVNClient.find_repo_root", return_value=None):
-                with self.assertRaises(SystemExit) as ctx:
-                    detect_vcs(Path("/repo"))
-                self.assertEqual(ctx.exception.code, EXIT_NO_REPO)
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={}):
+            with self.assertRaises(SystemExit) as ctx:
+                detect_vcs(Path("/repo"))
+            self.assertEqual(ctx.exception.code, EXIT_NO_REPO)
 
     def test_detect_vcs_git_found(self):
         """Test detect_vcs when Git repository is found."""
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=Path("/repo")):
-            with patch("vc_commit_helper.cli.SVNClient.find_repo_root", return_value=None):
-                vcs_type, repo_root = detect_vcs(Path("/repo"))
-                self.assertEqual(vcs_type, "git")
-                self.assertEqual(repo_root, Path("/repo"))
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={"git": Path("/repo")}):
+            vcs_type, repo_root = detect_vcs(Path("/repo"))
+            self.assertEqual(vcs_type, "git")
+            self.assertEqual(repo_root, Path("/repo"))
 
     def test_detect_vcs_svn_found(self):
         """Test detect_vcs when SVN repository is found."""
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=None):
-            with patch("vc_commit_helper.cli.SVNClient.find_repo_root", return_value=Path("/repo")):
-                vcs_type, repo_root = detect_vcs(Path("/repo"))
-                self.assertEqual(vcs_type, "svn")
-                self.assertEqual(repo_root, Path("/repo"))
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={"svn": Path("/repo")}):
+            vcs_type, repo_root = detect_vcs(Path("/repo"))
+            self.assertEqual(vcs_type, "svn")
+            self.assertEqual(repo_root, Path("/repo"))
 
     @patch("vc_commit_helper.cli.click.prompt")
     def test_prompt_user_accept(self, mock_prompt):
@@ -149,6 +148,89 @@ class TestCLIComprehensive(unittest.TestCase):
         result = prompt_user(group, 1, 1)
         self.assertEqual(result, "[feat]: add test")
 
+    @patch("vc_commit_helper.cli._run_editor")
+    @patch("vc_commit_helper.cli.click.prompt")
+    @patch("os.environ.get")
+    def test_prompt_user_deferred_edit(self, mock_env_get, mock_prompt, mock_editor):
+        """Test that prompt_user defers editing when asked to."""
+        mock_env_get.return_value = "vim"
+        mock_prompt.return_value = "e"
+        group = CommitGroup(type="feat", files=["test.py"], message="[feat]: add test", diffs={})
+        result = prompt_user(group, 1, 1, defer_edit=True)
+        self.assertIs(result, EDIT_DEFERRED)
+        mock_editor.assert_not_called()
+
+    def test_edit_messages_single_editor_session(self):
+        """Test that several messages are edited in one editor run."""
+        groups = [
+            CommitGroup(type="feat", files=["a.py"], message="[feat]: add a", diffs={}),
+            CommitGroup(type="fix", files=["b.py"], message="[fix]: fix b", diffs={}),
+        ]
+
+        def fake_editor(editor, text):
+            return text.replace("add a", "add A")
+
+        with patch("vc_commit_helper.cli._run_editor", side_effect=fake_editor) as mock_editor:
+            result = edit_messages("vim", groups)
+        mock_editor.assert_called_once()
+        self.assertEqual(result, ["[feat]: add A", "[fix]: fix b"])
+
+    def test_edit_messages_empty_message_keeps_original(self):
+        """Test that a message cleared in the editor falls back to the original."""
+        groups = [CommitGroup(type="feat", files=["a.py"], message="[feat]: add a", diffs={})]
+        with patch("vc_commit_helper.cli._run_editor", return_value="\n") as mock_editor:
+            result = edit_messages("vim", groups)
+        # A single message is edited without marker lines
+        self.assertEqual(mock_editor.call_args.args[1], "[feat]: add a")
+        self.assertEqual(result, ["[feat]: add a"])
+
+    def test_edit_messages_removed_marker(self):
+        """Test that removing a marker line is reported as an error."""
+        groups = [
+            CommitGroup(type="feat", files=["a.py"], message="[feat]: add a", diffs={}),
+            CommitGroup(type="fix", files=["b.py"], message="[fix]: fix b", diffs={}),
+        ]
+        with patch("vc_commit_helper.cli._run_editor", return_value="[feat]: add a\n[fix]: fix b\n"):
+            with self.assertRaises(ValueError):
+                edit_messages("vim", groups)
+
+    @patch.dict("os.environ", {"EDITOR": "vim"})
+    def test_review_groups_edits_deferred_messages_together(self):
+        """Test that deferred edits keep group order and declines are dropped."""
+        groups = [
+            CommitGroup(type="feat", files=["a.py"], message="[feat]: add a", diffs={}),
+            CommitGroup(type="fix", files=["b.py"], message="[fix]: fix b", diffs={}),
+            CommitGroup(type="docs", files=["c.md"], message="[docs]: doc c", diffs={}),
+        ]
+        with patch("vc_commit_helper.cli.prompt_user", side_effect=[EDIT_DEFERRED, None, EDIT_DEFERRED]), \
+                patch("vc_commit_helper.cli.edit_messages", return_value=["[feat]: A", "[docs]: C"]) as mock_edit:
+            accepted, declined = _review_groups(groups)
+        mock_edit.assert_called_once_with("vim", [groups[0], groups[2]])
+        self.assertEqual(accepted, [(groups[0], "[feat]: A"), (groups[2], "[docs]: C")])
+        self.assertEqual(declined, [groups[1]])
+
+    @patch.dict("os.environ", {"EDITOR": "vim"})
+    def test_review_groups_editor_failure_falls_back_to_prompt(self):
+        """Test that a failing editor reviews the deferred groups again."""
+        groups = [CommitGroup(type="feat", files=["a.py"], message="[feat]: add a", diffs={})]
+        with patch("vc_commit_helper.cli.prompt_user", side_effect=[EDIT_DEFERRED, None]) as mock_prompt, \
+                patch("vc_commit_helper.cli.edit_messages", side_effect=OSError("no editor")):
+            accepted, declined = _review_groups(groups)
+        mock_prompt.assert_called_with(groups[0], 1, 1)
+        self.assertEqual(accepted, [])
+        self.assertEqual(declined, groups)
+
+    def test_commit_groups_pushes_git_commits_once(self):
+        """Test that Git groups are committed one by one and pushed once."""
+        groups = [
+            CommitGroup(type="feat", files=["a.py"], message="[feat]: add a", diffs={}),
+            CommitGroup(type="fix", files=["b.py"], message="[fix]: fix b", diffs={}),
+        ]
+        client = Mock()
+        _commit_groups(client, "git", [(group, group.message) for group in groups], [], branch_created=True)
+        self.assertEqual(client.commit.call_count, 2)
+        client.push.assert_called_once_with(set_upstream=True)
+
     def test_main_with_forced_git_not_found(self):
         """Test main with --vcs=git when not in a Git repo."""
         runner = CliRunner()
@@ -157,6 +239,17 @@ class TestCLIComprehensive(unittest.TestCase):
             self.assertNotEqual(result.exit_code, 0)
             self.assertIn("not inside a Git repository", result.output)
 
+    def test_main_with_forced_vcs_skips_detection(self):
+        """Test that --vcs only looks for the forced VCS type."""
+        runner = CliRunner()
+        with patch("vc_commit_helper.cli.detect_vcs") as mock_detect:
+            with patch("vc_commit_helper.cli.SVNClient.find_repo_root") as mock_svn_root:
+                with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=None) as mock_git_root:
+                    runner.invoke(main, ["--vcs", "git"])
+        mock_detect.assert_not_called()
+        mock_svn_root.assert_not_called()
+        mock_git_root.assert_called_once()
+
     def test_main_with_forced_svn_not_found(self):
         """Test main with --vcs=svn when not in an SVN repo."""
         runner = CliRunner()
@@ -182,12 +275,11 @@ class TestCLIComprehensive(unittest.TestCase):
                 diffs={"test.py": "+test"}
             )
         ]
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=Path("/repo")):
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={"git": Path("/repo")}):
             with patch("vc_commit_helper.cli.load_config", return_value=mock_config):
                 with patch("vc_commit_helper.cli.GitClient") as mock_git_class:
                     mock_client = Mock()
-                    mock_client.get_changes.return_value = mock_changes
-                    mock_client.get_diff.return_value = "+test"
+                    mock_client.get_changes_with_diffs.return_value = (mock_changes, {"test.py": "+test"})
                     mock_git_class.return_value = mock_client
                     with patch("vc_commit_helper.cli.CommitMessageGenerator") as mock_gen_class:
                         mock_gen = Mock()
@@ -213,20 +305,18 @@ class TestCLIComprehensive(unittest.TestCase):
                 diffs={"test.py": "+test"}
             )
         ]
-        with patch("vc_commit_helper.cli.SVNClient.find_repo_root", return_value=Path("/repo")):
-            with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=None):
-                with patch("vc_commit_helper.cli.load_config", return_value=mock_config):
-                    with patch("vc_commit_helper.cli.SVNClient") as mock_svn_class:
-                        mock_client = Mock()
-                        mock_client.get_changes.return_value = mock_changes
-                        mock_client.get_diff.return_value = "+test"
-                        mock_svn_class.return_value = mock_client
-                        with patch("vc_commit_helper.cli.CommitMessageGenerator") as mock_gen_class:
-                            mock_gen = Mock()
-                            mock_gen.generate_groups.return_value = mock_groups
-                            mock_gen_class.return_value = mock_gen
-                            result = runner.invoke(main, ["--yes"])
-                            self.assertEqual(result.exit_code, EXIT_SUCCESS)
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={"svn": Path("/repo")}):
+            with patch("vc_commit_helper.cli.load_config", return_value=mock_config):
+                with patch("vc_commit_helper.cli.SVNClient") as mock_svn_class:
+                    mock_client = Mock()
+                    mock_client.get_changes_with_diffs.return_value = (mock_changes, {"test.py": "+test"})
+                    mock_svn_class.return_value = mock_client
+                    with patch("vc_commit_helper.cli.CommitMessageGenerator") as mock_gen_class:
+                        mock_gen = Mock()
+                        mock_gen.generate_groups.return_value = mock_groups
+                        mock_gen_class.return_value = mock_gen
+                        result = runner.invoke(main, ["--yes"])
+                        self.assertEqual(result.exit_code, EXIT_SUCCESS)
 
     def test_main_all_groups_declined(self):
         """Test main when all groups are declined."""
@@ -245,12 +335,11 @@ class TestCLIComprehensive(unittest.TestCase):
                 diffs={"test.py": "+test"}
             )
         ]
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=Path("/repo")):
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={"git": Path("/repo")}):
             with patch("vc_commit_helper.cli.load_config", return_value=mock_config):
                 with patch("vc_commit_helper.cli.GitClient") as mock_git_class:
                     mock_client = Mock()
-                    mock_client.get_changes.return_value = mock_changes
-                    mock_client.get_diff.return_value = "+test"
+                    mock_client.get_changes_with_diffs.return_value = (mock_changes, {"test.py": "+test"})
                     mock_git_class.return_value = mock_client
                     with patch("vc_commit_helper.cli.CommitMessageGenerator") as mock_gen_class:
                         mock_gen = Mock()
@@ -263,10 +352,9 @@ class TestCLIComprehensive(unittest.TestCase):
     def test_main_with_verbose_flag(self):
         """Test main with --verbose flag."""
         runner = CliRunner()
-        with patch("vc_commit_helper.cli.GitClient.find_repo_root", return_value=None):
-            with patch("vc_commit_helper.cli.SVNClient.find_repo_root", return_value=None):
-                result = runner.invoke(main, ["--verbose"])
-                self.assertNotEqual(result.exit_code, 0)
+        with patch("vc_commit_helper.cli.find_vcs_roots", return_value={}):
+            result = runner.invoke(main, ["--verbose"])
+            self.assertNotEqual(result.exit_code, 0)
 
     def test_main_with_generic_exception(self):
         """Test main with unexpected exception."""
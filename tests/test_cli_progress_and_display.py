@@ -6,8 +6,10 @@ from io import StringIO
 
 from vc_commit_helper.cli import (
     ProgressIndicator,
+    StreamProgress,
     print_step,
     print_info,
+    print_info_batch,
     print_success,
     print_warning,
     print_error,
@@ -15,12 +17,33 @@ from vc_commit_helper.cli import (
 )
 
 
+class TestStreamProgress(unittest.TestCase):
+    """Tests for reporting streamed LLM output."""
+
+    def test_counts_fragments_and_throttles_updates(self):
+        """Test that received text is counted and redraws are throttled."""
+        progress = MagicMock()
+        callback = StreamProgress(progress, "Generating", interval=60)
+
+        with patch('vc_commit_helper.cli.time.monotonic', side_effect=[100.0, 101.0, 200.0]):
+            callback("[feat]: ")
+            callback("add")
+            callback(" x\n")
+
+        self.assertEqual(callback.received, 14)
+        self.assertEqual(
+            [c.args[0] for c in progress.update.call_args_list],
+            ["Generating (8 characters received)", "Generating (14 characters received)"],
+        )
+
+
 class TestProgressIndicator(unittest.TestCase):
     """Tests for ProgressIndicator context manager."""
 
+    @patch('vc_commit_helper.cli._stdout_is_tty', return_value=True)
     @patch('vc_commit_helper.cli.click.echo')
     @patch('vc_commit_helper.cli.time.time')
-    def test_progress_with_spinner(self, mock_time, mock_echo):
+    def test_progress_with_spinner(self, mock_time, mock_echo, mock_tty):
         """Test progress indicator with spinner enabled."""
         mock_time.side_effect = [0.0, 1.5]
         
@@ -34,6 +57,21 @@ class TestProgressIndicator(unittest.TestCase):
         # Second call should have checkmark and time
         self.assertIn("✓", str(mock_echo.call_args_list[1]))
         self.assertIn("1.5s", str(mock_echo.call_args_list[1]))
+        self.assertIn("\\r", str(mock_echo.call_args_list[1]))
+
+    @patch('vc_commit_helper.cli._stdout_is_tty', return_value=False)
+    @patch('vc_commit_helper.cli.click.echo')
+    @patch('vc_commit_helper.cli.time.time')
+    def test_progress_spinner_disabled_without_tty(self, mock_time, mock_echo, mock_tty):
+        """Test that redirected output gets plain lines instead of a spinner."""
+        mock_time.side_effect = [0.0, 1.5]
+        
+        with ProgressIndicator("Processing", show_spinner=True):
+            pass
+        
+        self.assertEqual(mock_echo.call_count, 2)
+        self.assertIn("→ Processing...", mock_echo.call_args_list[0].args[0])
+        self.assertNotIn("\r", mock_echo.call_args_list[1].args[0])
 
     @patch('vc_commit_helper.cli.click.echo')
     @patch('vc_commit_helper.cli.time.time')
@@ -50,8 +88,9 @@ class TestProgressIndicator(unittest.TestCase):
         self.assertIn("→", str(mock_echo.call_args_list[0]))
         self.assertIn("Loading", str(mock_echo.call_args_list[0]))
 
+    @patch('vc_commit_helper.cli._stdout_is_tty', return_value=True)
     @patch('vc_commit_helper.cli.click.echo')
-    def test_progress_update(self, mock_echo):
+    def test_progress_update(self, mock_echo, mock_tty):
         """Test updating progress message."""
         with ProgressIndicator("Working", show_spinner=True) as p:
             p.update("Still working")
@@ -59,6 +98,17 @@ class TestProgressIndicator(unittest.TestCase):
         # Should have called echo at least 3 times (start, update, end)
         self.assertGreaterEqual(mock_echo.call_count, 3)
 
+    @patch('vc_commit_helper.cli._stdout_is_tty', return_value=False)
+    @patch('vc_commit_helper.cli.click.echo')
+    def test_progress_update_not_redrawn_without_tty(self, mock_echo, mock_tty):
+        """Test that spinner redraws are skipped when output is redirected."""
+        with ProgressIndicator("Working", show_spinner=True) as p:
+            p.update("Still working")
+        
+        # Only start and end are written
+        self.assertEqual(mock_echo.call_count, 2)
+        self.assertNotIn("Still working", str(mock_echo.call_args_list))
+
 
 class TestDisplayUtilities(unittest.TestCase):
     """Tests for display utility functions."""
@@ -82,6 +132,21 @@ class TestDisplayUtilities(unittest.TestCase):
         mock_echo.assert_called_once()
         self.assertIn("Information message", str(mock_echo.call_args))
 
+    @patch('vc_commit_helper.cli.click.echo')
+    def test_print_info_batch(self, mock_echo):
+        """Test printing several info messages with one write."""
+        print_info_batch(["first", "second"], indent=1)
+        
+        mock_echo.assert_called_once()
+        self.assertEqual(mock_echo.call_args.args[0], "  ℹ first\n  ℹ second")
+
+    @patch('vc_commit_helper.cli.click.echo')
+    def test_print_info_batch_empty(self, mock_echo):
+        """Test that an empty batch prints nothing."""
+        print_info_batch([])
+        
+        mock_echo.assert_not_called()
+
     @patch('vc_commit_helper.cli.click.echo')
     def test_print_info_with_indent(self, mock_echo):
         """Test info message with indentation."""
@@ -120,15 +185,17 @@ class TestDisplayUtilities(unittest.TestCase):
         """Test summary box printing."""
         print_summary_box("Summary", ["Item 1", "Item 2", "Item 3"])
         
-        # Should print multiple lines: top border, title, separator, items, bottom border
-        self.assertGreaterEqual(mock_echo.call_count, 7)
-        call_args = [str(call) for call in mock_echo.call_args_list]
+        # The whole box is written at once: top border, title, separator,
+        # items, bottom border
+        mock_echo.assert_called_once()
+        lines = mock_echo.call_args.args[0].strip("\n").split("\n")
+        self.assertEqual(len(lines), 7)
         
         # Check for box characters
-        self.assertTrue(any("┌" in arg for arg in call_args))
-        self.assertTrue(any("└" in arg for arg in call_args))
-        self.assertTrue(any("Summary" in arg for arg in call_args))
-        self.assertTrue(any("Item 1" in arg for arg in call_args))
+        self.assertIn("┌", lines[0])
+        self.assertIn("└", lines[-1])
+        self.assertIn("Summary", lines[1])
+        self.assertIn("Item 1", lines[3])
 
     @patch('vc_commit_helper.cli.click.echo')
     def test_print_summary_box_empty(self, mock_echo):
@@ -136,7 +203,8 @@ class TestDisplayUtilities(unittest.TestCase):
         print_summary_box("Empty Summary", [])
         
         # Should still print borders and title
-        self.assertGreaterEqual(mock_echo.call_count, 4)
+        mock_echo.assert_called_once()
+        self.assertEqual(len(mock_echo.call_args.args[0].strip("\n").split("\n")), 4)
 
 
 if __name__ == "__main__":
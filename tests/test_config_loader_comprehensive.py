@@ -27,7 +27,7 @@ class TestConfigLoaderComprehensive(unittest.TestCase):
         """Test ConfigError when config file doesn't exist."""
         mock_config_dir = MagicMock()
         mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = False
+        mock_config_path.stat.side_effect = FileNotFoundError()
         mock_config_dir.__truediv__.return_value = mock_config_path
         mock_get_config_dir.return_value = mock_config_dir
         
@@ -40,8 +40,7 @@ class TestConfigLoaderComprehensive(unittest.TestCase):
         """Test ConfigError on malformed JSON."""
         mock_config_dir = MagicMock()
         mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-        mock_config_path.read_text.return_value = "{ invalid json"
+        mock_config_path.read_bytes.return_value = b"{ invalid json"
         mock_config_path.name = ".ollama_config.json"
         mock_config_dir.__truediv__.return_value = mock_config_path
         mock_get_config_dir.return_value = mock_config_dir
@@ -55,8 +54,7 @@ class TestConfigLoaderComprehensive(unittest.TestCase):
         """Test ConfigError when required keys are missing."""
         mock_config_dir = MagicMock()
         mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-        mock_config_path.read_text.return_value = json.dumps({"base_url": "http://localhost"})
+        mock_config_path.read_bytes.return_value = json.dumps({"base_url": "http://localhost"}).encode()
         mock_config_path.name = ".ollama_config.json"
         mock_config_dir.__truediv__.return_value = mock_config_path
         mock_get_config_dir.return_value = mock_config_dir
@@ -80,8 +78,7 @@ class TestConfigLoaderComprehensive(unittest.TestCase):
             with self.subTest(config=config_data):
                 mock_config_dir = MagicMock()
                 mock_config_path = MagicMock()
-                mock_config_path.exists.return_value = True
-                mock_config_path.read_text.return_value = json.dumps(config_data)
+                mock_config_path.read_bytes.return_value = json.dumps(config_data).encode()
                 mock_config_path.name = ".ollama_config.json"
                 mock_config_dir.__truediv__.return_value = mock_config_path
                 mock_get_config_dir.return_value = mock_config_dir
@@ -103,8 +100,7 @@ class TestConfigLoaderComprehensive(unittest.TestCase):
         
         mock_config_dir = MagicMock()
         mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-        mock_config_path.read_text.return_value = json.dumps(config_data)
+        mock_config_path.read_bytes.return_value = json.dumps(config_data).encode()
         mock_config_path.name = ".ollama_config.json"
         mock_config_dir.__truediv__.return_value = mock_config_path
         mock_get_config_dir.return_value = mock_config_dir
@@ -117,8 +113,7 @@ class TestConfigLoaderComprehensive(unittest.TestCase):
         """Test ConfigError when file cannot be read."""
         mock_config_dir = MagicMock()
         mock_config_path = MagicMock()
-        mock_config_path.exists.return_value = True
-        mock_config_path.read_text.side_effect = OSError("Permission denied")
+        mock_config_path.read_bytes.side_effect = OSError("Permission denied")
         mock_config_path.name = ".ollama_config.json"
         mock_config_dir.__truediv__.return_value = mock_config_path
         mock_get_config_dir.return_value = mock_config_dir
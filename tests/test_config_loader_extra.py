@@ -60,6 +60,40 @@ class TestConfigLoaderExtra(unittest.TestCase):
                     load_config()
                 self.assertIn("'max_tokens' must be an integer", str(cm.exception))
 
+    def test_invalid_max_concurrency(self) -> None:
+        for value in (0, "4"):
+            with self.subTest(value=value), tempfile.TemporaryDirectory() as tmp:
+                config_dir = Path(tmp)
+                self._write_config(config_dir, {"base_url": "http://", "port": 1, "model": "m", "max_concurrency": value})
+                with patch('vc_commit_helper.config.loader._get_config_directory', return_value=config_dir):
+                    with self.assertRaises(ConfigError) as cm:
+                        load_config()
+                    self.assertIn("'max_concurrency' must be a positive integer", str(cm.exception))
+
+    def test_min_diff_lines_for_llm(self) -> None:
+        for value, error in ((0, None), (3, None), (-1, True), (1.5, True)):
+            with self.subTest(value=value), tempfile.TemporaryDirectory() as tmp:
+                config_dir = Path(tmp)
+                self._write_config(
+                    config_dir, {"base_url": "http://", "port": 1, "model": "m", "min_diff_lines_for_llm": value}
+                )
+                with patch('vc_commit_helper.config.loader._get_config_directory', return_value=config_dir):
+                    if error is None:
+                        self.assertEqual(load_config()["min_diff_lines_for_llm"], value)
+                        continue
+                    with self.assertRaises(ConfigError) as cm:
+                        load_config()
+                    self.assertIn("'min_diff_lines_for_llm' must be a non-negative integer", str(cm.exception))
+
+    def test_missing_keys_reported_before_invalid_max_concurrency(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_dir = Path(tmp)
+            self._write_config(config_dir, {"base_url": "http://", "port": 1, "max_concurrency": 0})
+            with patch('vc_commit_helper.config.loader._get_config_directory', return_value=config_dir):
+                with self.assertRaises(ConfigError) as cm:
+                    load_config()
+                self.assertIn("Missing required configuration keys: model", str(cm.exception))
+
     def test_valid_optional_fields(self) -> None:
         """Test that valid optional fields are accepted."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -95,6 +129,38 @@ class TestConfigLoaderExtra(unittest.TestCase):
                 self.assertNotIn("request_timeout", result)
                 self.assertNotIn("max_tokens", result)
 
+    def test_unchanged_config_is_not_read_again(self) -> None:
+        """Test that a validated config is cached while the file is unchanged."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_dir = Path(tmp)
+            self._write_config(config_dir, {"base_url": "http://localhost", "port": 1, "model": "m"})
+            with patch('vc_commit_helper.config.loader._get_config_directory', return_value=config_dir):
+                first = load_config()
+                first["model"] = "modified by caller"
+                with patch.object(Path, "read_bytes", side_effect=AssertionError("config re-read")):
+                    second = load_config()
+                self.assertEqual(second["model"], "m")
+
+    def test_changed_config_is_reloaded(self) -> None:
+        """Test that modifying the config file invalidates the cache."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_dir = Path(tmp)
+            self._write_config(config_dir, {"base_url": "http://localhost", "port": 1, "model": "m"})
+            with patch('vc_commit_helper.config.loader._get_config_directory', return_value=config_dir):
+                self.assertEqual(load_config()["model"], "m")
+                self._write_config(config_dir, {"base_url": "http://localhost", "port": 1, "model": "llama3"})
+                self.assertEqual(load_config()["model"], "llama3")
+
+    def test_non_utf8_config_raises_config_error(self) -> None:
+        """Test that a config file that is not valid UTF-8 is reported as invalid."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_dir = Path(tmp)
+            (config_dir / ".ollama_config.json").write_bytes(b'{"model": "\xff"}')
+            with patch('vc_commit_helper.config.loader._get_config_directory', return_value=config_dir):
+                with self.assertRaises(ConfigError) as cm:
+                    load_config()
+                self.assertIn("Invalid JSON", str(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
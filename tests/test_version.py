@@ -2,12 +2,16 @@
 Tests for dynamic version generation.
 """
 
+import os
 import subprocess
+import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from vc_commit_helper._version import (
+    _generate_version,
     generate_version,
     get_git_commit_sha,
     get_minor_version_from_tags,
@@ -17,6 +21,15 @@ from vc_commit_helper._version import (
 class TestVersionGeneration(unittest.TestCase):
     """Test dynamic version generation functionality."""
 
+    def setUp(self):
+        # Keep mocked results out of the process-wide version cache
+        _generate_version.cache_clear()
+        self.addCleanup(_generate_version.cache_clear)
+        # Exercise the git subprocess fallback rather than reading .git
+        patcher = patch("vc_commit_helper._version._git_dirs", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_get_git_commit_sha_returns_sha(self):
         """Test that get_git_commit_sha returns a valid SHA."""
         sha = get_git_commit_sha()
@@ -147,6 +160,90 @@ class TestVersionGeneration(unittest.TestCase):
         version = generate_version("0")
         self.assertEqual(version, "0.1.dev0")
 
+    @patch("vc_commit_helper._version.get_git_commit_sha")
+    @patch("vc_commit_helper._version.get_minor_version_from_tags")
+    def test_generate_version_is_memoized_per_repo_path(self, mock_minor, mock_sha):
+        """Test that git is only queried once per base version and path."""
+        mock_minor.return_value = 1
+        mock_sha.return_value = "abc1234"
+
+        self.assertEqual(generate_version("0"), generate_version("0"))
+        self.assertEqual(mock_minor.call_count, 1)
+        self.assertEqual(mock_sha.call_count, 1)
+
+        generate_version("0", Path("/other/repo"))
+        self.assertEqual(mock_sha.call_count, 2)
+        mock_sha.assert_called_with(Path("/other/repo"))
+
+
+class TestVersionFromGitFiles(unittest.TestCase):
+    """Test reading HEAD and tags directly from the git directory."""
+
+    SHA = "0123456789abcdef0123456789abcdef01234567"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name)
+        self.git_dir = self.repo / ".git"
+        (self.git_dir / "refs" / "heads").mkdir(parents=True)
+        (self.git_dir / "refs" / "tags").mkdir()
+        (self.git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        env = patch.dict("os.environ")
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("GIT_DIR", None)
+        os.environ.pop("GIT_WORK_TREE", None)
+        # Any git invocation would mean the files were not used
+        run = patch("vc_commit_helper._version.subprocess.run", side_effect=AssertionError)
+        run.start()
+        self.addCleanup(run.stop)
+
+    def test_sha_from_loose_branch_ref(self):
+        (self.git_dir / "refs" / "heads" / "main").write_text(self.SHA + "\n")
+        subdir = self.repo / "src"
+        subdir.mkdir()
+        self.assertEqual(get_git_commit_sha(subdir), "0123456")
+
+    def test_sha_from_packed_refs(self):
+        (self.git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            f"{self.SHA} refs/heads/main\n"
+        )
+        self.assertEqual(get_git_commit_sha(self.repo), "0123456")
+
+    def test_sha_from_detached_head(self):
+        (self.git_dir / "HEAD").write_text(self.SHA + "\n")
+        self.assertEqual(get_git_commit_sha(self.repo), "0123456")
+
+    def test_sha_from_linked_worktree(self):
+        worktree = self.repo / "wt"
+        wt_git_dir = self.git_dir / "worktrees" / "wt"
+        wt_git_dir.mkdir(parents=True)
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {wt_git_dir}\n")
+        (wt_git_dir / "commondir").write_text("../..\n")
+        (wt_git_dir / "HEAD").write_text("ref: refs/heads/feature\n")
+        (self.git_dir / "refs" / "heads" / "feature").write_text(self.SHA + "\n")
+        self.assertEqual(get_git_commit_sha(worktree), "0123456")
+
+    def test_minor_version_from_loose_and_packed_tags(self):
+        (self.git_dir / "refs" / "tags" / "v0.2").write_text(self.SHA + "\n")
+        (self.git_dir / "refs" / "tags" / "v1.9").write_text(self.SHA + "\n")
+        (self.git_dir / "packed-refs").write_text(
+            f"{self.SHA} refs/tags/v0.5\n"
+            f"^{self.SHA}\n"
+            f"{self.SHA} refs/heads/main\n"
+        )
+        self.assertEqual(get_minor_version_from_tags(self.repo, "0"), 5)
+        self.assertEqual(get_minor_version_from_tags(self.repo, "1"), 9)
+
+    def test_falls_back_to_git_for_unborn_branch(self):
+        with patch("vc_commit_helper._version.subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+            self.assertEqual(get_git_commit_sha(self.repo), "unknown")
+        mock_run.assert_called_once()
+
 
 class TestVersionImport(unittest.TestCase):
     """Test that version can be imported correctly."""
@@ -172,6 +269,20 @@ class TestVersionImport(unittest.TestCase):
         self.assertIsInstance(__base_version__, str)
         self.assertEqual(__base_version__, "0")
 
+    def test_package_import_does_not_load_vcs_clients(self):
+        """Test that generating the version on import skips the vcs package."""
+        import vc_commit_helper
+
+        env = dict(os.environ, PYTHONPATH=str(Path(vc_commit_helper.__file__).parents[1]))
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, vc_commit_helper; print('vc_commit_helper.vcs' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
 
 if __name__ == "__main__":
     unittest.main()
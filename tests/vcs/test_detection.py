@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from vc_commit_helper.vcs.detection import find_vcs_roots
+
+
+class TestFindVcsRoots(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        env = {k: v for k, v in os.environ.items() if k not in ("GIT_DIR", "GIT_WORK_TREE")}
+        self._env = patch.dict(os.environ, env, clear=True)
+        self._env.start()
+
+    def tearDown(self) -> None:
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def test_finds_nearest_root_of_each_type(self) -> None:
+        (self.root / ".svn").mkdir()
+        (self.root / "project" / ".git").mkdir(parents=True)
+        start = self.root / "project" / "src"
+        start.mkdir()
+        roots = find_vcs_roots(start)
+        self.assertEqual(roots, {"git": self.root / "project", "svn": self.root})
+
+    def test_git_file_marker_is_detected(self) -> None:
+        # Worktrees and submodules use a ``.git`` file instead of a directory
+        (self.root / ".git").write_text("gitdir: ../.git/worktrees/x\n")
+        self.assertEqual(find_vcs_roots(self.root, ("git",)), {"git": self.root})
+
+    def test_lists_each_directory_once(self) -> None:
+        (self.root / ".git").mkdir()
+        start = self.root / "a" / "b"
+        start.mkdir(parents=True)
+        with patch("vc_commit_helper.vcs.detection.os.scandir", wraps=os.scandir) as mock_scandir:
+            roots = find_vcs_roots(start, ("git",))
+        self.assertEqual(roots, {"git": self.root})
+        self.assertEqual(mock_scandir.call_count, 3)
+
+    def test_unlistable_directory_falls_back_to_exists(self) -> None:
+        (self.root / ".svn").mkdir()
+        with patch("vc_commit_helper.vcs.detection.os.scandir", side_effect=PermissionError):
+            self.assertEqual(find_vcs_roots(self.root, ("svn",)), {"svn": self.root})
+
+    def test_git_work_tree_environment_skips_walk(self) -> None:
+        os.environ["GIT_WORK_TREE"] = str(self.root)
+        with patch("vc_commit_helper.vcs.detection.os.scandir") as mock_scandir:
+            roots = find_vcs_roots(Path("/"), ("git",))
+        self.assertEqual(roots, {"git": self.root})
+        mock_scandir.assert_not_called()
+
+    def test_git_dir_environment_names_work_tree(self) -> None:
+        (self.root / ".git").mkdir()
+        os.environ["GIT_DIR"] = str(self.root / ".git")
+        self.assertEqual(find_vcs_roots(Path("/")), {"git": self.root})
+
+    def test_non_standard_git_dir_falls_back_to_walk(self) -> None:
+        bare = self.root / "repo.git"
+        bare.mkdir()
+        (self.root / "work" / ".git").mkdir(parents=True)
+        os.environ["GIT_DIR"] = str(bare)
+        roots = find_vcs_roots(self.root / "work", ("git",))
+        self.assertEqual(roots, {"git": self.root / "work"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 """Tests for Git branch operations."""
 
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -39,6 +41,33 @@ class TestGitBranchOperations(unittest.TestCase):
         with self.assertRaises(GitError):
             client.get_current_branch()
 
+    @patch("vc_commit_helper.vcs.git_client.subprocess.run")
+    def test_get_current_branch_from_head_file(self, mock_run):
+        """Test that the branch is read from .git/HEAD without running git."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / ".git").mkdir()
+            client = GitClient(root)
+            with patch.dict(os.environ):
+                os.environ.pop("GIT_DIR", None)
+                (root / ".git" / "HEAD").write_text("ref: refs/heads/feature/x\n")
+                self.assertEqual(client.get_current_branch(), "feature/x")
+                (root / ".git" / "HEAD").write_text("0123456789abcdef0123456789abcdef01234567\n")
+                self.assertEqual(client.get_current_branch(), "HEAD")
+        mock_run.assert_not_called()
+
+    @patch("vc_commit_helper.vcs.git_client.subprocess.run")
+    def test_get_current_branch_git_dir_env_runs_git(self, mock_run):
+        """Test that git is used when GIT_DIR points elsewhere."""
+        mock_run.return_value = Mock(returncode=0, stdout="main\n", stderr="")
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / ".git").mkdir()
+            (root / ".git" / "HEAD").write_text("ref: refs/heads/other\n")
+            with patch.dict(os.environ, {"GIT_DIR": "/elsewhere/.git"}):
+                self.assertEqual(GitClient(root).get_current_branch(), "main")
+        mock_run.assert_called_once()
+
     @patch("vc_commit_helper.vcs.git_client.subprocess.run")
     def test_branch_exists_true(self, mock_run):
         """Test checking if branch exists (true case)."""
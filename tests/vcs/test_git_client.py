@@ -1,9 +1,12 @@
+import io
+import tempfile
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from vc_commit_helper.vcs.git_client import FileChange, GitClient
+from vc_commit_helper.vcs._util import MAX_PATHS_PER_COMMAND
+from vc_commit_helper.vcs.git_client import FileChange, GitClient, GitError
 
 
 class DummyProc(SimpleNamespace):
@@ -14,17 +17,18 @@ class DummyProc(SimpleNamespace):
 
 class TestGitClient(unittest.TestCase):
     def test_get_changes_parses_status(self) -> None:
-        # Simulate git status --porcelain output
+        # Simulate git status --porcelain=v1 -z output
         output = (
-            " M modified_file.py\n"
-            "A  added_file.py\n"
-            "D  deleted_file.py\n"
-            "R  renamed_old.py -> renamed_new.py\n"
-            "?? untracked.txt\n"
+            " M modified_file.py\0"
+            "A  added_file.py\0"
+            "D  deleted_file.py\0"
+            "R  renamed_new.py\0renamed_old.py\0"
+            "M  file with spaces.py\0"
+            "?? untracked.txt\0"
         )
 
-        def fake_run(self, args, check=True):
-            # Simulate 'git status --porcelain' call
+        def fake_run(self, args, check=True, capture_stdout=True):
+            # Simulate 'git status --porcelain=v1 -z' call
             if args[0] == "status":
                 return DummyProc(returncode=0, stdout=output, stderr="")
             raise AssertionError(f"Unexpected git command: {args}")
@@ -37,13 +41,34 @@ class TestGitClient(unittest.TestCase):
             self.assertIn(FileChange(path="modified_file.py", status="M"), changes)
             self.assertIn(FileChange(path="added_file.py", status="A"), changes)
             self.assertIn(FileChange(path="deleted_file.py", status="D"), changes)
-            self.assertIn(FileChange(path="renamed_old.py -> renamed_new.py", status="R"), changes)
+            self.assertIn(FileChange(path="renamed_new.py", status="R"), changes)
+            self.assertIn(FileChange(path="file with spaces.py", status="M"), changes)
+            self.assertTrue(all(ch.path != "renamed_old.py" for ch in changes))
             self.assertTrue(all(ch.path != "untracked.txt" for ch in changes))
 
+    def test_get_changes_uses_first_status_column_set(self) -> None:
+        output = "MM both.py\0 D gone.py\0RM moved.py\0old.py\0UU conflict.py\0!! ignored.log\0"
+
+        def fake_run(self, args, check=True, capture_stdout=True):
+            return DummyProc(returncode=0, stdout=output, stderr="")
+
+        with patch.object(GitClient, "_run", autospec=True) as mock_run:
+            mock_run.side_effect = fake_run
+            changes = GitClient(Path("/repo")).get_changes()
+        self.assertEqual(
+            changes,
+            [
+                FileChange(path="both.py", status="M"),
+                FileChange(path="gone.py", status="D"),
+                FileChange(path="moved.py", status="R"),
+                FileChange(path="conflict.py", status="U"),
+            ],
+        )
+
     def test_stage_files_calls_correct_commands(self) -> None:
         calls = []
 
-        def fake_run(self, args, check=True):
+        def fake_run(self, args, check=True, capture_stdout=True):
             calls.append(args)
             return DummyProc(returncode=0, stdout="", stderr="")
 
@@ -59,6 +84,77 @@ class TestGitClient(unittest.TestCase):
         self.assertIn(["add", "--", "file_exists.py"], calls)
         self.assertIn(["rm", "--", "file_deleted.py"], calls)
 
+    def test_stage_files_batches_commands(self) -> None:
+        calls = []
+
+        def fake_run(self, args, check=True, capture_stdout=True):
+            calls.append(args)
+            return DummyProc(returncode=0, stdout="", stderr="")
+
+        with patch.object(GitClient, "_run", autospec=True) as mock_run:
+            mock_run.side_effect = fake_run
+            client = GitClient(Path("/tmp/repo"))
+            with patch("pathlib.Path.exists", lambda self: not self.name.startswith("gone")):
+                client.stage_files(["a.py", "gone1.py", "b.py", "gone2.py"])
+        self.assertEqual(calls, [["add", "--", "a.py", "b.py"], ["rm", "--", "gone1.py", "gone2.py"]])
+
+    def test_stage_files_splits_large_batches(self) -> None:
+        calls = []
+
+        def fake_run(self, args, check=True, capture_stdout=True):
+            calls.append(args)
+            return DummyProc(returncode=0, stdout="", stderr="")
+
+        files = [f"file{i}.py" for i in range(MAX_PATHS_PER_COMMAND + 1)]
+        with patch.object(GitClient, "_run", autospec=True) as mock_run:
+            mock_run.side_effect = fake_run
+            client = GitClient(Path("/tmp/repo"))
+            with patch("pathlib.Path.exists", lambda self: True):
+                client.stage_files(files)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0], ["add", "--"] + files[:MAX_PATHS_PER_COMMAND])
+        self.assertEqual(calls[1], ["add", "--"] + files[MAX_PATHS_PER_COMMAND:])
+
+    def test_find_repo_root_is_memoized(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / ".git").mkdir()
+            nested = root / "src" / "pkg"
+            nested.mkdir(parents=True)
+            self.assertEqual(GitClient.find_repo_root(nested), root.resolve())
+            with patch("pathlib.Path.exists") as mock_exists:
+                self.assertEqual(GitClient.find_repo_root(nested), root.resolve())
+            mock_exists.assert_not_called()
+
+    def _fake_popen(self, stdout: str, stderr: str = "", returncode: int = 0) -> Mock:
+        proc = Mock()
+        proc.stdout = io.StringIO(stdout)
+        proc.stderr = io.StringIO(stderr)
+        proc.wait.return_value = returncode
+        return proc
+
+    def test_iter_diff_lines_streams_output(self) -> None:
+        proc = self._fake_popen("diff --git a/a.py b/a.py\n+added\n-removed\n")
+        with patch("subprocess.Popen", return_value=proc) as mock_popen:
+            lines = list(GitClient(Path("/tmp/repo")).iter_diff_lines("a.py"))
+        self.assertEqual(lines, ["diff --git a/a.py b/a.py", "+added", "-removed"])
+        self.assertEqual(mock_popen.call_args[0][0], ["git", "diff", "--no-renames", "HEAD", "--", "a.py"])
+        proc.terminate.assert_not_called()
+
+    def test_iter_diff_lines_terminates_when_closed_early(self) -> None:
+        proc = self._fake_popen("+one\n+two\n+three\n", returncode=-15)
+        with patch("subprocess.Popen", return_value=proc):
+            lines = GitClient(Path("/tmp/repo")).iter_diff_lines("a.py")
+            self.assertEqual(next(lines), "+one")
+            lines.close()
+        proc.terminate.assert_called_once()
+
+    def test_iter_diff_lines_raises_on_failure(self) -> None:
+        proc = self._fake_popen("", stderr="fatal: bad revision 'HEAD'\n", returncode=128)
+        with patch("subprocess.Popen", return_value=proc):
+            with self.assertRaises(GitError):
+                list(GitClient(Path("/tmp/repo")).iter_diff_lines("a.py"))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
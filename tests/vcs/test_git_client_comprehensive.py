@@ -1,11 +1,13 @@
 """Comprehensive tests for Git client to improve coverage."""
 
+import shutil
 import subprocess
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-from vc_commit_helper.vcs.git_client import GitClient, GitError, FileChange
+from vc_commit_helper.vcs.git_client import GitClient, GitError, FileChange, _diff_header_path
 
 
 class TestGitClientComprehensive(unittest.TestCase):
@@ -13,7 +15,8 @@ class TestGitClientComprehensive(unittest.TestCase):
 
     def test_find_repo_root_at_filesystem_root(self):
         """Test find_repo_root when reaching filesystem root."""
-        with patch("pathlib.Path.resolve") as mock_resolve:
+        with patch("pathlib.Path.resolve") as mock_resolve, \
+                patch("vc_commit_helper.vcs.detection.os.scandir", side_effect=OSError):
             # Simulate reaching filesystem root
             mock_path = MagicMock()
             mock_path.parent = mock_path  # Parent equals self at root
@@ -28,7 +31,7 @@ class TestGitClientComprehensive(unittest.TestCase):
         """Test get_changes with renamed files."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "R  old.py -> new.py\n"
+        mock_result.stdout = "R  new.py\0old.py\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -37,13 +40,14 @@ class TestGitClientComprehensive(unittest.TestCase):
         
         self.assertEqual(len(changes), 1)
         self.assertEqual(changes[0].status, "R")
+        self.assertEqual(changes[0].path, "new.py")
 
     @patch("subprocess.run")
     def test_get_changes_with_added_files(self, mock_run):
         """Test get_changes with added files."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "A  new_file.py\n"
+        mock_result.stdout = "A  new_file.py\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -58,7 +62,7 @@ class TestGitClientComprehensive(unittest.TestCase):
         """Test get_changes with deleted files."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "D  deleted.py\n"
+        mock_result.stdout = "D  deleted.py\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -113,4 +117,132 @@ class TestGitClientComprehensive(unittest.TestCase):
         client = GitClient(Path("/repo"))
         result = client._run(["status"], check=False)
         
-        self.assertEqual(result.returncode, 1)
\ No newline at end of file
+        self.assertEqual(result.returncode, 1)
+
+    @patch("subprocess.run")
+    def test_get_diffs_splits_combined_output(self, mock_run):
+        """Test get_diffs runs one git diff and splits it per file."""
+        diff_a = "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-x\n+y\n"
+        diff_b = "diff --git a/b c.py b/b c.py\n--- a/b c.py\n+++ b/b c.py\n@@ -1 +1 @@\n-1\n+2\n"
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = diff_a + diff_b
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        client = GitClient(Path("/repo"))
+        diffs = client.get_diffs(["a.py", "b c.py", "unchanged.py"])
+
+        self.assertEqual(diffs, {"a.py": diff_a, "b c.py": diff_b, "unchanged.py": ""})
+        self.assertEqual(mock_run.call_count, 1)
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[-4:], ["--", "a.py", "b c.py", "unchanged.py"])
+
+    @patch("subprocess.run")
+    def test_get_diffs_empty_paths(self, mock_run):
+        """Test get_diffs does not invoke git without paths."""
+        client = GitClient(Path("/repo"))
+        self.assertEqual(client.get_diffs([]), {})
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_get_changes_with_diffs_parses_raw_patch(self, mock_run):
+        """Test get_changes_with_diffs parses statuses and diffs from one call."""
+        diff_a = "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n-x\n+y\n"
+        diff_b = "diff --git a/b.py b/b.py\ndeleted file mode 100644\n--- a/b.py\n+++ /dev/null\n@@ -1 +0,0 @@\n-1\n"
+        raw = (
+            ":100644 100644 1111111 0000000 M\0a.py\0"
+            ":100644 000000 2222222 0000000 D\0b.py\0"
+            ":000000 100644 0000000 3333333 A\0new file.txt\0"
+        )
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = raw + "\0" + diff_a + diff_b
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        client = GitClient(Path("/repo"))
+        changes, diffs = client.get_changes_with_diffs()
+
+        self.assertEqual(
+            changes,
+            [
+                FileChange(path="a.py", status="M"),
+                FileChange(path="b.py", status="D"),
+                FileChange(path="new file.txt", status="A"),
+            ],
+        )
+        self.assertEqual(diffs, {"a.py": diff_a, "b.py": diff_b, "new file.txt": ""})
+        self.assertEqual(mock_run.call_count, 1)
+
+        # Later diff lookups reuse the parsed output until a commit
+        self.assertEqual(client.get_diffs(["a.py", "b.py"]), {"a.py": diff_a, "b.py": diff_b})
+        self.assertEqual(client.get_diff("a.py"), diff_a)
+        self.assertEqual(mock_run.call_count, 1)
+        client.commit("[feat]: change")
+        client.get_diff("a.py")
+        self.assertEqual(mock_run.call_count, 3)
+
+    def test_get_changes_with_diffs_without_head(self):
+        """Test get_changes_with_diffs falls back to git status without HEAD."""
+        client = GitClient(Path("/repo"))
+        with patch.object(client, "_run", side_effect=GitError("ambiguous argument 'HEAD'")):
+            with patch.object(client, "get_changes", return_value=[FileChange(path="a.py", status="A")]):
+                changes, diffs = client.get_changes_with_diffs()
+        self.assertEqual(changes, [FileChange(path="a.py", status="A")])
+        self.assertEqual(diffs, {"a.py": ""})
+
+
+class TestGitDiffHeaders(unittest.TestCase):
+    """Tests for matching diff blocks to paths git may quote."""
+
+    def test_diff_header_path(self):
+        """Test that plain and quoted diff headers yield the file path."""
+        self.assertEqual(_diff_header_path("diff --git a/a.py b/a.py"), "a.py")
+        self.assertEqual(_diff_header_path("diff --git a/b c.py b/b c.py"), "b c.py")
+        self.assertEqual(_diff_header_path("diff --git a/x b/y b/x b/y"), "x b/y")
+        self.assertEqual(
+            _diff_header_path('diff --git "a/caf\\303\\251.py" "b/caf\\303\\251.py"'), "caf\u00e9.py"
+        )
+        self.assertEqual(_diff_header_path('diff --git "a/q\\"t\\tx.py" "b/q\\"t\\tx.py"'), 'q"t\tx.py')
+        self.assertIsNone(_diff_header_path("diff --git a/x.py b/y.py"))
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class TestGitClientQuotedPaths(unittest.TestCase):
+    """Regression tests against a real repository with quoted file names."""
+
+    PATHS = ["caf\u00e9.py", "with space.py", 'with"quote.py']
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=self.root, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test")
+        for path in self.PATHS:
+            (self.root / path).write_text("old\n", encoding="utf-8")
+        git("add", "--", *self.PATHS)
+        git("commit", "-q", "-m", "initial")
+        for path in self.PATHS:
+            (self.root / path).write_text("new\n", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_get_changes_with_diffs_quoted_paths(self):
+        """Test that files with quoted names get their diffs."""
+        changes, diffs = GitClient(self.root).get_changes_with_diffs()
+        self.assertEqual(sorted(change.path for change in changes), sorted(self.PATHS))
+        for path in self.PATHS:
+            self.assertIn("+new", diffs[path], path)
+
+    def test_get_diffs_quoted_paths(self):
+        """Test that get_diffs returns the diffs of files with quoted names."""
+        diffs = GitClient(self.root).get_diffs(self.PATHS)
+        for path in self.PATHS:
+            self.assertIn("+new", diffs[path], path)
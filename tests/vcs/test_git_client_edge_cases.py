@@ -1,5 +1,6 @@
 """Edge case tests for Git client."""
 
+import subprocess
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -15,7 +16,7 @@ class TestGitClientEdgeCases(unittest.TestCase):
         """Test get_changes with empty lines in output."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "\n\nM  file.py\n\n"
+        mock_result.stdout = "\0\0M  file.py\0\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -52,4 +53,31 @@ class TestGitClientEdgeCases(unittest.TestCase):
         
         with self.assertRaises(GitError) as ctx:
             client._run(["status"], check=True)
-        self.assertIn("error message", str(ctx.exception))
\ No newline at end of file
+        self.assertIn("error message", str(ctx.exception))
+
+    @patch("subprocess.run")
+    def test_run_without_capturing_stdout(self, mock_run):
+        """Test _run discards stdout and still reports stderr on failure."""
+        mock_result = Mock()
+        mock_result.returncode = 1
+        mock_result.stdout = None
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        client = GitClient(Path("/repo"))
+
+        with self.assertRaises(GitError):
+            client._run(["push"], check=True, capture_stdout=False)
+        self.assertIs(mock_run.call_args[1]["stdout"], subprocess.DEVNULL)
+
+    @patch("subprocess.run")
+    def test_run_decodes_output_as_utf8(self, mock_run):
+        """Test _run decodes with an explicit codec instead of the locale."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        GitClient(Path("/repo"))._run(["status"])
+
+        kwargs = mock_run.call_args[1]
+        self.assertEqual(kwargs["encoding"], "utf-8")
+        self.assertEqual(kwargs["errors"], "replace")
+        self.assertNotIn("text", kwargs)
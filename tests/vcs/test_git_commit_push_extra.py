@@ -1,7 +1,7 @@
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from vc_commit_helper.vcs.git_client import GitClient
 
@@ -18,7 +18,7 @@ class TestGitClientCommitPush(unittest.TestCase):
     def test_commit_and_push_calls_correct_commands(self) -> None:
         calls = []
 
-        def fake_run(self, args, check=True):
+        def fake_run(self, args, check=True, capture_stdout=True):
             calls.append(args)
             return DummyProc(returncode=0, stdout="", stderr="")
 
@@ -33,6 +33,14 @@ class TestGitClientCommitPush(unittest.TestCase):
         self.assertIn(["commit", "-m", "message"], calls)
         self.assertIn(["push"], calls)
 
+    def test_commit_discards_stdout(self) -> None:
+        with patch.object(GitClient, "_run", autospec=True) as mock_run:
+            mock_run.return_value = DummyProc(returncode=0, stdout=None, stderr="")
+            GitClient(Path("/repo")).commit("message")
+        mock_run.assert_called_once_with(
+            ANY, ["commit", "-m", "message"], check=True, capture_stdout=False
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
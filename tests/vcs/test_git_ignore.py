@@ -15,7 +15,7 @@ class TestGitIgnore(unittest.TestCase):
         """Test that untracked files (??) are excluded."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "M  tracked.py\n?? untracked.py\n"
+        mock_result.stdout = "M  tracked.py\0?? untracked.py\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -32,7 +32,7 @@ class TestGitIgnore(unittest.TestCase):
         """Test that staged files are included."""
         mock_result = Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "A  new_file.py\nM  modified.py\n"
+        mock_result.stdout = "A  new_file.py\0M  modified.py\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -51,7 +51,7 @@ class TestGitIgnore(unittest.TestCase):
         mock_result = Mock()
         mock_result.returncode = 0
         # Only tracked changes are shown, ignored files don't appear
-        mock_result.stdout = "M  src/main.py\nA  src/new.py\n"
+        mock_result.stdout = "M  src/main.py\0A  src/new.py\0"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
         
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -55,6 +56,23 @@ class TestSVNClient(unittest.TestCase):
             client.commit("message", ["file1.txt", "file2.txt"])
             self.assertIn(["commit", "-m", "message", "--", "file1.txt", "file2.txt"], calls)
 
+    def test_stage_files_batches_commands(self) -> None:
+        calls = []
+
+        def fake_run(self, args, check=True):
+            calls.append(args)
+            return DummyProc(returncode=0, stdout="", stderr="")
+
+        with patch.object(SVNClient, "_run", autospec=True) as mock_run:
+            mock_run.side_effect = fake_run
+            client = SVNClient(Path("/repo"))
+            statuses = {"a.txt": "A", "b.txt": "A", "c.txt": "D", "d.txt": "D"}
+            client.stage_files(["a.txt", "c.txt", "m.txt", "b.txt", "d.txt"], statuses=statuses)
+        self.assertEqual(
+            calls,
+            [["add", "--force", "--", "a.txt", "b.txt"], ["delete", "--", "c.txt", "d.txt"]],
+        )
+
     def test_commit_with_empty_files_list_raises_error(self) -> None:
         """Test that commit raises SVNError when files list is empty."""
         client = SVNClient(Path("/repo"))
@@ -129,6 +147,17 @@ class TestSVNClient(unittest.TestCase):
             # Verify that --force flag was used
             self.assertIn(["add", "--force", "--", "already_versioned.txt"], calls)
 
+    def test_find_repo_root_is_memoized(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / ".svn").mkdir()
+            nested = root / "src" / "pkg"
+            nested.mkdir(parents=True)
+            self.assertEqual(SVNClient.find_repo_root(nested), root.resolve())
+            with patch("pathlib.Path.exists") as mock_exists:
+                self.assertEqual(SVNClient.find_repo_root(nested), root.resolve())
+            mock_exists.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
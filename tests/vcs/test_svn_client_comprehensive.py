@@ -13,7 +13,8 @@ class TestSVNClientComprehensive(unittest.TestCase):
 
     def test_find_repo_root_at_filesystem_root(self):
         """Test find_repo_root when reaching filesystem root."""
-        with patch("pathlib.Path.resolve") as mock_resolve:
+        with patch("pathlib.Path.resolve") as mock_resolve, \
+                patch("vc_commit_helper.vcs.detection.os.scandir", side_effect=OSError):
             # Simulate reaching filesystem root
             mock_path = MagicMock()
             mock_path.parent = mock_path  # Parent equals self at root
@@ -127,4 +128,35 @@ class TestSVNClientComprehensive(unittest.TestCase):
         client = SVNClient(Path("/repo"))
         result = client._run(["status"], check=False)
         
-        self.assertEqual(result.returncode, 1)
\ No newline at end of file
+        self.assertEqual(result.returncode, 1)
+
+    @patch("subprocess.run")
+    def test_get_diffs_splits_combined_output(self, mock_run):
+        """Test get_diffs runs one svn diff and splits it per file."""
+        sep = "=" * 67
+        diff_a = f"Index: a.py\n{sep}\n--- a.py\t(revision 1)\n+++ a.py\t(working copy)\n@@ -1 +1 @@\n-x\n+y\n"
+        diff_b = f"Index: b.py\n{sep}\n--- b.py\t(revision 1)\n+++ b.py\t(working copy)\n@@ -1 +1 @@\n-1\n+2\n"
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = diff_a + diff_b
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        client = SVNClient(Path("/repo"))
+        diffs = client.get_diffs(["a.py", "b.py", "unchanged.py"])
+
+        self.assertEqual(diffs, {"a.py": diff_a, "b.py": diff_b, "unchanged.py": ""})
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_get_changes_with_diffs_reuses_diffs(self):
+        """Test get_diff serves paths from the last get_changes_with_diffs call."""
+        client = SVNClient(Path("/repo"))
+        with patch.object(client, "get_changes", return_value=[FileChange(path="a.py", status="M")]):
+            result = Mock(returncode=0, stdout="Index: a.py\n+y\n", stderr="")
+            with patch.object(client, "_run", return_value=result) as mock_run:
+                changes, diffs = client.get_changes_with_diffs()
+                self.assertEqual(client.get_diff("a.py"), diffs["a.py"])
+                self.assertEqual(mock_run.call_count, 1)
+                client.commit("[fix]: y", ["a.py"])
+                client.get_diff("a.py")
+                self.assertEqual(mock_run.call_count, 3)